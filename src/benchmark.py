@@ -0,0 +1,376 @@
+import argparse
+import glob
+import json
+import os
+import time
+from dataclasses import dataclass
+from typing import Union
+
+import numpy as np
+
+from src.configuration import Configuration
+from src.configuration.defaults import *
+from src.exception import FunctionENOMEM
+from src.exploration import SimulatedExplorer, SimulatedExplorer2D, SimulatedFunction
+from src.logger import logger
+from src.objective import *
+from src.recommendation import *
+from src.sampling import *
+
+# Name of the recorded durations' files, next to the benchmark apps' configuration files.
+RECORDED_DURATIONS_FILE = "durations.json"
+
+
+@dataclass
+class BenchmarkResult:
+    """Outcome of tuning a simulated function.
+
+    Attributes:
+        function_name (str): The simulated function's name.
+        recommender (str): The recommender's name.
+        sample_count (int): The number of datapoints sampled until convergence.
+        exploration_cost (float): The price of all the invocations in USD.
+        wall_time_ms (float): The simulated wall time of the exploration in ms.
+        run_time_s (float): The time the tuning algorithm actually ran for in s.
+        recommended_config (int or tuple): The recommended configuration.
+        optimal_config (int or tuple): The configuration minimizing the true cost.
+        regret (float): The true cost of the recommended configuration relative to the optimal one, minus 1.
+        error (str): The error that interrupted the tuning, None on success.
+    """
+
+    function_name: str
+    recommender: str
+    sample_count: int = 0
+    exploration_cost: float = 0.0
+    wall_time_ms: float = 0.0
+    run_time_s: float = 0.0
+    recommended_config: Union[int, tuple] = None
+    optimal_config: Union[int, tuple] = None
+    regret: float = np.nan
+    error: str = None
+
+
+def synthetic_functions(count: int, random_seed: int = None, cpu_configurable: bool = False) -> list:
+    """Generates @count simulated functions with diverse compute-bound and IO-bound profiles.
+
+    A function's warm duration is io_ms + cpu_ms / vcpus, where vcpus is the vCPU share of its configuration, capped by
+    the number of cores the function can use. On AWS Lambda, the vCPU share is proportional to the memory size, with a
+    full vCPU at 1769 MB.
+    """
+    rng = np.random.default_rng(random_seed)
+    functions = []
+    for i in range(count):
+        io_ms = rng.uniform(10, 500)
+        cpu_ms = rng.uniform(50, 5000)
+        cores = rng.choice([1, 2, 4])
+
+        if cpu_configurable:
+            def duration_function(config, io_ms=io_ms, cpu_ms=cpu_ms, cores=cores):
+                return io_ms + cpu_ms / min(config[0], cores)
+        else:
+            def duration_function(memory_mb, io_ms=io_ms, cpu_ms=cpu_ms, cores=cores):
+                return io_ms + cpu_ms / min(memory_mb / 1769, cores)
+
+        functions.append(SimulatedFunction(
+            name=f"synthetic-{i}",
+            duration_function=duration_function,
+            noise_cv=rng.uniform(0.02, 0.15),
+            cold_start_ms=rng.uniform(100, 1500),
+            memory_used_mb=int(rng.choice([64, 64, 200, 400])),
+            cpu_configurable=cpu_configurable,
+            random_seed=int(rng.integers(2 ** 32)),
+        ))
+    return functions
+
+
+def load_recorded_function(path: str, noise_cv: float = 0, random_seed: int = None) -> SimulatedFunction:
+    """Loads a simulated function replaying the durations recorded in the file @path."""
+    with open(path) as file:
+        record = json.load(file)
+
+    recorded_durations = {
+        (entry["cpu"], entry["memory_mb"]) if entry.get("cpu") is not None else entry["memory_mb"]: entry["durations_ms"]
+        for entry in record["durations"]
+    }
+    return SimulatedFunction(
+        name=record["function_name"],
+        recorded_durations=recorded_durations,
+        noise_cv=noise_cv,
+        cold_start_ms=record.get("cold_start_ms", 0),
+        memory_used_mb=record.get("memory_used_mb", 0),
+        random_seed=random_seed,
+    )
+
+
+def recorded_functions(root: str = "benchmarks", random_seed: int = None) -> list:
+    """Loads the simulated functions of all the recorded durations' files under the directory @root."""
+    paths = sorted(glob.glob(os.path.join(root, "**", RECORDED_DURATIONS_FILE), recursive=True))
+    return [load_recorded_function(path, random_seed=random_seed) for path in paths]
+
+
+def record_function(config_path: str, nbr_invocations: int = 10, memory_step_mb: int = 128) -> str:
+    """Records the durations of a deployed function over its configuration space, to be replayed by the benchmarks.
+
+    Args:
+        config_path (str): Path to the function's configuration file.
+        nbr_invocations (int): The number of invocations per configuration.
+        memory_step_mb (int): The increment between the recorded memory sizes, for functions configured by memory only.
+
+    Returns:
+        str: The path of the recorded durations' file, written next to the configuration file.
+    """
+    from src.parrotfish import Parrotfish
+
+    with open(config_path) as config_file:
+        config = Configuration(config_file)
+    parrotfish = Parrotfish(config)
+    explorer = parrotfish.explorer
+    explorer.payload = config.payloads[0]["payload"]
+
+    if config.vendor == "GCPv2":
+        configs = [(float(cpu), int(memory)) for cpu, memory in explorer.cpu_mem_space]
+    else:
+        memories = np.sort(explorer.memory_space)
+        configs = [int(memory) for memory in memories[::memory_step_mb]]
+
+    entries = []
+    memory_used_mb = 0
+    for config_value in configs:
+        try:
+            if isinstance(config_value, tuple):
+                durations = explorer.explore_parallel(nbr_invocations, nbr_invocations, *config_value)
+            else:
+                durations = explorer.explore_parallel(nbr_invocations, nbr_invocations, config_value)
+
+        except FunctionENOMEM as e:
+            durations = [e.duration_ms]
+            memory_used_mb = max(memory_used_mb, config_value[1] if isinstance(config_value, tuple) else config_value)
+
+        cpu, memory_mb = config_value if isinstance(config_value, tuple) else (None, config_value)
+        entries.append({"cpu": cpu, "memory_mb": memory_mb, "durations_ms": [float(d) for d in durations]})
+    explorer.config_manager.reset_config()
+
+    path = os.path.join(os.path.dirname(config_path), RECORDED_DURATIONS_FILE)
+    with open(path, "w") as file:
+        json.dump({
+            "function_name": config.function_name,
+            "vendor": config.vendor,
+            # The failing configurations had less memory than the function needs.
+            "memory_used_mb": memory_used_mb + 1 if memory_used_mb else 0,
+            "durations": entries,
+        }, file, indent=4)
+
+    logger.info(f"Recorded {len(entries)} configurations of {config.function_name} in {path}")
+    return path
+
+
+def run_benchmark(
+    functions: list,
+    recommender: str = RECOMMENDER,
+    min_sample_per_config: int = MIN_SAMPLE_PER_CONFIG,
+    max_total_sample_count: int = MAX_TOTAL_SAMPLE_COUNT,
+    termination_threshold: float = TERMINATION_THRESHOLD,
+    dynamic_sampling_params: dict = None,
+) -> list:
+    """Tunes each of the simulated functions @functions and measures how well the tuning went.
+
+    Args:
+        functions (list): The simulated functions to tune.
+        recommender (str): The recommender tuning the functions configured by memory only, "knowledge" or "bayesian".
+            The functions configured by vCPU and memory are tuned by the Recommender2D.
+        min_sample_per_config (int): The minimum number of invocations per configuration.
+        max_total_sample_count (int): The maximum number of datapoints to sample.
+        termination_threshold (float): The objective's termination threshold.
+        dynamic_sampling_params (dict, optional): The dynamic sampling parameters.
+
+    Returns:
+        list: The benchmark result of each function.
+    """
+    dynamic_sampling_params = {**DYNAMIC_SAMPLING_PARAMS, **(dynamic_sampling_params or {})}
+
+    results = []
+    for function in functions:
+        result = BenchmarkResult(
+            function_name=function.name, recommender="2d" if function.cpu_configurable else recommender
+        )
+        if function.cpu_configurable:
+            explorer = SimulatedExplorer2D(function)
+            space = [(float(cpu), int(memory)) for cpu, memory in explorer.cpu_mem_space]
+        else:
+            explorer = SimulatedExplorer(function)
+            space = [int(memory) for memory in explorer.memory_space]
+
+        first_invocation = len(function.invocations)
+        start_elapsed_ms = function.elapsed_ms
+        start_time = time.perf_counter()
+        try:
+            if function.cpu_configurable:
+                result.sample_count, result.recommended_config = _tune_2d(
+                    explorer, min_sample_per_config, max_total_sample_count, termination_threshold,
+                    dynamic_sampling_params,
+                )
+            else:
+                result.sample_count, result.recommended_config = _tune(
+                    explorer, recommender, min_sample_per_config, max_total_sample_count, termination_threshold,
+                    dynamic_sampling_params,
+                )
+
+        except Exception as e:
+            logger.error(f"Error tuning simulated function {function.name}: {e}")
+            result.error = str(e) or type(e).__name__
+
+        else:
+            true_costs = _true_costs(function, explorer.price_calculator, space)
+            optimal_index = int(np.argmin(true_costs))
+            result.optimal_config = space[optimal_index]
+            result.regret = float(true_costs[space.index(result.recommended_config)] / true_costs[optimal_index] - 1)
+
+        result.run_time_s = time.perf_counter() - start_time
+        result.wall_time_ms = function.elapsed_ms - start_elapsed_ms
+        invocations = function.invocations[first_invocation:]
+        if invocations:
+            memories, cpus, durations = (np.array(values) for values in zip(*invocations))
+            result.exploration_cost = float(np.sum(explorer.price_calculator.calculate_price(
+                memories, durations, cpus.astype(float) if function.cpu_configurable else None
+            )))
+        results.append(result)
+
+    return results
+
+
+def summarize(results: list) -> dict:
+    """Aggregates the benchmark results of each recommender.
+
+    Returns:
+        dict: The number of runs and failures, the mean sample count, exploration cost and wall time, and the median
+            and 90th percentile of the regret, of each recommender.
+    """
+    summary = {}
+    for recommender in dict.fromkeys(result.recommender for result in results):
+        runs = [result for result in results if result.recommender == recommender]
+        succeeded = [result for result in runs if result.error is None]
+        regrets = np.array([result.regret for result in succeeded], dtype=float)
+        summary[recommender] = {
+            "runs": len(runs),
+            "failures": len(runs) - len(succeeded),
+            "mean_sample_count": float(np.mean([result.sample_count for result in succeeded])) if succeeded else np.nan,
+            "mean_exploration_cost": float(np.mean([result.exploration_cost for result in runs])),
+            "mean_wall_time_s": float(np.mean([result.wall_time_ms for result in runs])) / 1000,
+            "median_regret": float(np.median(regrets)) if succeeded else np.nan,
+            "p90_regret": float(np.percentile(regrets, 90)) if succeeded else np.nan,
+        }
+    return summary
+
+
+def _true_costs(function: SimulatedFunction, price_calculator: any, space: list) -> np.ndarray:
+    """The cost of a warm invocation with median duration, for each configuration of @space."""
+    durations = function.median_durations(space)
+    if function.cpu_configurable:
+        cpus, memories = (np.array(values) for values in zip(*space))
+        return price_calculator.calculate_price(memories, durations, cpus)
+    return price_calculator.calculate_price(np.array(space), durations)
+
+
+def _tune(
+    explorer: SimulatedExplorer, recommender: str, min_sample_per_config: int, max_total_sample_count: int,
+    termination_threshold: float, dynamic_sampling_params: dict,
+) -> tuple[int, int]:
+    """Tunes the memory size of the explorer's function.
+
+    Returns:
+        tuple[int, int]: The number of sampled datapoints, and the recommended memory size in MB.
+    """
+    param_function = ParametricFunction()
+    objective = Objective(
+        param_function=param_function,
+        memory_space=explorer.memory_space,
+        termination_threshold=termination_threshold,
+    )
+    sampler = Sampler(
+        explorer=explorer,
+        explorations_count=min_sample_per_config,
+        dynamic_sampling_params=dynamic_sampling_params,
+    )
+    if recommender == "bayesian":
+        BayesianRecommender(
+            objective=objective,
+            sampler=sampler,
+            max_total_sample_count=max_total_sample_count,
+            nbr_bootstrap_samples=BAYESIAN_PARAMS["nbr_bootstrap_samples"],
+            expected_improvement_threshold=BAYESIAN_PARAMS["expected_improvement_threshold"],
+        ).run()
+    else:
+        Recommender(
+            objective=objective,
+            sampler=sampler,
+            max_total_sample_count=max_total_sample_count,
+        ).run()
+
+    return len(sampler.sample), int(param_function.minimize(sampler.memory_space))
+
+
+def _tune_2d(
+    explorer: SimulatedExplorer2D, min_sample_per_config: int, max_total_sample_count: int,
+    termination_threshold: float, dynamic_sampling_params: dict,
+) -> tuple[int, tuple]:
+    """Tunes the vCPU and memory sizes of the explorer's function.
+
+    Returns:
+        tuple[int, tuple]: The number of sampled datapoints, and the recommended (vCPU, memory size in MB).
+    """
+    cpu_mem_duration_function = CpuMemDurationFunction()
+    objective = Objective2D(
+        cpu_mem_duration_function=cpu_mem_duration_function,
+        cpu_memory_space=explorer.cpu_mem_space,
+        termination_threshold=termination_threshold,
+    )
+    sampler = Sampler2D(
+        explorer=explorer,
+        explorations_count=min_sample_per_config,
+        dynamic_sampling_params=dynamic_sampling_params,
+    )
+    Recommender2D(
+        objective=objective,
+        sampler=sampler,
+        max_total_sample_count=max_total_sample_count,
+    ).run()
+
+    cpu, memory_mb = cpu_mem_duration_function.minimize(sampler.cpu_mem_space)
+    return len(sampler.sample), (float(cpu), int(memory_mb))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the tuning algorithms on simulated functions")
+    parser.add_argument(
+        "--synthetic", type=int, default=50, help="Number of synthetic functions of each configuration space"
+    )
+    parser.add_argument(
+        "--recorded", type=str, default="benchmarks", help="Directory of the recorded durations to replay"
+    )
+    parser.add_argument(
+        "--recommender", nargs="+", default=["knowledge", "bayesian"], help="Recommenders to benchmark"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed of the simulations")
+    parser.add_argument(
+        "--record", type=str, nargs="+", metavar="CONFIG", help="Record the durations of the configured functions"
+    )
+    args = parser.parse_args()
+
+    if args.record:
+        for config_path in args.record:
+            print(f"Recorded {record_function(config_path)}")
+        return
+
+    results = []
+    for recommender in args.recommender:
+        # Every recommender tunes the same functions, simulated with the same random draws.
+        functions = synthetic_functions(args.synthetic, args.seed) + recorded_functions(args.recorded, args.seed)
+        results += run_benchmark(functions, recommender)
+    results += run_benchmark(synthetic_functions(args.synthetic, args.seed, cpu_configurable=True))
+
+    for recommender, stats in summarize(results).items():
+        print(f"{recommender}: " + ", ".join(f"{key} {value:.6g}" for key, value in stats.items()))
+
+
+if __name__ == "__main__":
+    main()
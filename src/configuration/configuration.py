@@ -20,6 +20,15 @@ class Configuration:
         self.constraint_cost_tolerance_percent = None
         self.memory_bounds = None
         self.cpu_bounds = None
+        self.concurrent_exploration = CONCURRENT_EXPLORATION
+        self.concurrent_payloads = CONCURRENT_PAYLOADS
+        self.id_token_authentication = ID_TOKEN_AUTHENTICATION
+        self.recommender = RECOMMENDER
+        self.bayesian_params = BAYESIAN_PARAMS
+        self.sample_store_path = None
+        self.sample_store_max_age_hours = SAMPLE_STORE_MAX_AGE_HOURS
+        self.cold_start_detection = None
+        self.cold_start_threshold = COLD_START_THRESHOLD
 
         # Parse the configuration file
         self._deserialize(config_file)
@@ -72,11 +81,28 @@ class Configuration:
                             "type": "number",
                             "minimum": 0,
                         },
+                        "confidence_interval_threshold": {"type": "number", "exclusiveMinimum": 0},
+                        "confidence_level": {"type": "number", "exclusiveMinimum": 0, "exclusiveMaximum": 1},
                     },
                 },
                 "max_number_of_invocation_attempts": {"type": "integer", "minimum": 0},
                 "constraint_execution_time_threshold": {"type": "integer", "minimum": 1},
                 "constraint_cost_tolerance_percent": {"type": "integer", "minimum": 1},
+                "concurrent_exploration": {"type": "boolean"},
+                "concurrent_payloads": {"type": "boolean"},
+                "id_token_authentication": {"type": "boolean"},
+                "recommender": {"type": "string", "enum": ["knowledge", "bayesian"]},
+                "bayesian_params": {
+                    "type": "object",
+                    "properties": {
+                        "nbr_bootstrap_samples": {"type": "integer", "minimum": 1},
+                        "expected_improvement_threshold": {"type": "number", "minimum": 0},
+                    },
+                },
+                "sample_store_path": {"type": "string"},
+                "sample_store_max_age_hours": {"type": "number", "minimum": 0},
+                "cold_start_detection": {"type": "string", "enum": ["warmup", "log", "heuristic"]},
+                "cold_start_threshold": {"type": "number", "exclusiveMinimum": 0},
             },
             "required": ["function_name", "vendor", "region"],
             "if": {"not": {"required": ["payload"]}},
@@ -86,6 +112,7 @@ class Configuration:
         }
 
     def _deserialize(self, config_file: Union[TextIO, dict]):
+        file_name = getattr(config_file, "name", "the configuration")
         try:
             if isinstance(config_file, dict):
                 j_dict = config_file
@@ -95,12 +122,12 @@ class Configuration:
 
         except json.decoder.JSONDecodeError as e:
             raise ValueError(
-                f"Please make sure to provide a valid json object in file {config_file.name}: \n{e.args[0]}"
+                f"Please make sure to provide a valid json object in file {file_name}: \n{e.args[0]}"
             )
 
         except jsonschema.exceptions.ValidationError as e:
             raise ValueError(
-                f"Please make sure to provide a valid json object in file {config_file.name}: \n{e.args[0]}"
+                f"Please make sure to provide a valid json object in file {file_name}: \n{e.args[0]}"
             )
 
         else:
@@ -110,7 +137,7 @@ class Configuration:
                 # Validate that sum of weights is 1.
                 if sum([entry["weight"] for entry in j_dict["payloads"]]) != 1:
                     raise ValueError(
-                        f"Please make sure that the weights in {config_file.name} are in [0,1] interval "
+                        f"Please make sure that the weights in {file_name} are in [0,1] interval "
                         f"and that their sum is 1"
                     )
 
@@ -119,4 +146,11 @@ class Configuration:
                 j_dict["payloads"] = [{"payload": payload_str, "weight": 1}]
                 del j_dict["payload"]
 
+            if j_dict.get("cold_start_detection") == "log" and j_dict["vendor"] != "AWS":
+                raise ValueError(
+                    f"Please make sure to only detect the cold starts from the logs of AWS functions in {file_name}"
+                )
+
             self.__dict__.update(**j_dict)
+            if self.cold_start_detection is None:
+                self.cold_start_detection = COLD_START_DETECTION[self.vendor]
@@ -3,11 +3,31 @@ import logging
 DYNAMIC_SAMPLING_PARAMS = {
     "max_sample_per_config": 8,
     "coefficient_of_variation_threshold": 0.05,
+    "confidence_interval_threshold": 0.05,
+    "confidence_level": 0.95,
 }
 MAX_NUMBER_OF_INVOCATION_ATTEMPTS = 5
 MAX_TOTAL_SAMPLE_COUNT = 20
 MIN_SAMPLE_PER_CONFIG = 4
 TERMINATION_THRESHOLD = 3
 MEMORY_SIZE_INCREMENT = 10
+EXECUTION_TIME_SOLVER = "greedy"
+CONCURRENT_EXPLORATION = False
+CONCURRENT_PAYLOADS = False
+ID_TOKEN_AUTHENTICATION = False
+RECOMMENDER = "knowledge"
+BAYESIAN_PARAMS = {
+    "nbr_bootstrap_samples": 30,
+    "expected_improvement_threshold": 0.01,
+}
+SAMPLE_STORE_MAX_AGE_HOURS = 168
+MAX_CONCURRENT_FUNCTIONS = 10
+# The step functions' payloads propagation starts with 10 invocations in flight, and adapts to throttling up to the max.
+PAYLOAD_INITIAL_CONCURRENCY = 10
+PAYLOAD_MAX_CONCURRENCY = 100
+# The vendors' logs only report the cold starts on AWS. GCP's instances serve one request at a time by default, so all
+# the invocations after a configuration update are cold and the heuristic has no warm reference.
+COLD_START_DETECTION = {"AWS": "log", "GCP": "warmup", "GCPv2": "warmup"}
+COLD_START_THRESHOLD = 0.5
 
 LOG_LEVEL = logging.WARNING
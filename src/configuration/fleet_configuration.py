@@ -0,0 +1,83 @@
+import copy
+import json
+from typing import TextIO, Union
+
+import jsonschema
+
+from src.configuration.configuration import Configuration
+from src.configuration.defaults import *
+
+
+class FleetConfiguration:
+    def __init__(self, config_file: Union[TextIO, dict]):
+        self._load_config_schema()
+
+        # Setup default values
+        self.defaults = {}
+        self.max_concurrent_functions = MAX_CONCURRENT_FUNCTIONS
+        self.rate_limits = {}
+
+        # Parse the configuration file
+        self._deserialize(config_file)
+
+    def _load_config_schema(self):
+        self._config_json_schema = {
+            "$schema": "https://json-schema.org/draft/2020-12/schema",
+            "title": "Parrotfish for Fleets Configuration Schema",
+            "description": "The fleet manifest's schema.",
+            "type": "object",
+            "properties": {
+                "functions": {
+                    "type": "array",
+                    "items": {"type": "object"},
+                    "minItems": 1,
+                },
+                "defaults": {"type": "object"},
+                "max_concurrent_functions": {"type": "integer", "minimum": 1},
+                "rate_limits": {
+                    "type": "object",
+                    "additionalProperties": {
+                        "type": "object",
+                        "properties": {
+                            "max_concurrent_invocations": {"type": "integer", "minimum": 1},
+                            "invocations_per_second": {"type": "number", "exclusiveMinimum": 0},
+                            "control_plane_requests_per_second": {"type": "number", "exclusiveMinimum": 0},
+                        },
+                        "additionalProperties": False,
+                    },
+                },
+            },
+            "required": ["functions"],
+            "additionalProperties": False,
+        }
+
+    def _deserialize(self, config_file: Union[TextIO, dict]):
+        file_name = getattr(config_file, "name", "the manifest")
+        try:
+            if isinstance(config_file, dict):
+                j_dict = config_file
+            else:
+                j_dict = json.load(config_file)
+            jsonschema.validate(instance=j_dict, schema=self._config_json_schema)
+
+        except json.decoder.JSONDecodeError as e:
+            raise ValueError(
+                f"Please make sure to provide a valid json object in file {file_name}: \n{e.args[0]}"
+            )
+
+        except jsonschema.exceptions.ValidationError as e:
+            raise ValueError(
+                f"Please make sure to provide a valid json object in file {file_name}: \n{e.args[0]}"
+            )
+
+        else:
+            defaults = j_dict.pop("defaults", {})
+            functions = []
+            for i, function in enumerate(j_dict.pop("functions")):
+                try:
+                    functions.append(Configuration(copy.deepcopy({**defaults, **function})))
+                except ValueError as e:
+                    raise ValueError(f"Function {i} of {file_name} is not valid: {e.args[0]}")
+
+            self.functions = functions
+            self.__dict__.update(**j_dict)
@@ -17,7 +17,10 @@ class StepFunctionConfiguration:
         self.min_sample_per_config = MIN_SAMPLE_PER_CONFIG
         self.max_number_of_invocation_attempts = MAX_NUMBER_OF_INVOCATION_ATTEMPTS
         self.memory_size_increment = MEMORY_SIZE_INCREMENT
+        self.execution_time_solver = EXECUTION_TIME_SOLVER
         self.constraint_execution_time_threshold = None
+        self.max_concurrent_functions = MAX_CONCURRENT_FUNCTIONS
+        self.payload_max_concurrency = PAYLOAD_MAX_CONCURRENCY
 
         # Parse the configuration file
         self._deserialize(config_file)
@@ -62,6 +65,9 @@ class StepFunctionConfiguration:
                 "max_number_of_invocation_attempts": {"type": "integer", "minimum": 0},
                 "constraint_execution_time_threshold": {"type": "integer", "minimum": 1},
                 "memory_size_increment": {"type": "integer", "minimum": 1},
+                "execution_time_solver": {"type": "string", "enum": ["greedy", "convex"]},
+                "max_concurrent_functions": {"type": "integer", "minimum": 1},
+                "payload_max_concurrency": {"type": "integer", "minimum": 1},
             },
             "required": ["arn", "region", "payload"],
             "if": {"not": {"required": ["payload"]}},
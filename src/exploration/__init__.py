@@ -3,5 +3,7 @@ from .explorer import Explorer
 from .explorer_2d import Explorer2D
 from .gcp import GCPExplorer
 from .gcp import GCPExplorer2D
+from .simulation import SimulatedExplorer, SimulatedExplorer2D, SimulatedFunction
 
-__all__ = ["Explorer", "GCPExplorer", "AWSExplorer", "Explorer2D", "GCPExplorer2D"]
+__all__ = ["Explorer", "GCPExplorer", "AWSExplorer", "Explorer2D", "GCPExplorer2D", "SimulatedExplorer",
+           "SimulatedExplorer2D", "SimulatedFunction"]
@@ -4,16 +4,23 @@ import boto3
 from botocore.exceptions import *
 
 from src.exception import *
+from src.exploration.aws.aws_invoker import AWSInvoker
+from src.exploration.aws.aws_rate_limiter import AWSRateLimiter
 from src.exploration.config_manager import ConfigManager
 from src.exploration.function_config import FunctionConfig
+from src.instrumentation import instrumentation
 from src.logger import logger
 
 
 class AWSConfigManager(ConfigManager):
-    def __init__(self, function_name: str, aws_session: boto3.Session):
+    def __init__(self, function_name: str, aws_session: boto3.Session, invoker: AWSInvoker = None):
         super().__init__(function_name)
         self._lambda_client = aws_session.client("lambda")
         self._quotas_client = aws_session.client("service-quotas")
+        self.published_versions = {}
+        # Invoker whose configuration snapshot is invalidated on every configuration update.
+        self._invoker = invoker
+        self._rate_limiter = AWSRateLimiter.for_region(aws_session.region_name)
 
     @property
     def max_timeout_quota(self) -> int:
@@ -31,9 +38,24 @@ class AWSConfigManager(ConfigManager):
 
         return int(quota["Quota"]["Value"])
 
+    @property
+    def code_hash(self) -> str:
+        try:
+            self._rate_limiter.acquire_control_plane()
+            config = self._lambda_client.get_function_configuration(
+                FunctionName=self.function_name
+            )
+        except ClientError as e:
+            logger.debug(e.args[0])
+            raise FunctionConfigError(e.args[0])
+
+        return config["CodeSha256"]
+
     def set_config(self, memory_mb: int, timeout: int = None) -> any:
         sleeping_interval = 1
+
         try:
+            self._rate_limiter.acquire_control_plane()
             config = self._lambda_client.get_function_configuration(
                 FunctionName=self.function_name
             )
@@ -44,31 +66,39 @@ class AWSConfigManager(ConfigManager):
                 )
 
             # Update the lambda function's configuration.
-            if timeout:
-                self._lambda_client.update_function_configuration(
-                    FunctionName=self.function_name,
-                    MemorySize=int(memory_mb),
-                    Timeout=timeout,
-                )
-            else:
-                self._lambda_client.update_function_configuration(
-                    FunctionName=self.function_name,
-                    MemorySize=int(memory_mb),
-                    Timeout=self.max_timeout_quota,
-                )
+            self._rate_limiter.acquire_control_plane()
+            with instrumentation.span("config_update", function=self.function_name, memory_mb=memory_mb):
+                if timeout:
+                    self._lambda_client.update_function_configuration(
+                        FunctionName=self.function_name,
+                        MemorySize=int(memory_mb),
+                        Timeout=timeout,
+                    )
+                else:
+                    self._lambda_client.update_function_configuration(
+                        FunctionName=self.function_name,
+                        MemorySize=int(memory_mb),
+                        Timeout=self.max_timeout_quota,
+                    )
 
             # Wait until configuration is propagated to all worker instances.
-            while (
-                    config["MemorySize"] != memory_mb
-                    or config["LastUpdateStatus"] == "InProgress"
-            ):
-                # Wait for the lambda function's status has changed to "UPDATED".
-                waiter = self._lambda_client.get_waiter("function_updated")
-                waiter.wait(FunctionName=self.function_name)
-
-                config = self._lambda_client.get_function_configuration(
-                    FunctionName=self.function_name
-                )
+            with instrumentation.span("config_update.wait", function=self.function_name, memory_mb=memory_mb):
+                while (
+                        config["MemorySize"] != memory_mb
+                        or config["LastUpdateStatus"] == "InProgress"
+                ):
+                    # Wait for the lambda function's status has changed to "UPDATED".
+                    waiter = self._lambda_client.get_waiter("function_updated")
+                    self._rate_limiter.acquire_control_plane()
+                    waiter.wait(
+                        FunctionName=self.function_name,
+                        WaiterConfig={"Delay": self._rate_limiter.waiter_delay(waiter.config.delay)},
+                    )
+
+                    self._rate_limiter.acquire_control_plane()
+                    config = self._lambda_client.get_function_configuration(
+                        FunctionName=self.function_name
+                    )
 
         except ParamValidationError as e:
             logger.debug(e.args[0])
@@ -80,9 +110,11 @@ class AWSConfigManager(ConfigManager):
             # Wait and retry if function configuration is being updated now
             if e.response['Error']['Code'] == 'ResourceConflictException':
                 logger.warning("Concurrent Update Function Error. Retrying ...")
+                instrumentation.increment("config_update_conflicts")
 
                 # Exponential retry interval
-                time.sleep(sleeping_interval)
+                with instrumentation.span("config_update.backoff"):
+                    time.sleep(sleeping_interval)
                 sleeping_interval *= 2
 
                 self.set_config(memory_mb, timeout)
@@ -91,4 +123,55 @@ class AWSConfigManager(ConfigManager):
                 raise FunctionConfigError(e.args[0])
 
         else:
+            # Invalidated once the update is propagated, so that the invoker can't cache the configuration before it.
+            if self._invoker is not None:
+                self._invoker.invalidate_config()
             return config
+
+    def publish_config(self, memory_mb: int) -> str:
+        """Publishes a version of the lambda function configured with the memory value @memory_mb.
+
+        Args:
+            memory_mb (int): The memory size in MB.
+
+        Returns:
+            str: The published version, to be used as the invocation's qualifier.
+
+        Raises:
+            FunctionConfigError: If updating the function's configuration or publishing the version fails.
+
+        Versions are immutable snapshots of $LATEST, so once published they can be invoked concurrently without
+        further configuration updates. Published versions are cached per memory size.
+        """
+        if memory_mb not in self.published_versions:
+            self.set_config(memory_mb)
+            try:
+                self._rate_limiter.acquire_control_plane()
+                with instrumentation.span("config_publish", function=self.function_name, memory_mb=memory_mb):
+                    response = self._lambda_client.publish_version(
+                        FunctionName=self.function_name,
+                        Description=f"parrotfish exploration {memory_mb}MB",
+                    )
+
+            except ClientError as e:
+                logger.debug(e.args[0])
+                raise FunctionConfigError(e.args[0])
+
+            self.published_versions[memory_mb] = response["Version"]
+
+        return self.published_versions[memory_mb]
+
+    def delete_published_configs(self) -> None:
+        """Deletes the versions published for the exploration."""
+        for version in self.published_versions.values():
+            try:
+                self._lambda_client.delete_function(
+                    FunctionName=self.function_name, Qualifier=version
+                )
+            except ClientError as e:
+                logger.warning(f"Failed to delete version {version} of {self.function_name}: {e.args[0]}")
+        self.published_versions = {}
+
+    def reset_config(self) -> None:
+        self.set_config(self.initial_config.memory_mb, self.initial_config.timeout)
+        self.delete_published_configs()
@@ -1,10 +1,17 @@
+import functools
+from concurrent.futures import as_completed
+
 import boto3
 
 from .aws_config_manager import AWSConfigManager
 from .aws_cost_calculator import AWSCostCalculator
 from .aws_invoker import AWSInvoker
 from .aws_log_parser import AWSLogParser
+from ..cold_start import COLD_START_THRESHOLD, LOG, MAX_REPLACEMENT_ROUNDS, WARMUP
 from ..explorer import Explorer
+from ..invocation_pool import InvocationPool
+from ...exception import InvocationError
+from ...logger import logger
 
 
 class AWSExplorer(Explorer):
@@ -15,21 +22,163 @@ class AWSExplorer(Explorer):
         aws_session: boto3.Session,
         payload: str = None,
         memory_bounds: list = None,
+        concurrent_exploration: bool = False,
+        cold_start_detection: str = LOG,
+        cold_start_threshold: float = COLD_START_THRESHOLD,
     ):
+        invoker = AWSInvoker(
+            function_name=lambda_name,
+            max_invocation_attempts=max_invocation_attempts,
+            aws_session=aws_session,
+        )
         super().__init__(
             log_parser=AWSLogParser(),
             config_manager=AWSConfigManager(
-                function_name=lambda_name, aws_session=aws_session
-            ),
-            invoker=AWSInvoker(
-                function_name=lambda_name,
-                max_invocation_attempts=max_invocation_attempts,
-                aws_session=aws_session,
+                function_name=lambda_name, aws_session=aws_session, invoker=invoker
             ),
+            invoker=invoker,
             price_calculator=AWSCostCalculator(
                 function_name=lambda_name, aws_session=aws_session
             ),
             payload=payload,
             memory_bounds=memory_bounds,
             memory_space=set(range(128, 3009)),
+            cold_start_detection=cold_start_detection,
+            cold_start_threshold=cold_start_threshold,
         )
+        # When enabled, every memory configuration is explored through its own published version.
+        self.concurrent_exploration = concurrent_exploration
+        self._qualifier = None
+
+    def explore_parallel(
+        self, nbr_invocations: int, nbr_threads: int, memory_mb: int = None
+    ) -> list:
+        if self.concurrent_exploration and memory_mb:
+            if memory_mb not in self.config_manager.published_versions:
+                return self.explore_batch([memory_mb], nbr_invocations, nbr_threads)[memory_mb]
+            # The published version is already warm.
+            self._qualifier = self.config_manager.published_versions[memory_mb]
+            self._memory_config_mb = memory_mb
+            memory_mb = None
+        return super().explore_parallel(nbr_invocations, nbr_threads, memory_mb)
+
+    def explore(self, memory_mb: int = None, enable_cost_calculation=True) -> int:
+        if self.concurrent_exploration and memory_mb:
+            is_published = memory_mb in self.config_manager.published_versions
+            self._qualifier = self.config_manager.publish_config(memory_mb)
+            self._memory_config_mb = memory_mb
+            if not is_published and self.cold_start_detection == WARMUP:
+                # Handling cold start
+                self.explore(enable_cost_calculation=enable_cost_calculation)
+            memory_mb = None
+        return super().explore(memory_mb, enable_cost_calculation)
+
+    def explore_batch(
+        self, memories: list, nbr_invocations: int, nbr_threads: int
+    ) -> dict:
+        """Invokes the lambda function concurrently with each of the given memory configs.
+
+        One version is published per memory configuration, then all the versions are invoked at the same time through
+        their qualifiers, so the memory configurations don't wait for each other's configuration update and cold start.
+        """
+        if not self.concurrent_exploration:
+            return super().explore_batch(memories, nbr_invocations, nbr_threads)
+
+        qualifiers = {
+            memory: self.config_manager.publish_config(memory) for memory in memories
+        }
+
+        max_concurrency = nbr_threads * len(memories)
+        if self.cold_start_detection == WARMUP:
+            # Handling cold start
+            self._explore_qualifiers(qualifiers, nbr_invocations, max_concurrency)
+            invocations = self._explore_qualifiers(qualifiers, nbr_invocations, max_concurrency)
+            results = {
+                memory: [duration for duration, _ in memory_invocations]
+                for memory, memory_invocations in invocations.items()
+            }
+        else:
+            results = self._explore_warm_qualifiers(qualifiers, nbr_invocations, max_concurrency)
+
+        # The following explorations target the last explored memory configuration.
+        self._memory_config_mb = memories[-1]
+        self._qualifier = qualifiers[memories[-1]]
+        return results
+
+    def _explore_warm_qualifiers(
+        self, qualifiers: dict, nbr_invocations: int, max_concurrency: int
+    ) -> dict:
+        """Invokes every qualified version until @nbr_invocations invocations were warm, the cold ones are discarded."""
+        durations = {memory: [] for memory in qualifiers}
+        results = {memory: [] for memory in qualifiers}
+        for _ in range(1 + MAX_REPLACEMENT_ROUNDS):
+            missing = {
+                memory: nbr_invocations - len(results[memory])
+                for memory in qualifiers
+                if len(results[memory]) < nbr_invocations
+            }
+            if not missing:
+                return results
+
+            invocations = self._explore_qualifiers(
+                {memory: qualifiers[memory] for memory in missing}, missing, max_concurrency
+            )
+            for memory, memory_invocations in invocations.items():
+                results[memory] += self._warm_durations(memory_invocations, durations[memory])
+
+        for memory in qualifiers:
+            if len(results[memory]) < nbr_invocations:
+                logger.warning(f"Invocations with {memory}MB were still cold after {len(durations[memory])} invocations.")
+                results[memory] = results[memory] or durations[memory]
+        return results
+
+    def _explore_qualifiers(
+        self, qualifiers: dict, nbr_invocations, max_concurrency: int
+    ) -> dict:
+        """Invokes every qualified version and aggregates the invocations per memory config.
+
+        Args:
+            qualifiers (dict): The qualifier of each memory config's version.
+            nbr_invocations (int | dict): The number of invocations of every version, or of each memory config's version.
+            max_concurrency (int): The maximum number of invocations in flight on the shared invocation pool.
+
+        Returns:
+            dict: The invocations' (duration in ms, whether the log reports a cold start) tuples of each memory config.
+        """
+        if not isinstance(nbr_invocations, dict):
+            nbr_invocations = dict.fromkeys(qualifiers, nbr_invocations)
+
+        memories = [memory for memory in qualifiers for _ in range(nbr_invocations[memory])]
+        calls = [functools.partial(self._invoke_qualifier, qualifiers[memory]) for memory in memories]
+        futures = dict(zip(InvocationPool.shared().submit_all(calls, max_concurrency), memories))
+
+        error = None
+        results = {memory: [] for memory in qualifiers}
+        for future in as_completed(futures):
+            memory = futures[future]
+            try:
+                duration_ms, is_cold = future.result()
+
+            except InvocationError as e:
+                logger.debug(e)
+                if error is None:
+                    error = e
+                self.cost += self.price_calculator.calculate_price(memory, e.duration_ms)
+                continue
+
+            results[memory].append((duration_ms, is_cold))
+            self.cost += self.price_calculator.calculate_price(memory, duration_ms)
+
+        # If one thread raises an invocation error we raise it.
+        if error:
+            raise error
+
+        return results
+
+    def _invoke_qualifier(self, qualifier: str) -> tuple:
+        execution_log = self.invoker.invoke(self.payload, qualifier)
+        exec_time = self.log_parser.parse_log(execution_log)
+        return exec_time, self.cold_start_detection == LOG and self.log_parser.is_cold_start(execution_log)
+
+    def _invoke(self) -> str:
+        return self.invoker.invoke(self.payload, self._qualifier)
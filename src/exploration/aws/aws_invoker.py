@@ -1,13 +1,20 @@
 import base64
+import threading
 import time
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import *
 
 from src.exception import *
+from src.exploration.aws.aws_rate_limiter import AWSRateLimiter
 from src.exploration.invoker import Invoker
+from src.instrumentation import instrumentation
 from src.logger import logger
 
+# Size of the Lambda client's connection pool, so that concurrent invocations reuse connections.
+MAX_POOL_CONNECTIONS = 256
+
 
 class AWSInvoker(Invoker):
     def __init__(
@@ -15,29 +22,57 @@ class AWSInvoker(Invoker):
             function_name: str,
             max_invocation_attempts: int,
             aws_session: boto3.Session,
+            on_throttle: callable = None,
     ):
         super().__init__(function_name, max_invocation_attempts)
-        self.client = aws_session.client("lambda")
+        # Called whenever Lambda throttles an invocation, e.g. to adapt a concurrency limit.
+        self._on_throttle = on_throttle
+        self.client = aws_session.client("lambda", config=Config(max_pool_connections=MAX_POOL_CONNECTIONS))
+        self._rate_limiter = AWSRateLimiter.for_region(aws_session.region_name)
+        self._function_config = None
+        self._function_config_lock = threading.Lock()
+
+    @property
+    def function_config(self) -> dict:
+        """Snapshot of the function's configuration, fetched once until it is invalidated."""
+        with self._function_config_lock:
+            if self._function_config is None:
+                self._rate_limiter.acquire_control_plane()
+                self._function_config = self.client.get_function_configuration(
+                    FunctionName=self.function_name
+                )
+            return self._function_config
 
-    def _invoke_with_retry(self, payload: str) -> dict:
+    def invalidate_config(self) -> None:
+        """Invalidates the configuration snapshot, it is fetched again on the next invocation."""
+        with self._function_config_lock:
+            self._function_config = None
+
+    def _invoke_with_retry(self, payload: str, qualifier: str = None) -> dict:
         sleeping_interval = 1
         memory_size = None
         timeout = None
        
         for _ in range(self.max_invocation_attempts):
             try:
-                # Invoking the function and getting back the response log to parse.
-                config = self.client.get_function_configuration(
-                    FunctionName=self.function_name
-                )
+                config = self.function_config
                 memory_size = config["MemorySize"]
                 timeout = config["Timeout"]
 
+                # Invoking the function and getting back the response log to parse.
                 logger.debug(f"Invoking {self.function_name}, {memory_size}MB, {timeout}s, payload: {payload}")
 
-                response = self.client.invoke(
-                    FunctionName=self.function_name, LogType="Tail", Payload=payload
-                )
+                with self._rate_limiter.invocation(), instrumentation.span(
+                        "invocation", function=self.function_name, memory_mb=memory_size
+                ):
+                    if qualifier:
+                        response = self.client.invoke(
+                            FunctionName=self.function_name, LogType="Tail", Payload=payload, Qualifier=qualifier
+                        )
+                    else:
+                        response = self.client.invoke(
+                            FunctionName=self.function_name, LogType="Tail", Payload=payload
+                        )
                 return response
 
             except ClientError as e:
@@ -45,8 +80,12 @@ class AWSInvoker(Invoker):
                     # Handling AWS concurrent execution limits.
                     logger.warning(
                         f"Concurrent Invocation Limit Exceeded. Retrying... {self.function_name}: {memory_size}MB")
+                    instrumentation.increment("invocation_retries")
+                    if self._on_throttle is not None:
+                        self._on_throttle()
 
-                    time.sleep(sleeping_interval)
+                    with instrumentation.span("invocation.backoff"):
+                        time.sleep(sleeping_interval)
                     sleeping_interval *= 2
 
                 else:
@@ -66,15 +105,17 @@ class AWSInvoker(Invoker):
             except Exception:
                 # Handling the throttling imposed by AWS on the number of concurrent executions.
                 logger.warning("Possibly Too Many Requests Error. Retrying...")
+                instrumentation.increment("invocation_retries")
 
-                time.sleep(sleeping_interval)
+                with instrumentation.span("invocation.backoff"):
+                    time.sleep(sleeping_interval)
                 sleeping_interval *= 2
 
         logger.warning(f"MaxInvocationAttemptsReachedError. {self.function_name}: {memory_size}MB")
         raise MaxInvocationAttemptsReachedError()
 
-    def invoke(self, payload: str) -> str:
-        response = self._invoke_with_retry(payload)
+    def invoke(self, payload: str, qualifier: str = None) -> str:
+        response = self._invoke_with_retry(payload, qualifier)
         return str(base64.b64decode(response["LogResult"]))
 
     def invoke_for_output(self, payload: str) -> str:
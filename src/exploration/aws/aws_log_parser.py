@@ -1,29 +1,72 @@
 import re
 
+import numpy as np
+
 from src.exception import *
 from src.exploration.log_parser import LogParser
 from src.logger import logger
 
 
 class AWSLogParser(LogParser):
+    # Fields of the records returned by parse_logs, one per log parsing key.
+    REPORT_FIELDS = {
+        "Duration": "duration_ms",
+        "Billed Duration": "billed_duration_ms",
+        "Max Memory Used": "max_memory_used_mb",
+        "Memory Size": "memory_size_mb",
+        "Init Duration": "init_duration_ms",
+    }
+    REPORT_DTYPE = np.dtype(
+        [(field, float) for field in REPORT_FIELDS.values()]
+        + [("timed_out", bool), ("error", bool)]
+    )
+
     def __init__(self):
-        super().__init__(
-            [
-                "Duration",
-                "Billed Duration",
-                "Max Memory Used",
-                "Memory Size",
-                "Init Duration",
-            ]
+        super().__init__(list(self.REPORT_FIELDS))
+        # The logs' fields are separated by tabs, escaped when the log is a decoded LogResult.
+        self._report_pattern = re.compile(
+            rf"(?:\\t|\t)(?P<key>{'|'.join(self.log_parsing_keys)}): (?P<value>[0-9.]+) (?:ms|MB)"
         )
+        self._error_pattern = re.compile(r"\[ERROR\] (?P<error>.*)END RequestId")
+
+    def parse_report(self, log: str) -> dict:
+        """Parses all the REPORT keys of an invocation's log in a single pass.
+
+        Args:
+            log (str): Serverless function exploration's response log to parse.
+
+        Returns:
+            dict: The value of each key found in the log.
+        """
+        return {
+            match["key"]: float(match["value"])
+            for match in self._report_pattern.finditer(log)
+        }
+
+    def parse_logs(self, logs: list) -> np.recarray:
+        """Parses a batch of invocations' logs into a record array.
+
+        Args:
+            logs (list): Serverless function explorations' response logs to parse.
+
+        Returns:
+            np.recarray: One record per log. Keys missing from a log are set to NaN.
+        """
+        records = np.recarray(len(logs), dtype=self.REPORT_DTYPE)
+        for field in self.REPORT_FIELDS.values():
+            records[field] = np.nan
+
+        for i, log in enumerate(logs):
+            for key, value in self.parse_report(log).items():
+                records[self.REPORT_FIELDS[key]][i] = value
+            records.timed_out[i] = "Task timed out after" in log
+            records.error[i] = self._error_pattern.search(log) is not None
+
+        return records
 
     def parse_log(self, log: str) -> int:
         # parse the log keys and prepare result.
-        results = {}
-        for key in self.log_parsing_keys:
-            match = re.match(rf".*\\t{key}: (?P<value>[0-9.]+) (ms|MB).*", log)
-            if match:
-                results[key] = float(match["value"])
+        results = self.parse_report(log)
 
         if "Billed Duration" not in results:
             raise LogParsingError
@@ -42,8 +85,12 @@ class AWSLogParser(LogParser):
             raise FunctionENOMEM(duration_ms=execution_time_ms)
 
         # check for errors
-        error_msg = re.match(r".*\[ERROR\] (?P<error>.*)END RequestId.*", log)
+        error_msg = self._error_pattern.search(log)
         if error_msg is not None:
             raise InvocationError(error_msg["error"], execution_time_ms)
 
         return execution_time_ms
+
+    def is_cold_start(self, log: str) -> bool:
+        # Lambda only reports the initialization's duration of the invocations that initialized an execution environment.
+        return "Init Duration" in self.parse_report(log)
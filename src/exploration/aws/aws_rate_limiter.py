@@ -0,0 +1,148 @@
+import math
+import threading
+import time
+from contextlib import contextmanager
+
+from src.instrumentation import instrumentation
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled with @rate tokens per second, up to @capacity tokens."""
+
+    def __init__(self, rate: float, capacity: float = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1) -> None:
+        """Blocks until @tokens tokens are available and consumes them."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+                self._updated_at = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                waiting_time = (tokens - self._tokens) / self.rate
+            with instrumentation.span("rate_limit.wait"):
+                time.sleep(waiting_time)
+
+
+class AdaptiveConcurrencyLimit:
+    """Thread-safe concurrency limit adapting to throttling, additive increase and multiplicative decrease (AIMD).
+
+    The limit grows by one every @limit completed calls, up to @max_limit, and halves when a call is throttled, at most
+    once per @decrease_interval seconds since the calls throttled together report it together.
+    """
+
+    def __init__(self, initial_limit: int, max_limit: int, decrease_interval: float = 1.0):
+        self.max_limit = max_limit
+        self.limit = float(min(initial_limit, max_limit))
+        self._decrease_interval = decrease_interval
+        self._decreased_at = None
+        self._in_flight = 0
+        self._condition = threading.Condition()
+
+    @contextmanager
+    def slot(self):
+        """Holds one of the concurrent calls for the duration of the context."""
+        with self._condition:
+            if self._in_flight >= int(self.limit):
+                with instrumentation.span("rate_limit.wait"):
+                    self._condition.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._in_flight -= 1
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+                self._condition.notify_all()
+
+    def throttled(self) -> None:
+        """Halves the limit, unless it was just halved."""
+        with self._condition:
+            now = time.monotonic()
+            if self._decreased_at is None or now - self._decreased_at >= self._decrease_interval:
+                self.limit = max(1.0, self.limit / 2)
+                self._decreased_at = now
+                instrumentation.increment("concurrency_limit_decreases")
+
+
+class AWSRateLimiter:
+    """Limits the Lambda requests of all the invokers and configuration managers of a region.
+
+    Lambda's concurrency and API rate quotas are shared by all the functions of an account in a region, so the limiters
+    are shared per region. Limits must be configured before the explorers are created, regions without configured
+    limits are not limited.
+    """
+
+    _region_limiters = {}
+    _region_limiters_lock = threading.Lock()
+
+    def __init__(
+        self,
+        max_concurrent_invocations: int = None,
+        invocations_per_second: float = None,
+        control_plane_requests_per_second: float = None,
+    ):
+        """
+        Args:
+            max_concurrent_invocations (int, optional): Maximum number of in-flight invocations.
+            invocations_per_second (float, optional): Maximum invocation rate.
+            control_plane_requests_per_second (float, optional): Maximum rate of the requests to the functions'
+                configurations, reads included, and of the version publications.
+        """
+        self._concurrency = (
+            threading.BoundedSemaphore(max_concurrent_invocations) if max_concurrent_invocations else None
+        )
+        self._invocations = TokenBucket(invocations_per_second) if invocations_per_second else None
+        self._control_plane = (
+            TokenBucket(control_plane_requests_per_second) if control_plane_requests_per_second else None
+        )
+
+    @classmethod
+    def for_region(cls, region: str) -> "AWSRateLimiter":
+        """Returns the rate limiter shared by the region @region."""
+        with cls._region_limiters_lock:
+            if region not in cls._region_limiters:
+                cls._region_limiters[region] = cls()
+            return cls._region_limiters[region]
+
+    @classmethod
+    def configure(cls, region: str, **limits) -> "AWSRateLimiter":
+        """Sets the limits of the region @region, see AWSRateLimiter's arguments."""
+        with cls._region_limiters_lock:
+            cls._region_limiters[region] = cls(**limits)
+            return cls._region_limiters[region]
+
+    @contextmanager
+    def invocation(self):
+        """Holds one of the region's concurrent invocations for the duration of the context."""
+        if self._invocations is not None:
+            self._invocations.acquire()
+        if self._concurrency is None:
+            yield
+            return
+
+        with instrumentation.span("rate_limit.wait"):
+            self._concurrency.acquire()
+        try:
+            yield
+        finally:
+            self._concurrency.release()
+
+    def acquire_control_plane(self) -> None:
+        """Blocks until a control plane request is allowed."""
+        if self._control_plane is not None:
+            self._control_plane.acquire()
+
+    def waiter_delay(self, delay: int) -> int:
+        """Returns the delay in seconds between the polls of a waiter whose default delay is @delay, so that a waiter
+        doesn't poll faster than the control plane's rate."""
+        if self._control_plane is None:
+            return delay
+        return max(delay, math.ceil(1 / self._control_plane.rate))
@@ -0,0 +1,29 @@
+import numpy as np
+
+from src.configuration.defaults import COLD_START_THRESHOLD
+
+# Strategies keeping the cold starts out of the explorations' results.
+# An extra round of invocations absorbs the cold starts after each configuration update.
+WARMUP = "warmup"
+# The invocations' logs tell the cold invocations apart, which are discarded and replaced.
+LOG = "log"
+# The invocations much slower than the median invocation are considered cold, discarded and replaced.
+HEURISTIC = "heuristic"
+
+# Maximum number of rounds of invocations replacing the discarded cold ones.
+MAX_REPLACEMENT_ROUNDS = 3
+
+
+def slow_invocations(durations: np.ndarray, reference_durations: np.ndarray, threshold: float) -> np.ndarray:
+    """Tells apart the invocations more than @threshold (relative) slower than the median of @reference_durations.
+
+    Args:
+        durations (np.ndarray): The invocations' durations.
+        reference_durations (np.ndarray): The durations of all the invocations of the configuration, which should be
+            mostly warm.
+        threshold (float): The relative slowdown above which an invocation is considered cold.
+
+    Returns:
+        np.ndarray: Whether each invocation is slow.
+    """
+    return np.asarray(durations) > (1 + threshold) * np.median(reference_durations)
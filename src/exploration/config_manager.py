@@ -14,6 +14,11 @@ class ConfigManager(ABC):
         """Max timeout quota for the lambda service associated with the user account."""
         pass
 
+    @property
+    def code_hash(self) -> str:
+        """Hash identifying the serverless function's deployed code, None if the cloud provider doesn't expose it."""
+        return None
+
     @abstractmethod
     def set_config(self, memory_mb: int, timeout: int = None, cpu: float = None) -> any:
         """Updates the serverless function's configuration by setting the memory value to @memory_mb.
@@ -27,6 +32,10 @@ class ConfigManager(ABC):
         """
         pass
 
+    def delete_published_configs(self) -> None:
+        """Deletes the configurations published for the exploration, if the cloud provider publishes any."""
+        pass
+
     def reset_config(self) -> None:
         """Resets the function's configuration to it's initial state."""
         self.set_config(self.initial_config.memory_mb, self.initial_config.timeout, self.initial_config.cpu)
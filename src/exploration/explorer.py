@@ -1,13 +1,17 @@
+import functools
 from abc import ABC
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import as_completed
 
 import numpy as np
 
+from .cold_start import COLD_START_THRESHOLD, HEURISTIC, LOG, MAX_REPLACEMENT_ROUNDS, WARMUP, slow_invocations
 from .config_manager import ConfigManager
 from .cost_calculator import CostCalculator
+from .invocation_pool import InvocationPool
 from .invoker import Invoker
 from .log_parser import LogParser
 from ..exception import InvocationError
+from ..instrumentation import instrumentation
 from ..logger import logger
 
 
@@ -23,6 +27,8 @@ class Explorer(ABC):
         memory_space: set,
         payload: str = None,
         memory_bounds: list = None,
+        cold_start_detection: str = WARMUP,
+        cold_start_threshold: float = COLD_START_THRESHOLD,
     ):
         self.config_manager = config_manager
         self.invoker = invoker
@@ -54,6 +60,15 @@ class Explorer(ABC):
 
         self.cost = 0
         self._memory_config_mb = 0
+        self.concurrent_exploration = False
+        # How the cold starts are kept out of the explorations' results, see src/exploration/cold_start.py.
+        self.cold_start_detection = cold_start_detection
+        self.cold_start_threshold = cold_start_threshold
+
+    @property
+    def memory_config_mb(self) -> int:
+        """The memory size in MB the function was last configured with by the explorer."""
+        return self._memory_config_mb
 
     def explore_parallel(
         self, nbr_invocations: int, nbr_threads: int, memory_mb: int = None
@@ -62,7 +77,7 @@ class Explorer(ABC):
 
         Args:
             nbr_invocations (int): The number of invocations to performed with a given memory configuration.
-            nbr_threads (int): The number of threads to invoke the serverless function.
+            nbr_threads (int): The number of concurrent invocations of the serverless function.
             memory_mb (int): The target configuration's memory size in MB.
 
         Returns:
@@ -72,43 +87,25 @@ class Explorer(ABC):
              ExplorationError: If an error occurred while exploring with the memory config @memory_mb.
 
         If the memory_mb input is provided, it updates the memory configuration for the serverless function if it doesn't match.
+        The cold starts are kept out of the results as configured by @cold_start_detection: with "log" or "heuristic", the
+        cold invocations are discarded and replaced, instead of invoking a whole warm-up round after configuration updates.
         """
         # Check and set memory configuration
         if memory_mb:
             self.config_manager.set_config(memory_mb)
             self._memory_config_mb = memory_mb
-            # Handling cold start
-            self.explore_parallel(nbr_invocations, nbr_threads)
+            if self.cold_start_detection == WARMUP:
+                # Handling cold start
+                self.explore_parallel(nbr_invocations, nbr_threads)
 
-        # Concurrent exploration.
-        error = None
-        results = []
-        with ThreadPoolExecutor(max_workers=nbr_threads) as executor:
-            # Submit exploration jobs to each thread.
-            futures = [
-                executor.submit(
-                    self.explore, memory_mb=None, enable_cost_calculation=False
-                )
-                for _ in range(nbr_invocations)
-            ]
-
-            # Aggregate results from all threads.
-            for future in as_completed(futures):
-                try:
-                    results.append(future.result())
-
-                except InvocationError as e:
-                    logger.debug(e)
-                    if error is None:
-                        error = e
-                    self.cost += self.price_calculator.calculate_price(
-                        self._memory_config_mb, e.duration_ms
-                    )
-                    continue
+        if self.cold_start_detection != WARMUP:
+            return self._explore_warm_invocations(nbr_invocations, nbr_threads)
 
-        # If one thread raises an invocation error we raise it.
-        if error:
-            raise error
+        results = self._explore_round(
+            nbr_invocations,
+            nbr_threads,
+            functools.partial(self.explore, memory_mb=None, enable_cost_calculation=False),
+        )
 
         # Calculate the cost
         self.cost += np.sum(
@@ -119,6 +116,76 @@ class Explorer(ABC):
 
         return results
 
+    def _explore_warm_invocations(self, nbr_invocations: int, nbr_threads: int) -> list:
+        """Explores until @nbr_invocations invocations were warm, the cold ones are paid for and discarded."""
+        durations = []
+        warm_durations = []
+        for _ in range(1 + MAX_REPLACEMENT_ROUNDS):
+            invocations = self._explore_round(
+                nbr_invocations - len(warm_durations), nbr_threads, self._explore_invocation
+            )
+            self.cost += np.sum(
+                self.price_calculator.calculate_price(
+                    self._memory_config_mb, np.array([duration for duration, _ in invocations])
+                )
+            )
+            warm_durations += self._warm_durations(invocations, durations)
+            if len(warm_durations) >= nbr_invocations:
+                return warm_durations
+
+        logger.warning(f"Invocations with {self._memory_config_mb}MB were still cold after {len(durations)} invocations.")
+        return warm_durations or durations
+
+    def _explore_round(self, nbr_invocations: int, nbr_threads: int, invocation: callable) -> list:
+        """Calls @invocation @nbr_invocations times, @nbr_threads at a time on the shared invocation pool, and returns
+        the results.
+
+        The failed invocations are paid for, and the first failure is raised once all the invocations completed.
+        """
+        error = None
+        results = []
+        futures = InvocationPool.shared().submit_all([invocation] * nbr_invocations, nbr_threads)
+
+        # Aggregate results from all threads.
+        for future in as_completed(futures):
+            try:
+                results.append(future.result())
+
+            except InvocationError as e:
+                logger.debug(e)
+                if error is None:
+                    error = e
+                self.cost += self.price_calculator.calculate_price(
+                    self._memory_config_mb, e.duration_ms
+                )
+                continue
+
+        # If one thread raises an invocation error we raise it.
+        if error:
+            raise error
+
+        return results
+
+    def _warm_durations(self, invocations: list, durations: list) -> list:
+        """Returns the durations of the warm invocations among @invocations.
+
+        Args:
+            invocations (list): The invocations' (duration in ms, whether the log reports a cold start) tuples.
+            durations (list): The durations of the configuration's previous invocations, extended with @invocations'.
+
+        Returns:
+            list: The durations of the invocations that are not cold.
+        """
+        round_durations = np.array([duration for duration, _ in invocations], dtype=int)
+        is_cold = np.array([is_cold for _, is_cold in invocations], dtype=bool)
+        durations += round_durations.tolist()
+        if self.cold_start_detection == HEURISTIC:
+            is_cold |= slow_invocations(round_durations, np.array(durations), self.cold_start_threshold)
+
+        if is_cold.any():
+            instrumentation.increment("cold_starts", int(is_cold.sum()))
+        return round_durations[~is_cold].tolist()
+
     def explore(self, memory_mb: int = None, enable_cost_calculation=True) -> int:
         """Invokes the function and parses the execution response.
 
@@ -134,28 +201,83 @@ class Explorer(ABC):
 
         If the memory_mb input is provided, it updates the memory configuration for the serverless function if it doesn't match.
         If the is_compute_cost input is provided, it computes the exploration cost and adds that to the total cost.
+        The cold starts are only absorbed by a warm-up invocation with "warmup", and only replaced with "log": a single
+        invocation gives the "heuristic" no reference to compare it with.
         """
         if memory_mb:
             self.config_manager.set_config(memory_mb)
             self._memory_config_mb = memory_mb
-            # Handling cold start
-            self.explore(enable_cost_calculation=enable_cost_calculation)
+            if self.cold_start_detection == WARMUP:
+                # Handling cold start
+                self.explore(enable_cost_calculation=enable_cost_calculation)
 
-        try:
-            execution_log = self.invoker.invoke(self.payload)
-            exec_time = self.log_parser.parse_log(execution_log)
+        for _ in range(1 + MAX_REPLACEMENT_ROUNDS):
+            try:
+                exec_time, is_cold = self._explore_invocation()
 
-        except InvocationError as e:
-            logger.debug(e)
-            if enable_cost_calculation:
-                self.cost += self.price_calculator.calculate_price(
-                    self._memory_config_mb, e.duration_ms
-                )
-            raise
+            except InvocationError as e:
+                if enable_cost_calculation:
+                    self.cost += self.price_calculator.calculate_price(
+                        self._memory_config_mb, e.duration_ms
+                    )
+                raise
 
-        else:
             if enable_cost_calculation:
                 self.cost += self.price_calculator.calculate_price(
                     self._memory_config_mb, exec_time
                 )
-            return exec_time
+            if not is_cold:
+                break
+            instrumentation.increment("cold_starts")
+
+        else:
+            logger.warning(
+                f"Invocations with {self._memory_config_mb}MB were still cold after {1 + MAX_REPLACEMENT_ROUNDS} "
+                f"invocations, keeping a cold start's duration."
+            )
+
+        return exec_time
+
+    def _explore_invocation(self) -> tuple:
+        """Invokes the function and returns the invocation's duration in ms and whether its log reports a cold start.
+
+        The log is only checked for a cold start when the cold starts are detected from the logs.
+        """
+        try:
+            execution_log = self._invoke()
+            with instrumentation.span("log_parsing"):
+                exec_time = self.log_parser.parse_log(execution_log)
+
+        except InvocationError as e:
+            logger.debug(e)
+            instrumentation.increment("invocation_errors")
+            raise
+
+        return exec_time, self.cold_start_detection == LOG and self.log_parser.is_cold_start(execution_log)
+
+    def explore_batch(
+        self, memories: list, nbr_invocations: int, nbr_threads: int
+    ) -> dict:
+        """Invokes the specified serverless function multiple times with each of the given memory configs.
+
+        Args:
+            memories (list): The memory sizes in MB to explore with.
+            nbr_invocations (int): The number of invocations to performed with each memory configuration.
+            nbr_threads (int): The number of concurrent invocations of the serverless function per memory configuration.
+
+        Returns:
+            dict: The invocations' durations of each memory configuration.
+
+        Raises:
+             ExplorationError: If an error occurred while exploring with one of the memory configs.
+
+        By default, the memory configurations are explored one after the other.
+        """
+        return {
+            memory: self.explore_parallel(nbr_invocations, nbr_threads, memory)
+            for memory in memories
+        }
+
+    def _invoke(self) -> str:
+        """Invokes the serverless function with the exploration's payload and returns the response log."""
+        return self.invoker.invoke(self.payload)
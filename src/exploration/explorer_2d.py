@@ -1,12 +1,16 @@
+import functools
 from abc import ABC
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import as_completed
 
 import numpy as np
 
+from .cold_start import COLD_START_THRESHOLD, MAX_REPLACEMENT_ROUNDS, WARMUP, slow_invocations
 from .config_manager import ConfigManager
 from .cost_calculator import CostCalculator
+from .invocation_pool import InvocationPool
 from .invoker import Invoker
 from ..exception import InvocationError
+from ..instrumentation import instrumentation
 from ..logger import logger
 
 
@@ -22,6 +26,8 @@ class Explorer2D(ABC):
         payload: str = None,
         cpu_bounds: list = None,
         memory_bounds: list = None,
+        cold_start_detection: str = WARMUP,
+        cold_start_threshold: float = COLD_START_THRESHOLD,
     ):
         self.config_manager = config_manager
         self.invoker = invoker
@@ -44,6 +50,11 @@ class Explorer2D(ABC):
         self.cost = 0
         self._cpu_config = 0.0
         self._memory_config_mb = 0
+        # How the cold starts are kept out of the explorations' results, see src/exploration/cold_start.py. The
+        # invocations' durations don't tell cold starts apart, so the cold starts are either absorbed by a warm-up round
+        # or detected with the heuristic.
+        self.cold_start_detection = cold_start_detection
+        self.cold_start_threshold = cold_start_threshold
 
     def explore_parallel(
         self, nbr_invocations: int, nbr_threads: int, cpu: float = None, memory_mb: int = None
@@ -52,7 +63,7 @@ class Explorer2D(ABC):
 
         Args:
             nbr_invocations (int): The number of invocations to performed with a given memory configuration.
-            nbr_threads (int): The number of threads to invoke the serverless function.
+            nbr_threads (int): The number of concurrent invocations of the serverless function.
             memory_mb (int): The target configuration's memory size in MB.
 
         Returns:
@@ -68,31 +79,59 @@ class Explorer2D(ABC):
             self.config_manager.set_config(memory_mb=memory_mb, cpu = cpu)
             if memory_mb is not None: self._memory_config_mb = memory_mb
             if cpu is not None: self._cpu_config = cpu
-            # Handling cold start
-            self.explore_parallel(nbr_invocations, nbr_threads)
-
+            if self.cold_start_detection == WARMUP:
+                # Handling cold start
+                self.explore_parallel(nbr_invocations, nbr_threads)
+
+        if self.cold_start_detection != WARMUP:
+            return self._explore_warm_invocations(nbr_invocations, nbr_threads)
+
+        return self._explore_round(nbr_invocations, nbr_threads)
+
+    def _explore_warm_invocations(self, nbr_invocations: int, nbr_threads: int) -> list:
+        """Explores until @nbr_invocations invocations were warm, the slow invocations are considered cold and discarded."""
+        durations = []
+        warm_durations = []
+        for _ in range(1 + MAX_REPLACEMENT_ROUNDS):
+            round_durations = np.array(self._explore_round(nbr_invocations - len(warm_durations), nbr_threads))
+            warm_durations += self._warm_durations(round_durations, durations)
+            if len(warm_durations) >= nbr_invocations:
+                return warm_durations
+
+        logger.warning(
+            f"Invocations with {self._cpu_config}vCPU and {self._memory_config_mb}MB were still slow after "
+            f"{len(durations)} invocations."
+        )
+        return warm_durations or durations
+
+    def _warm_durations(self, round_durations: np.ndarray, durations: list) -> list:
+        """Returns the durations of @round_durations that the heuristic doesn't consider cold, @durations accumulates
+        the durations of all the configuration's invocations."""
+        durations += round_durations.tolist()
+        is_cold = slow_invocations(round_durations, np.array(durations), self.cold_start_threshold)
+        if is_cold.any():
+            instrumentation.increment("cold_starts", int(is_cold.sum()))
+        return round_durations[~is_cold].tolist()
+
+    def _explore_round(self, nbr_invocations: int, nbr_threads: int) -> list:
+        """Invokes the function @nbr_invocations times, @nbr_threads at a time on the shared invocation pool, and
+        returns the durations."""
         # Concurrent exploration.
         error = None
         results = []
-        with ThreadPoolExecutor(max_workers=nbr_threads) as executor:
-            # Submit exploration jobs to each thread.
-            futures = [
-                executor.submit(
-                    self.explore, memory_mb=None, enable_cost_calculation=False
-                )
-                for _ in range(nbr_invocations)
-            ]
+        invocation = functools.partial(self.explore, memory_mb=None, enable_cost_calculation=False)
+        futures = InvocationPool.shared().submit_all([invocation] * nbr_invocations, nbr_threads)
 
-            # Aggregate results from all threads.
-            for future in as_completed(futures):
-                try:
-                    results.append(future.result())
+        # Aggregate results from all threads.
+        for future in as_completed(futures):
+            try:
+                results.append(future.result())
 
-                except InvocationError as e:
-                    logger.debug(e)
-                    if error is None:
-                        error = e
-                    continue
+            except InvocationError as e:
+                logger.debug(e)
+                if error is None:
+                    error = e
+                continue
 
         # If one thread raises an invocation error we raise it.
         if error:
@@ -121,14 +160,16 @@ class Explorer2D(ABC):
             self.config_manager.set_config(memory_mb=memory_mb, cpu = cpu)
             if memory_mb is not None: self._memory_config_mb = memory_mb
             if cpu is not None: self._cpu_config = cpu
-            # Handling cold start
-            self.explore(enable_cost_calculation=enable_cost_calculation)
+            if self.cold_start_detection == WARMUP:
+                # Handling cold start
+                self.explore(enable_cost_calculation=enable_cost_calculation)
 
         try:
             exec_time = self.invoker.invoke(self.payload)
 
         except InvocationError as e:
             logger.debug(e)
+            instrumentation.increment("invocation_errors")
             if enable_cost_calculation:
                 self.cost += self.price_calculator.calculate_price(
                     self._memory_config_mb, e.duration_ms, self._cpu_config
@@ -6,6 +6,7 @@ from google.cloud import functions_v1
 from src.exception import FunctionConfigError
 from src.exploration.config_manager import ConfigManager
 from src.exploration.function_config import FunctionConfig
+from src.instrumentation import instrumentation
 from src.logger import logger
 
 
@@ -25,6 +26,24 @@ class GCPConfigManager(ConfigManager):
         # TODO: Retrieve the timeout quota from the Google Cloud API.
         return 540
 
+    @property
+    def code_hash(self) -> str:
+        try:
+            function = self._function_client.get_function(name=self.function_url)
+        except GoogleAPICallError as e:
+            logger.debug(e.args[0])
+            raise FunctionConfigError
+
+        # The version id changes with every update, including the memory ones, so the code is identified by its source.
+        source = (
+            function.source_archive_url
+            or function.source_repository.deployed_url
+            or function.source_upload_url
+        )
+        if not source:
+            return None
+        return f"{source}:{function.runtime}:{function.entry_point}"
+
     def set_config(self, memory_mb: int, timeout: int = None, *args) -> any:
         try:
             function = self._function_client.get_function(name=self.function_url)
@@ -51,10 +70,12 @@ class GCPConfigManager(ConfigManager):
                 request = functions_v1.UpdateFunctionRequest(
                     function=function, update_mask=update_mask
                 )
-                update_operation = self._function_client.update_function(request)
-                function = (
-                    update_operation.result()
-                )  # Blocks until updates are applied.
+                with instrumentation.span("config_update", function=self.function_name, memory_mb=memory_mb):
+                    update_operation = self._function_client.update_function(request)
+                with instrumentation.span("config_update.wait", function=self.function_name, memory_mb=memory_mb):
+                    function = (
+                        update_operation.result()
+                    )  # Blocks until updates are applied.
 
         except GoogleAPICallError as e:
             logger.debug(e.args[0])
@@ -6,6 +6,7 @@ from google.cloud import functions_v2
 from src.exception import FunctionConfigError
 from src.exploration.config_manager import ConfigManager
 from src.exploration.function_config_v2 import FunctionConfigV2
+from src.instrumentation import instrumentation
 from src.logger import logger
 
 
@@ -43,10 +44,12 @@ class GCPConfigManagerV2(ConfigManager):
             
             # Update the function configuration
             update_mask = {'paths': ['service_config.available_memory', 'service_config.available_cpu']}
-            operation = self._function_client.update_function(function=function, update_mask=update_mask)
+            with instrumentation.span("config_update", function=self.function_name, memory_mb=memory_mb, cpu=cpu):
+                operation = self._function_client.update_function(function=function, update_mask=update_mask)
             
             # Wait for the update operation to complete
-            response = operation.result()
+            with instrumentation.span("config_update.wait", function=self.function_name, memory_mb=memory_mb, cpu=cpu):
+                response = operation.result()
 
         except GoogleAPICallError as e:
             logger.debug(e.args[0])
@@ -2,6 +2,7 @@ from .gcp_config_manager import GCPConfigManager
 from .gcp_cost_calculator import GCPCostCalculator
 from .gcp_invoker import GCPInvoker
 from .gcp_log_parser import GCPLogParser
+from ..cold_start import COLD_START_THRESHOLD, WARMUP
 from ..explorer import Explorer
 
 
@@ -13,6 +14,8 @@ class GCPExplorer(Explorer):
         max_invocation_attempts: any,
         payload: str = None,
         memory_bounds: list = None,
+        cold_start_detection: str = WARMUP,
+        cold_start_threshold: float = COLD_START_THRESHOLD,
     ):
         log_parser = GCPLogParser()
         super().__init__(
@@ -32,4 +35,6 @@ class GCPExplorer(Explorer):
             ),
             memory_space=set([2**i for i in range(7, 14)]),
             memory_bounds=memory_bounds,
+            cold_start_detection=cold_start_detection,
+            cold_start_threshold=cold_start_threshold,
         )
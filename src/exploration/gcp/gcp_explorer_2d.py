@@ -1,9 +1,28 @@
 from .gcp_config_manager_v2 import GCPConfigManagerV2
 from .gcp_cost_calculator import GCPCostCalculator
 from .gcp_invoker_v2 import GCPInvokerV2
+from ..cold_start import COLD_START_THRESHOLD, WARMUP
 from ..explorer_2d import Explorer2D
 
 
+def cloud_run_cpu_mem_space() -> set:
+    """The (vCPU, memory size in MB) configurations of a Cloud Run function."""
+    # Create CPU-Memory space based on GCP documentation: https://cloud.google.com/run/docs/configuring/services/cpu
+    cpu_memory_dict = {}
+    cpu_values = [0.08, 0.21, 0.34, 0.47, 0.61, 0.74, 0.87, 1.0, 2.0, 4.0]
+    for cpu in cpu_values:
+        if cpu < 0.5:
+            memory_list = list(range(128, 513, 128))
+        elif 0.5 <= cpu < 1.0:
+            memory_list = list(range(128, 1025, 128))
+        elif 1.0 <= cpu < 4.0:
+            memory_list = list(range(128, 4097, 128))
+        elif cpu == 4.0:
+            memory_list = list(range(2048, 4097, 128))
+        cpu_memory_dict[cpu] = memory_list
+    return set([(item[0], m) for item in cpu_memory_dict.items() for m in item[1]])
+
+
 class GCPExplorer2D(Explorer2D):
     def __init__(
         self,
@@ -13,20 +32,10 @@ class GCPExplorer2D(Explorer2D):
         payload: str = None,
         cpu_bounds: list = None,
         memory_bounds: list = None,
+        id_token_authentication: bool = False,
+        cold_start_detection: str = WARMUP,
+        cold_start_threshold: float = COLD_START_THRESHOLD,
     ):
-        # Create CPU-Memory space based on GCP documentation: https://cloud.google.com/run/docs/configuring/services/cpu
-        cpu_memory_dict = {}
-        cpu_values = [0.08, 0.21, 0.34, 0.47, 0.61, 0.74, 0.87, 1.0, 2.0, 4.0]
-        for cpu in cpu_values:
-            if cpu < 0.5:
-                memory_list = list(range(128, 513, 128))
-            elif 0.5 <= cpu < 1.0:
-                memory_list = list(range(128, 1025, 128))
-            elif 1.0 <= cpu < 4.0:
-                memory_list = list(range(128, 4097, 128))
-            elif cpu == 4.0:
-                memory_list = list(range(2048, 4097, 128))
-            cpu_memory_dict[cpu] = memory_list
         super().__init__(
             payload=payload,
             config_manager=GCPConfigManagerV2(
@@ -36,11 +45,20 @@ class GCPExplorer2D(Explorer2D):
                 function_name=function_name,
                 credentials=credentials,
                 max_invocation_attempts=max_invocation_attempts,
+                id_token_authentication=id_token_authentication,
             ),
             price_calculator=GCPCostCalculator(
                 function_name=function_name, region=credentials.region
             ),
-            cpu_mem_space=set([(item[0], m) for item in cpu_memory_dict.items() for m in item[1]]),
+            cpu_mem_space=cloud_run_cpu_mem_space(),
             cpu_bounds = cpu_bounds,
             memory_bounds=memory_bounds,
+            cold_start_detection=cold_start_detection,
+            cold_start_threshold=cold_start_threshold,
         )
+
+    def explore_parallel(
+        self, nbr_invocations: int, nbr_threads: int, cpu: float = None, memory_mb: int = None
+    ) -> list:
+        self.invoker.reserve_connections(nbr_threads)
+        return super().explore_parallel(nbr_invocations, nbr_threads, cpu, memory_mb)
@@ -1,11 +1,13 @@
 import time
 
-from google.api_core.exceptions import GoogleAPICallError, ResourceExhausted
+from google.api_core.exceptions import GoogleAPICallError
 from google.cloud import functions_v1
 from google.cloud import logging as google_logging
 
 from src.exception import *
+from src.exploration.gcp.gcp_log_collector import GCPLogCollector
 from src.exploration.invoker import Invoker
+from src.instrumentation import instrumentation
 from src.logger import logger
 
 
@@ -29,15 +31,21 @@ class GCPInvoker(Invoker):
             credentials=self.credentials, project=self.project_id
         )
         self.log_keys = log_keys
+        self._log_collector = GCPLogCollector(
+            logging_client=self._logging_client,
+            function_name=function_name,
+            region=self.region,
+            log_keys=log_keys,
+        )
 
     def invoke(self, payload: str) -> str:
         sleeping_interval = 1
         for _ in range(self.max_invocation_attempts):
             try:
-                response = self._function_client.call_function(
-                    name=self.function_url, data=payload
-                )
-                return self._get_invocation_log(response.execution_id)
+                with instrumentation.span("invocation", function=self.function_name):
+                    response = self._function_client.call_function(
+                        name=self.function_url, data=payload
+                    )
 
             except GoogleAPICallError as e:
                 logger.debug(e.args[0])
@@ -45,12 +53,31 @@ class GCPInvoker(Invoker):
 
             except Exception:
                 logger.warning("Possibly Too Many Requests Error. Retrying...")
+                instrumentation.increment("invocation_retries")
 
-                time.sleep(sleeping_interval)
+                with instrumentation.span("invocation.backoff"):
+                    time.sleep(sleeping_interval)
                 sleeping_interval *= 2
+                continue
+
+            # The function ran, so failing to collect its log doesn't invoke it again.
+            try:
+                with instrumentation.span("invocation.log_wait", function=self.function_name):
+                    return self._get_invocation_log(response.execution_id)
+
+            except InvocationError:
+                raise
+
+            except Exception as e:
+                logger.debug(e)
+                raise InvocationError(f"Failed to collect the logs of execution {response.execution_id}: {e!r}")
 
         raise MaxInvocationAttemptsReachedError
 
+    def close(self) -> None:
+        """Stops the background collection of the invocations' logs."""
+        self._log_collector.close()
+
     def _get_invocation_log(self, execution_id: str) -> str:
         """Gets the invocation's log that contains the execution time value.
 
@@ -60,36 +87,8 @@ class GCPInvoker(Invoker):
         Returns:
             str: Invocation's log that contains execution time value.
 
-        Retrieves the Cloud function invocation's logs and returns only the log that contains execution time value.
+        Waits for the log collector to retrieve the Cloud function invocation's logs.
         """
-        filter_str = (
-            f'resource.type="cloud_function"'
-            f' AND resource.labels.function_name="{self.function_name}"'
-            f' AND resource.labels.region="{self.region}"'
-            f' AND labels.execution_id="{execution_id}"'
-        )
-        log = ""
-        sleep_interval = 1
-
-        while any([key not in log for key in self.log_keys]):
-            log = f"{execution_id}:"  # reset the log result
-
-            try:
-                # Retrieve the most recent logs
-                entries = self._logging_client.list_entries(
-                    filter_=filter_str, order_by=google_logging.DESCENDING
-                )
-                for entry in entries:
-                    log += f"{entry.payload}\n"
-
-            except StopIteration:
-                logger.debug("waiting for logs to be retrieved.")
-                time.sleep(15)  # wait for logs to be updated
-
-            except ResourceExhausted as e:
-                # Handling the cloud function's throttling.
-                logger.debug(e.args[0])
-                time.sleep(sleep_interval)
-                sleep_interval *= 2
-
-        return log
+        # The collector fails the execution after its max_wait_s, the margin covers its longest polling interval.
+        timeout = self._log_collector.max_wait_s + self._log_collector.polling_interval_s + GCPLogCollector.MAX_BACKOFF_S
+        return self._log_collector.submit(execution_id).result(timeout=timeout)
@@ -1,12 +1,17 @@
+import threading
 import time
 
 from google.api_core.exceptions import GoogleAPICallError
+from google.auth.transport.requests import AuthorizedSession, Request
 from google.cloud import functions_v2
 from google.cloud import logging as google_logging
+from google.oauth2 import id_token
 import requests
+from requests.adapters import HTTPAdapter
 import json
 from src.exception import *
 from src.exploration.invoker import Invoker
+from src.instrumentation import instrumentation
 from src.logger import logger
 
 
@@ -16,6 +21,8 @@ class GCPInvokerV2(Invoker):
         function_name: str,
         max_invocation_attempts: int,
         credentials: any,
+        pool_size: int = 10,
+        id_token_authentication: bool = False,
     ):
         super().__init__(function_name, max_invocation_attempts)
         self.credentials = credentials
@@ -28,12 +35,46 @@ class GCPInvokerV2(Invoker):
         self._logging_client = google_logging.Client(
             credentials=self.credentials, project=self.project_id
         )
+        self.id_token_authentication = id_token_authentication
+        # Connections are kept alive and reused by the following invocations, so only the first invocation of each
+        # connection pays the TCP and TLS handshakes. The measured duration is reported by the function itself.
+        self._session = self._create_session()
+        self._pool_size = 0
+        self._pool_size_lock = threading.Lock()
+        self.reserve_connections(pool_size)
+
+    @property
+    def pool_size(self) -> int:
+        return self._pool_size
+
+    def reserve_connections(self, nbr_connections: int) -> None:
+        """Grows the connection pool to at least @nbr_connections connections, to keep one per concurrent invocation."""
+        with self._pool_size_lock:
+            if nbr_connections > self._pool_size:
+                previous_adapter = self._session.get_adapter(self.function_url)
+                self._session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=nbr_connections))
+                self._pool_size = nbr_connections
+                # The replaced pool's connections would otherwise stay open until it's garbage collected.
+                previous_adapter.close()
+
+    def close(self) -> None:
+        """Closes the connection pool."""
+        self._session.close()
+
+    def _create_session(self) -> requests.Session:
+        if not self.id_token_authentication:
+            return requests.Session()
+
+        # The ID token's credentials are refreshed by the session before the token expires.
+        credentials = id_token.fetch_id_token_credentials(self.function_url, request=Request())
+        return AuthorizedSession(credentials)
 
     def invoke(self, payload: str) -> int:
         sleeping_interval = 1
         for _ in range(self.max_invocation_attempts):
             try:
-                response = requests.post(self.function_url, json=json.loads(payload))
+                with instrumentation.span("invocation", function=self.function_name):
+                    response = self._session.post(self.function_url, json=json.loads(payload))
                 response.raise_for_status()
                 return int(response.json()['response'] * 1000)
 
@@ -44,8 +85,10 @@ class GCPInvokerV2(Invoker):
             except Exception as e:
                 logger.debug(e)
                 logger.warning("Possibly Too Many Requests Error. Retrying...")
+                instrumentation.increment("invocation_retries")
 
-                time.sleep(sleeping_interval)
+                with instrumentation.span("invocation.backoff"):
+                    time.sleep(sleeping_interval)
                 sleeping_interval *= 2
 
         raise MaxInvocationAttemptsReachedError
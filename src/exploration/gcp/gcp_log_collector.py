@@ -0,0 +1,160 @@
+import threading
+import time
+from concurrent.futures import Future
+from datetime import datetime, timedelta, timezone
+
+from google.api_core.exceptions import GoogleAPICallError, ResourceExhausted
+from google.cloud import logging as google_logging
+
+from src.exception import InvocationError
+from src.instrumentation import instrumentation
+from src.logger import logger
+
+
+class GCPLogCollector:
+    """Collects the invocations' logs of a cloud function in the background.
+
+    The execution ids waiting for their logs are batched into a single Logging API query per polling interval, instead
+    of polling the logs of every invocation on its own. Each invocation's log is delivered through a future. The
+    executions polled the longest ago are queried first, so executions whose logs never arrive can't starve the others,
+    and they are failed after @max_wait_s seconds.
+    """
+
+    # Logs are searched from this long before the oldest waiting invocation returned, to cover its execution.
+    LOOKBACK = timedelta(minutes=10)
+    # Maximum polling interval while the Logging API is throttled.
+    MAX_BACKOFF_S = 60
+
+    def __init__(
+        self,
+        logging_client: google_logging.Client,
+        function_name: str,
+        region: str,
+        log_keys: list,
+        polling_interval_s: float = 5,
+        max_batch_size: int = 100,
+        max_wait_s: float = 300,
+    ):
+        self.logging_client = logging_client
+        self.function_name = function_name
+        self.region = region
+        self.log_keys = log_keys
+        self.polling_interval_s = polling_interval_s
+        self.max_batch_size = max_batch_size
+        self.max_wait_s = max_wait_s
+
+        # Execution id -> (future, time at which its invocation returned), from the least recently polled.
+        self._pending = {}
+        self._condition = threading.Condition()
+        self._thread = None
+        self._closed = False
+
+    def submit(self, execution_id: str) -> Future:
+        """Returns a future resolved with the log of the execution @execution_id once all its log keys are logged.
+
+        The future raises a GoogleAPICallError if the logs cannot be retrieved, or an InvocationError if they are not all
+        logged within @max_wait_s seconds.
+        """
+        future = Future()
+        with self._condition:
+            self._pending[execution_id] = (future, datetime.now(timezone.utc))
+            self._closed = False
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name=f"log-collector-{self.function_name}", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+        return future
+
+    def close(self) -> None:
+        """Stops the background collection, the logs that are still waiting are not delivered. The collection starts
+        again on the next submission."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+
+    def _run(self) -> None:
+        sleep_interval = self.polling_interval_s
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if self._closed:
+                    return
+
+            # Wait for the logs to be ingested, the invocations returning meanwhile join the batch.
+            time.sleep(sleep_interval)
+            with self._condition:
+                self._expire()
+                batch = dict(list(self._pending.items())[: self.max_batch_size])
+                # The batch is polled again after the other waiting executions.
+                for execution_id in batch:
+                    self._pending[execution_id] = self._pending.pop(execution_id)
+            if not batch:
+                continue
+
+            try:
+                logs = self._list_logs(batch)
+
+            except ResourceExhausted as e:
+                # Handling the Logging API's throttling.
+                logger.debug(e.args[0])
+                sleep_interval = min(2 * sleep_interval, self.MAX_BACKOFF_S)
+                continue
+
+            except Exception as e:
+                # Any other error fails the batch instead of the collection.
+                logger.debug(e)
+                self._fail(batch, e)
+                continue
+
+            sleep_interval = self.polling_interval_s
+            with self._condition:
+                for execution_id, log in logs.items():
+                    if execution_id in self._pending and all(key in log for key in self.log_keys):
+                        self._pending.pop(execution_id)[0].set_result(log)
+
+    def _expire(self) -> None:
+        """Fails the executions waiting for their logs for more than @max_wait_s seconds."""
+        deadline = datetime.now(timezone.utc) - timedelta(seconds=self.max_wait_s)
+        for execution_id, (future, submitted_at) in list(self._pending.items()):
+            if submitted_at < deadline:
+                del self._pending[execution_id]
+                future.set_exception(
+                    InvocationError(f"The logs of execution {execution_id} were not found after {self.max_wait_s}s.")
+                )
+
+    def _fail(self, batch: dict, error: Exception) -> None:
+        with self._condition:
+            for execution_id in batch:
+                if execution_id in self._pending:
+                    self._pending.pop(execution_id)[0].set_exception(error)
+
+    def _list_logs(self, batch: dict) -> dict:
+        """Retrieves the logs of all the executions of @batch with a single query.
+
+        Returns:
+            dict: The log of each execution, its entries from the most recent one.
+        """
+        oldest = min(submitted_at for _, submitted_at in batch.values()) - self.LOOKBACK
+        execution_ids = " OR ".join(f'labels.execution_id="{execution_id}"' for execution_id in batch)
+        filter_str = (
+            f'resource.type="cloud_function"'
+            f' AND resource.labels.function_name="{self.function_name}"'
+            f' AND resource.labels.region="{self.region}"'
+            f' AND timestamp>="{oldest.strftime("%Y-%m-%dT%H:%M:%SZ")}"'
+            f" AND ({execution_ids})"
+        )
+
+        logs = {execution_id: f"{execution_id}:" for execution_id in batch}
+        with instrumentation.span("log_collection", function=self.function_name, batch_size=len(batch)):
+            entries = self.logging_client.list_entries(
+                filter_=filter_str, order_by=google_logging.DESCENDING
+            )
+            for entry in entries:
+                execution_id = (entry.labels or {}).get("execution_id")
+                if execution_id in logs:
+                    logs[execution_id] += f"{entry.payload}\n"
+
+        return logs
@@ -0,0 +1,59 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# Maximum number of invocations in flight in the process, whatever the number of explorers.
+MAX_WORKERS = 256
+
+
+class InvocationPool:
+    """Long-lived thread pool shared by all the explorers of the process.
+
+    The explorers' rounds used to create a thread pool each, so the threads of a process tuning many functions grew
+    with the number of functions and were created again for every round. The rounds now share the pool's workers, each
+    round running at most its own concurrency of invocations at a time.
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, max_workers: int = MAX_WORKERS):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="parrotfish-invocation")
+
+    @classmethod
+    def shared(cls) -> "InvocationPool":
+        """Returns the pool shared by the process' explorers."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def submit_all(self, calls: list, max_concurrency: int) -> list:
+        """Schedules the calls @calls, at most @max_concurrency of them running at a time.
+
+        Args:
+            calls (list): The callables, called without arguments.
+            max_concurrency (int): The maximum number of calls running at the same time.
+
+        Returns:
+            list: The futures of the calls' results, in the order of @calls.
+        """
+        futures = [Future() for _ in calls]
+        pending = iter(list(zip(calls, futures)))
+        lock = threading.Lock()
+
+        def run_pending() -> None:
+            while True:
+                with lock:
+                    call, future = next(pending, (None, None))
+                if future is None:
+                    return
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    future.set_result(call())
+                except Exception as e:
+                    future.set_exception(e)
+
+        for _ in range(min(len(calls), max_concurrency)):
+            self._executor.submit(run_pending)
+        return futures
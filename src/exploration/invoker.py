@@ -24,3 +24,7 @@ class Invoker(ABC):
             or payload is wrong ...), or if the maximum number of exploration's attempts is reached.
         """
         pass
+
+    def close(self) -> None:
+        """Releases the invoker's background resources, if any."""
+        pass
@@ -25,3 +25,14 @@ class LogParser(ABC):
 
         """
         pass
+
+    def is_cold_start(self, log: str) -> bool:
+        """Tells whether the invocation's response log reports a cold start.
+
+        Args:
+            log (str): Serverless function exploration's response log to parse.
+
+        Returns:
+            bool: True if the invocation initialized a new instance, False if it didn't or if the log doesn't tell.
+        """
+        return False
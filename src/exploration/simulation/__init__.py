@@ -0,0 +1,5 @@
+from .simulated_explorer import SimulatedExplorer
+from .simulated_explorer_2d import SimulatedExplorer2D
+from .simulated_function import SimulatedFunction
+
+__all__ = ["SimulatedExplorer", "SimulatedExplorer2D", "SimulatedFunction"]
@@ -0,0 +1,28 @@
+from .simulated_function import SimulatedFunction
+from ..config_manager import ConfigManager
+from ..function_config_v2 import FunctionConfigV2
+
+
+class SimulatedConfigManager(ConfigManager):
+    def __init__(self, function: SimulatedFunction, initial_config: FunctionConfigV2 = None):
+        super().__init__(function.name)
+        self.function = function
+        self.initial_config = initial_config or FunctionConfigV2(memory_mb=128, timeout=300, cpu=None)
+
+    @property
+    def max_timeout_quota(self) -> int:
+        return 900
+
+    def set_config(self, memory_mb: int, timeout: int = None, cpu: float = None) -> dict:
+        if cpu is None and self.function.cpu is None:
+            self.function.configure(int(memory_mb))
+        else:
+            # Keep the current value of the dimension that is not reconfigured.
+            cpu = float(cpu) if cpu is not None else self.function.cpu
+            memory_mb = int(memory_mb) if memory_mb is not None else self.function.memory_mb
+            self.function.configure((cpu, memory_mb))
+
+        config = {"MemorySize": self.function.memory_mb, "Timeout": timeout or self.initial_config.timeout}
+        if self.function.cpu is not None:
+            config["CpuSize"] = self.function.cpu
+        return config
@@ -0,0 +1,34 @@
+from typing import Union
+
+import numpy as np
+
+from ..cost_calculator import CostCalculator
+
+
+class SimulatedCostCalculator(CostCalculator):
+    """Prices the simulated invocations with fixed pricing units instead of querying the cloud provider.
+
+    The invocations are priced like AWS Lambda's x86 functions, or like Cloud Run's when a vCPU size is given.
+    """
+
+    AWS_PRICING_UNITS = {"request": 2 * 10 ** (-7), "compute": 0.0000166667}
+    GCP_PRICING_UNITS = {"request": 4 * 10 ** (-7), "memory": 0.0000025, "cpu": 0.00001}
+
+    def __init__(self, function_name: str):
+        super().__init__(function_name)
+        self.pricing_units = self.AWS_PRICING_UNITS
+
+    def calculate_price(
+        self, memory_mb: Union[int, np.ndarray], duration_ms: Union[float, np.ndarray], cpu: float = None
+    ) -> Union[float, np.ndarray]:
+        allocated_memory = 1.0 / 1024 * np.asarray(memory_mb)  # convert MB to GB
+        if cpu is None:
+            request_compute_time = np.ceil(duration_ms) * 0.001  # convert ms to seconds
+            compute_charge = self.AWS_PRICING_UNITS["compute"] * allocated_memory * request_compute_time
+            return self.AWS_PRICING_UNITS["request"] + compute_charge
+
+        allocated_cpu = np.asarray(cpu) * 2400 / 1000  # convert vCPU to Ghz
+        request_compute_time = np.ceil(np.asarray(duration_ms) / 100) * 0.1  # 100 ms increments
+        memory_compute_charge = self.GCP_PRICING_UNITS["memory"] * allocated_memory * request_compute_time
+        cpu_compute_charge = self.GCP_PRICING_UNITS["cpu"] * allocated_cpu * request_compute_time
+        return self.GCP_PRICING_UNITS["request"] + memory_compute_charge + cpu_compute_charge
@@ -0,0 +1,49 @@
+from .simulated_config_manager import SimulatedConfigManager
+from .simulated_cost_calculator import SimulatedCostCalculator
+from .simulated_function import SimulatedFunction
+from .simulated_invoker import SimulatedInvoker
+from ..aws.aws_log_parser import AWSLogParser
+from ..cold_start import COLD_START_THRESHOLD, LOG
+from ..explorer import Explorer
+
+
+class SimulatedExplorer(Explorer):
+    """Explores a simulated function, as if it was an AWS Lambda function, without invoking any cloud provider.
+
+    The memory space defaults to the function's recorded memory configurations, or to AWS Lambda's memory space.
+    """
+
+    def __init__(
+        self,
+        function: SimulatedFunction,
+        payload: str = None,
+        memory_space: set = None,
+        memory_bounds: list = None,
+        cold_start_detection: str = LOG,
+        cold_start_threshold: float = COLD_START_THRESHOLD,
+    ):
+        if memory_space is None:
+            memory_space = set(function.recorded_configs or range(128, 3009))
+
+        super().__init__(
+            config_manager=SimulatedConfigManager(function),
+            invoker=SimulatedInvoker(function),
+            log_parser=AWSLogParser(),
+            price_calculator=SimulatedCostCalculator(function.name),
+            memory_space=memory_space,
+            payload=payload,
+            memory_bounds=memory_bounds,
+            cold_start_detection=cold_start_detection,
+            cold_start_threshold=cold_start_threshold,
+        )
+        self.function = function
+
+    def explore_parallel(
+        self, nbr_invocations: int, nbr_threads: int, memory_mb: int = None
+    ) -> list:
+        concurrency = self.function.concurrency
+        self.function.concurrency = nbr_threads
+        try:
+            return super().explore_parallel(nbr_invocations, nbr_threads, memory_mb)
+        finally:
+            self.function.concurrency = concurrency
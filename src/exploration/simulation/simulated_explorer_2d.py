@@ -0,0 +1,50 @@
+from .simulated_config_manager import SimulatedConfigManager
+from .simulated_cost_calculator import SimulatedCostCalculator
+from .simulated_function import SimulatedFunction
+from .simulated_invoker import SimulatedInvoker2D
+from ..cold_start import COLD_START_THRESHOLD, WARMUP
+from ..explorer_2d import Explorer2D
+from ..gcp.gcp_explorer_2d import cloud_run_cpu_mem_space
+
+
+class SimulatedExplorer2D(Explorer2D):
+    """Explores a simulated function, as if it was a Cloud Run function, without invoking any cloud provider.
+
+    The CPU-memory space defaults to the function's recorded configurations, or to Cloud Run's CPU-memory space.
+    """
+
+    def __init__(
+        self,
+        function: SimulatedFunction,
+        payload: str = None,
+        cpu_mem_space: set = None,
+        cpu_bounds: list = None,
+        memory_bounds: list = None,
+        cold_start_detection: str = WARMUP,
+        cold_start_threshold: float = COLD_START_THRESHOLD,
+    ):
+        if cpu_mem_space is None:
+            cpu_mem_space = set(function.recorded_configs or cloud_run_cpu_mem_space())
+
+        super().__init__(
+            config_manager=SimulatedConfigManager(function),
+            invoker=SimulatedInvoker2D(function),
+            price_calculator=SimulatedCostCalculator(function.name),
+            cpu_mem_space=cpu_mem_space,
+            payload=payload,
+            cpu_bounds=cpu_bounds,
+            memory_bounds=memory_bounds,
+            cold_start_detection=cold_start_detection,
+            cold_start_threshold=cold_start_threshold,
+        )
+        self.function = function
+
+    def explore_parallel(
+        self, nbr_invocations: int, nbr_threads: int, cpu: float = None, memory_mb: int = None
+    ) -> list:
+        concurrency = self.function.concurrency
+        self.function.concurrency = nbr_threads
+        try:
+            return super().explore_parallel(nbr_invocations, nbr_threads, cpu, memory_mb)
+        finally:
+            self.function.concurrency = concurrency
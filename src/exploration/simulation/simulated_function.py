@@ -0,0 +1,126 @@
+import math
+import threading
+from typing import Union
+
+import numpy as np
+
+
+class SimulatedFunction:
+    """A serverless function whose invocations' durations are drawn from a model instead of being measured.
+
+    The durations are either synthetic, drawn around the median @duration_function(config), or replayed from
+    @recorded_durations, a dict of the durations recorded with each configuration. A configuration is a memory size in
+    MB, or a (vCPU, memory size in MB) tuple for the functions of a 2D configuration space.
+
+    The simulation models:
+        - Noise: each duration is multiplied by a lognormal factor of median 1 and coefficient of variation @noise_cv.
+        - Cold starts: reconfiguring the function recycles its instances, the first invocation of each instance lasts
+          @cold_start_ms longer. The function keeps as many instances as its invocations' concurrency.
+        - ENOMEM: the function needs @memory_used_mb MB, the invocations with less memory fail.
+        - Wall time: a reconfiguration lasts @config_update_ms, and the concurrent invocations share the elapsed time.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        duration_function: callable = None,
+        recorded_durations: dict = None,
+        noise_cv: float = 0.05,
+        cold_start_ms: float = 0,
+        memory_used_mb: int = 64,
+        config_update_ms: float = 1000,
+        cpu_configurable: bool = False,
+        random_seed: int = None,
+    ):
+        if (duration_function is None) == (recorded_durations is None):
+            raise ValueError("Either a duration function or recorded durations should be provided.")
+
+        self.name = name
+        # Whether the function is configured with (vCPU, memory) tuples, inferred from the recorded configurations.
+        self.cpu_configurable = (
+            isinstance(next(iter(recorded_durations)), tuple) if recorded_durations else cpu_configurable
+        )
+        self.duration_function = duration_function
+        self.recorded_durations = (
+            {config: np.asarray(durations, dtype=float) for config, durations in recorded_durations.items()}
+            if recorded_durations is not None else None
+        )
+        self.noise_cv = noise_cv
+        self.cold_start_ms = cold_start_ms
+        self.memory_used_mb = memory_used_mb
+        self.config_update_ms = config_update_ms
+
+        self.config = None
+        # Number of invocations the function serves concurrently.
+        self.concurrency = 1
+        self.elapsed_ms = 0.0
+        self.nbr_reconfigurations = 0
+        # (memory size in MB, vCPU, billed duration in ms) of every invocation.
+        self.invocations = []
+
+        self._warm_instances = 0
+        self._rng = np.random.default_rng(random_seed)
+        self._lock = threading.Lock()
+
+    @property
+    def memory_mb(self) -> int:
+        return self.config[1] if isinstance(self.config, tuple) else self.config
+
+    @property
+    def cpu(self) -> float:
+        return self.config[0] if isinstance(self.config, tuple) else None
+
+    @property
+    def recorded_configs(self) -> list:
+        """The recorded configurations, None for synthetic functions."""
+        return list(self.recorded_durations) if self.recorded_durations is not None else None
+
+    def configure(self, config: Union[int, tuple]) -> None:
+        """Updates the function's configuration, which recycles all its instances."""
+        with self._lock:
+            self.config = config
+            self._warm_instances = 0
+            self.nbr_reconfigurations += 1
+            self.elapsed_ms += self.config_update_ms
+
+    def invoke(self) -> tuple[float, float]:
+        """Simulates an invocation with the function's current configuration.
+
+        Returns:
+            tuple[float, float]: The invocation's duration, and its initialization's duration if it was a cold start
+                (0 otherwise), in ms.
+        """
+        with self._lock:
+            init_duration_ms = 0.0
+            if self._warm_instances < self.concurrency:
+                self._warm_instances += 1
+                init_duration_ms = self.cold_start_ms
+
+            if self.recorded_durations is not None:
+                duration_ms = self._rng.choice(self.recorded_durations[self.config])
+            else:
+                duration_ms = self.duration_function(self.config)
+            if self.noise_cv:
+                sigma = math.sqrt(math.log(1 + self.noise_cv ** 2))
+                duration_ms *= self._rng.lognormal(0, sigma)
+            duration_ms = max(float(duration_ms), 1.0)
+
+            self.invocations.append((self.memory_mb, self.cpu, math.ceil(duration_ms + init_duration_ms)))
+            self.elapsed_ms += (duration_ms + init_duration_ms) / self.concurrency
+            return duration_ms, init_duration_ms
+
+    def median_durations(self, configs: list) -> np.ndarray:
+        """The median warm duration of each of the configurations @configs, in ms.
+
+        The configurations lacking the memory the function needs have an infinite duration.
+        """
+        durations = np.empty(len(configs), dtype=float)
+        for i, config in enumerate(configs):
+            memory_mb = config[1] if isinstance(config, tuple) else config
+            if memory_mb < self.memory_used_mb:
+                durations[i] = math.inf
+            elif self.recorded_durations is not None:
+                durations[i] = np.median(self.recorded_durations[config])
+            else:
+                durations[i] = self.duration_function(config)
+        return durations
@@ -0,0 +1,49 @@
+import math
+import uuid
+
+from src.exception import FunctionENOMEM
+from .simulated_function import SimulatedFunction
+from ..invoker import Invoker
+
+
+class SimulatedInvoker(Invoker):
+    """Invokes a simulated function and returns an AWS Lambda REPORT log, to be parsed by the AWSLogParser."""
+
+    def __init__(self, function: SimulatedFunction):
+        super().__init__(function.name, max_invocation_attempts=1)
+        self.function = function
+
+    def invoke(self, payload: str) -> str:
+        duration_ms, init_duration_ms = self.function.invoke()
+        memory_size = self.function.memory_mb
+        # A function running out of memory reports using more memory than it is configured with.
+        max_memory_used = self.function.memory_used_mb
+
+        request_id = uuid.uuid4()
+        log = (
+            f"START RequestId: {request_id} Version: $LATEST\n"
+            f"END RequestId: {request_id}\n"
+            f"REPORT RequestId: {request_id}\tDuration: {duration_ms:.2f} ms"
+            f"\tBilled Duration: {math.ceil(duration_ms + init_duration_ms)} ms"
+            f"\tMemory Size: {memory_size} MB\tMax Memory Used: {max_memory_used} MB\t"
+        )
+        if init_duration_ms:
+            log += f"Init Duration: {init_duration_ms:.2f} ms\t"
+        return log
+
+
+class SimulatedInvoker2D(Invoker):
+    """Invokes a simulated function and returns its duration in ms, like the Cloud Run invoker."""
+
+    def __init__(self, function: SimulatedFunction):
+        super().__init__(function.name, max_invocation_attempts=1)
+        self.function = function
+
+    def invoke(self, payload: str) -> int:
+        duration_ms, init_duration_ms = self.function.invoke()
+        duration_ms = math.ceil(duration_ms + init_duration_ms)
+
+        if self.function.memory_mb < self.function.memory_used_mb:
+            raise FunctionENOMEM(duration_ms=duration_ms)
+
+        return duration_ms
@@ -0,0 +1,65 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from src.configuration.fleet_configuration import FleetConfiguration
+from src.exploration.aws.aws_rate_limiter import AWSRateLimiter
+from src.logger import logger
+from src.parrotfish import Parrotfish
+
+
+class Fleet:
+    """Optimizes the functions of a fleet manifest concurrently, under the manifest's global limits."""
+
+    def __init__(self, config: FleetConfiguration):
+        self.config = config
+        # The error of each function of the manifest whose optimization failed, set by optimize.
+        self.errors = {}
+
+        # The explorers pick up their region's limiter when they are created.
+        for region, limits in config.rate_limits.items():
+            AWSRateLimiter.configure(region, **limits)
+
+    def optimize(self, apply: bool = None) -> list:
+        """Optimizes all the functions of the manifest.
+
+        Args:
+            apply (bool, optional): Whether to apply the optimized configurations.
+
+        Returns:
+            list: The optimized configuration of each function of the manifest, None for the functions whose
+                optimization failed, their errors are in errors.
+
+        At most max_concurrent_functions functions are optimized at the same time. The entries targeting the same
+        function are optimized one after the other, since they reconfigure the same function.
+        """
+        groups = {}
+        for index, function_config in enumerate(self.config.functions):
+            key = (function_config.vendor, function_config.region, function_config.function_name)
+            groups.setdefault(key, []).append(index)
+
+        self.errors = {}
+        results = [None] * len(self.config.functions)
+        with ThreadPoolExecutor(max_workers=self.config.max_concurrent_functions) as executor:
+            futures = [executor.submit(self._optimize_functions, indices, apply) for indices in groups.values()]
+            for future in as_completed(futures):
+                for index, result in future.result().items():
+                    results[index] = result
+
+        failures = sum(result is None for result in results)
+        logger.info(f"Fleet optimized: {len(results) - failures} functions, {failures} failures")
+        return results
+
+    def _optimize_functions(self, indices: list, apply: bool) -> dict:
+        """Optimizes the manifest's functions @indices one after the other, failures are logged and skipped."""
+        results = {}
+        for index in indices:
+            function_config = self.config.functions[index]
+            try:
+                results[index] = Parrotfish(function_config).optimize(apply)
+
+            # The functions' initializations exit on fatal errors, e.g. missing credentials, which mustn't stop the fleet.
+            except (Exception, SystemExit) as e:
+                logger.error(f"Error optimizing function {function_config.function_name}: {e}")
+                results[index] = None
+                self.errors[index] = e
+
+        return results
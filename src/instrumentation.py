@@ -0,0 +1,202 @@
+import functools
+import json
+import os
+import threading
+import time
+
+# Maximum number of trace events kept in memory, the following ones are dropped.
+MAX_TRACE_EVENTS = 1_000_000
+
+
+class _Span:
+    """Measures the time spent in its context and records it on exit."""
+
+    __slots__ = ("_instrumentation", "_name", "_attributes", "_start_ns")
+
+    def __init__(self, instrumentation: "Instrumentation", name: str, attributes: dict):
+        self._instrumentation = instrumentation
+        self._name = name
+        self._attributes = attributes
+
+    def __enter__(self):
+        self._start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._instrumentation.record_span(self._name, self._start_ns, time.perf_counter_ns(), self._attributes)
+        return False
+
+
+class Instrumentation:
+    """Spans and counters of a run, aggregated in memory.
+
+    A span measures the time spent in a named operation, e.g. the configuration updates or the invocations, and is
+    aggregated into its name's count, total and maximum durations. A counter counts named events, e.g. the retries.
+    Recording is a lock acquisition and a few additions, so the instrumentation stays enabled by default. When tracing
+    is started, every span is also kept as a trace event, to be written in the Trace Event Format (viewable with
+    Perfetto or chrome://tracing).
+    """
+
+    def __init__(self):
+        self.enabled = True
+        self._lock = threading.Lock()
+        # Span name -> [count, total duration in ns, max duration in ns].
+        self._spans = {}
+        self._counters = {}
+        self._trace_events = None
+        self._dropped_trace_events = 0
+        self._start_ns = time.perf_counter_ns()
+
+    def span(self, name: str, **attributes) -> _Span:
+        """Returns a context manager measuring the time spent in the operation @name.
+
+        Args:
+            name (str): The operation's name.
+            **attributes: Attributes of the operation, only kept in the trace events.
+        """
+        return _Span(self, name, attributes)
+
+    def timed(self, name: str) -> callable:
+        """Decorator measuring the time spent in each call of the decorated function as the span @name."""
+
+        def decorator(function: callable) -> callable:
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                with self.span(name):
+                    return function(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def increment(self, name: str, value: float = 1) -> None:
+        """Increments the counter @name by @value."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def record_span(self, name: str, start_ns: int, end_ns: int, attributes: dict = None) -> None:
+        """Records the span @name that lasted from @start_ns to @end_ns, as returned by time.perf_counter_ns."""
+        if not self.enabled:
+            return
+        duration_ns = end_ns - start_ns
+        with self._lock:
+            stats = self._spans.get(name)
+            if stats is None:
+                self._spans[name] = [1, duration_ns, duration_ns]
+            else:
+                stats[0] += 1
+                stats[1] += duration_ns
+                stats[2] = max(stats[2], duration_ns)
+
+            if self._trace_events is not None:
+                if len(self._trace_events) < MAX_TRACE_EVENTS:
+                    self._trace_events.append((name, start_ns, duration_ns, threading.get_ident(), attributes))
+                else:
+                    self._dropped_trace_events += 1
+
+    def start_tracing(self) -> None:
+        """Keeps the following spans as trace events."""
+        with self._lock:
+            self._trace_events = []
+            self._dropped_trace_events = 0
+
+    def reset(self) -> None:
+        """Clears the spans, counters and trace events, and restarts the run's clock."""
+        with self._lock:
+            self._spans = {}
+            self._counters = {}
+            if self._trace_events is not None:
+                self._trace_events = []
+            self._dropped_trace_events = 0
+            self._start_ns = time.perf_counter_ns()
+
+    def report(self) -> dict:
+        """Returns the run's timing breakdown.
+
+        Returns:
+            dict: The run's wall time, the count, total, mean and maximum durations of each span in seconds, and the
+                value of each counter.
+        """
+        with self._lock:
+            spans = {name: list(stats) for name, stats in self._spans.items()}
+            counters = dict(self._counters)
+            wall_time_ns = time.perf_counter_ns() - self._start_ns
+
+        return {
+            "wall_time_s": wall_time_ns / 1e9,
+            "spans": {
+                name: {
+                    "count": count,
+                    "total_s": total_ns / 1e9,
+                    "mean_s": total_ns / count / 1e9,
+                    "max_s": max_ns / 1e9,
+                }
+                for name, (count, total_ns, max_ns) in sorted(spans.items())
+            },
+            "counters": dict(sorted(counters.items())),
+        }
+
+    def to_prometheus(self) -> str:
+        """Returns the run's timing breakdown in the Prometheus text exposition format."""
+        report = self.report()
+        lines = [
+            "# HELP parrotfish_wall_time_seconds Wall time of the run.",
+            "# TYPE parrotfish_wall_time_seconds gauge",
+            f"parrotfish_wall_time_seconds {report['wall_time_s']}",
+        ]
+        for metric, key, kind, description in [
+            ("parrotfish_span_seconds_total", "total_s", "counter", "Time spent in the operation."),
+            ("parrotfish_span_count_total", "count", "counter", "Number of times the operation was performed."),
+            ("parrotfish_span_max_seconds", "max_s", "gauge", "Longest duration of the operation."),
+        ]:
+            lines += [f"# HELP {metric} {description}", f"# TYPE {metric} {kind}"]
+            lines += [f'{metric}{{span="{name}"}} {stats[key]}' for name, stats in report["spans"].items()]
+
+        lines += [
+            "# HELP parrotfish_events_total Number of times the event occurred.",
+            "# TYPE parrotfish_events_total counter",
+        ]
+        lines += [f'parrotfish_events_total{{event="{name}"}} {value}' for name, value in report["counters"].items()]
+        return "\n".join(lines) + "\n"
+
+    def write_report(self, path: str) -> None:
+        """Writes the run's timing breakdown to @path, in the Prometheus text format if the file's extension is .prom
+        or .txt, in JSON otherwise."""
+        if os.path.splitext(path)[1] in (".prom", ".txt"):
+            content = self.to_prometheus()
+        else:
+            content = json.dumps(self.report(), indent=4)
+        with open(path, "w") as file:
+            file.write(content)
+
+    def write_trace(self, path: str) -> None:
+        """Writes the trace events to @path in the Trace Event Format."""
+        with self._lock:
+            events = list(self._trace_events or [])
+            dropped = self._dropped_trace_events
+            start_ns = self._start_ns
+
+        pid = os.getpid()
+        trace = {
+            "traceEvents": [
+                {
+                    "name": name,
+                    "ph": "X",
+                    "ts": (event_start_ns - start_ns) / 1000,
+                    "dur": duration_ns / 1000,
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {key: str(value) for key, value in (attributes or {}).items()},
+                }
+                for name, event_start_ns, duration_ns, tid, attributes in events
+            ],
+            "displayTimeUnit": "ms",
+            "otherData": {"dropped_events": dropped},
+        }
+        with open(path, "w") as file:
+            json.dump(trace, file)
+
+
+instrumentation = Instrumentation()
@@ -3,8 +3,11 @@ import logging
 import os
 
 from src.configuration import Configuration
+from src.configuration.fleet_configuration import FleetConfiguration
 from src.configuration.step_function_configuration import StepFunctionConfiguration
 from src.exception import OptimizationError
+from src.fleet import Fleet
+from src.instrumentation import instrumentation
 from src.logger import logger
 from src.parrotfish import Parrotfish
 from src.step_function.step_function import StepFunction
@@ -26,6 +29,18 @@ def main():
     parser.add_argument(
         "--step-function", action="store_true", help="Optimize a step function"
     )
+    parser.add_argument(
+        "--fleet", action="store_true", help="Optimize the functions of a fleet manifest"
+    )
+    parser.add_argument(
+        "--metrics", type=str, help="Write the run's timing breakdown (Prometheus text if .prom or .txt, JSON otherwise)"
+    )
+    parser.add_argument(
+        "--trace", type=str, help="Write a trace of the run in the Trace Event Format"
+    )
+    parser.add_argument(
+        "--pareto", type=str, help="Write the cost vs execution time Pareto frontier of each payload's fitted function"
+    )
 
     args = parser.parse_args()
 
@@ -41,6 +56,8 @@ def main():
         with open(config_file_path) as config_file:
             if args.step_function:
                 configuration = StepFunctionConfiguration(config_file)
+            elif args.fleet:
+                configuration = FleetConfiguration(config_file)
             else:
                 configuration = Configuration(config_file)
 
@@ -52,19 +69,62 @@ def main():
         logger.critical(f"No configuration file is found in {config_file_path}")
         exit(1)
 
-    if args.step_function:
-        # Create step function
-        step_function = StepFunction(configuration)
+    instrumentation.reset()
+    if args.trace:
+        instrumentation.start_tracing()
+
+    try:
+        if args.step_function:
+            # Create step function
+            step_function = StepFunction(configuration)
+
+            # Run cost and execution time optimization
+            step_function.optimize()
+
+        elif args.fleet:
+            fleet = Fleet(configuration)
+            results = fleet.optimize(args.apply)
+            _print_fleet_results(configuration, results, fleet.errors)
+
+            failures = sum(result is None for result in results)
+            if failures:
+                logger.critical(f"Failed to optimize {failures} functions of the fleet.")
+                exit(1)
+
+        else:
+            parrotfish = Parrotfish(configuration)
+
+            try:
+                parrotfish.optimize(args.apply)
+                if args.pareto:
+                    parrotfish.write_pareto_frontiers(args.pareto)
+
+            except OptimizationError as e:
+                logger.critical(e)
+                exit(1)
+
+    finally:
+        _export_instrumentation(args.metrics, args.trace)
+
 
-        # Run cost and execution time optimization
-        step_function.optimize()
+def _print_fleet_results(configuration: FleetConfiguration, results: list, errors: dict) -> None:
+    """Prints the optimized configuration, or the error, of each function of the fleet."""
+    print("Fleet optimization results:")
+    for index, (function_config, result) in enumerate(zip(configuration.functions, results)):
+        if result is None:
+            print(f"{function_config.function_name}: failed, {errors.get(index)}")
+        elif function_config.vendor == "GCPv2":
+            print(f"{function_config.function_name}: {result[0]} vCPU, {result[1]} MB")
+        else:
+            print(f"{function_config.function_name}: {result} MB")
 
-    else:
-        parrotfish = Parrotfish(configuration)
 
-        try:
-            parrotfish.optimize(args.apply)
+def _export_instrumentation(metrics_path: str, trace_path: str) -> None:
+    """Writes the run's timing breakdown and trace, if requested."""
+    if metrics_path:
+        instrumentation.write_report(metrics_path)
+    if trace_path:
+        instrumentation.write_trace(trace_path)
 
-        except OptimizationError as e:
-            logger.critical(e)
-            exit(1)
+    for name, stats in instrumentation.report()["spans"].items():
+        logger.info(f"{name}: {stats['count']} times, {stats['total_s']:.3f}s in total")
@@ -0,0 +1,64 @@
+import numpy as np
+
+from src.exception import UnfeasibleConstraintError
+from src.logger import logger
+
+
+def find_min_indices(
+    costs: np.ndarray,
+    execution_times: np.ndarray,
+    constraint_execution_time_thresholds: np.ndarray,
+    constraint_cost_tolerance_percents: np.ndarray,
+) -> np.ndarray:
+    """Finds the configuration minimizing the cost under each pair of constraints, in a single vectorized pass.
+
+    Args:
+        costs (np.ndarray): The cost of each configuration.
+        execution_times (np.ndarray): The execution time of each configuration.
+        constraint_execution_time_thresholds (np.ndarray): The execution time threshold constraint of each query.
+            NaN or 0 means no constraint.
+        constraint_cost_tolerance_percents (np.ndarray): The cost tolerance window constraint of each query.
+            NaN or 0 means no constraint.
+
+    Returns:
+        np.ndarray: The index of the configuration that answers each query.
+
+    For each query, only the configurations within the execution time threshold are considered. If none of them is,
+    the threshold is ignored. Among the considered configurations, the one with the lowest execution time whose cost is
+    within the tolerance window of the minimum cost is returned, or the minimum cost one if there is no tolerance.
+    """
+    thresholds = np.nan_to_num(np.asarray(constraint_execution_time_thresholds, dtype=float), nan=0.0)
+    tolerances = np.nan_to_num(np.asarray(constraint_cost_tolerance_percents, dtype=float), nan=0.0)
+
+    # Handling execution threshold constraint
+    feasible = (thresholds[:, None] == 0) | (execution_times[None, :] <= thresholds[:, None])
+    unfeasible_queries = ~feasible.any(axis=1)
+    if unfeasible_queries.any():
+        logger.warning(UnfeasibleConstraintError())
+        feasible[unfeasible_queries] = True
+
+    # Handling cost tolerance constraint
+    feasible_costs = np.where(feasible, costs[None, :], np.inf)
+    min_costs = feasible_costs.min(axis=1, keepdims=True)
+    within_tolerance = feasible_costs <= min_costs + tolerances[:, None] / 100 * min_costs
+    tolerance_indices = np.argmin(np.where(within_tolerance, execution_times[None, :], np.inf), axis=1)
+
+    return np.where(tolerances != 0, tolerance_indices, np.argmin(feasible_costs, axis=1))
+
+
+def find_pareto_indices(costs: np.ndarray, execution_times: np.ndarray) -> np.ndarray:
+    """Finds the configurations on the cost vs execution time Pareto frontier, in a single vectorized pass.
+
+    Args:
+        costs (np.ndarray): The cost of each configuration.
+        execution_times (np.ndarray): The execution time of each configuration.
+
+    Returns:
+        np.ndarray: The indices of the configurations that no other configuration beats on both cost and execution
+            time, by increasing cost and decreasing execution time.
+    """
+    order = np.lexsort((execution_times, costs))
+    sorted_execution_times = execution_times[order]
+    # A configuration is dominated if a cheaper one is at least as fast.
+    best_previous_times = np.minimum.accumulate(np.concatenate(([np.inf], sorted_execution_times[:-1])))
+    return order[sorted_execution_times < best_previous_times]
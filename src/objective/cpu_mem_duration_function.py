@@ -3,9 +3,9 @@ from dataclasses import dataclass
 import numpy as np
 from scipy.optimize import curve_fit
 
-from src.exception import UnfeasibleConstraintError
-from src.logger import logger
+from src.instrumentation import instrumentation
 from src.sampling import Sample2D
+from .constraints import find_min_indices, find_pareto_indices
 from typing import Union
 
 @dataclass
@@ -25,6 +25,7 @@ class CpuMemDurationFunction:
     def __call__(self, cpu_mem: tuple[Union[int, np.ndarray]]):
         return self.function(cpu_mem, *self.params)
 
+    @instrumentation.timed("fitting")
     def fit(self, sample: Sample2D) -> None:
         """Use non-linear least squares to fit a function to the sample.
         Optimize the parameters values so that the sum of the squared residuals is minimized.
@@ -61,54 +62,42 @@ class CpuMemDurationFunction:
         Returns:
             int: Memory configuration that minimizes the cost function.
         """
-        costs = self.__call__((cpu_mem_space[:, 0], cpu_mem_space[:, 1])) * (cpu_mem_space[:, 0] * 0.00002400 + cpu_mem_space[:, 1] * 0.00000250 / 1024)
+        return self.minimize_batch(
+            cpu_mem_space, [constraint_execution_time_threshold], [constraint_cost_tolerance_percent]
+        )[0]
 
-        # Handling execution threshold constraint
-        if constraint_execution_time_threshold:
-            try:
-                cpu_mem_space, costs = self._filter_execution_time_constraint(
-                    cpu_mem_space, costs, constraint_execution_time_threshold
-                )
-            except UnfeasibleConstraintError as e:
-                logger.warning(e)
-
-        if constraint_cost_tolerance_percent:
-            execution_times = costs / (cpu_mem_space[:, 0] + cpu_mem_space[:, 1])
-            min_index = self._find_min_index_within_tolerance(costs, execution_times, constraint_cost_tolerance_percent)
-        else:
-            min_index = np.argmin(costs)
-        return cpu_mem_space[min_index]
-
-    @staticmethod
-    def _find_min_index_within_tolerance(costs: np.ndarray, execution_times: np.ndarray,
-                                         constraint_cost_tolerance_percent: int) -> int:
-        min_cost = np.min(costs)
-        min_cost_tolerance_window = min_cost + constraint_cost_tolerance_percent / 100 * min_cost
-        min_index = 0
-        min_execution_time = np.inf
-        for i in range(len(execution_times)):
-            if costs[i] <= min_cost_tolerance_window:
-                if execution_times[i] < min_execution_time:
-                    min_index = i
-                    min_execution_time = execution_times[i]
-        return min_index
-
-    @staticmethod
-    def _filter_execution_time_constraint(
-            cpu_mem_space: np.ndarray,
-            costs: np.ndarray,
-            constraint_execution_time_threshold: int = None,
-    ) -> tuple:
-        filtered_cpu_mems = np.array([])
-        filtered_costs = np.array([])
+    def minimize_batch(
+            self, cpu_mem_space: np.ndarray, constraint_execution_time_thresholds: list,
+            constraint_cost_tolerance_percents: list
+    ) -> np.ndarray:
+        """Minimizes the cost function under several pairs of constraints using a single evaluation of the function.
+
+        Args:
+            cpu_mem_space (np.ndarray): The cpu-memory space specific to the cloud provider.
+            constraint_execution_time_thresholds (list): The execution time threshold constraint of each query.
+            constraint_cost_tolerance_percents (list): The cost tolerance window constraint of each query.
+
+        Returns:
+            np.ndarray: The cpu-memory configuration that minimizes the cost function for each query.
+        """
+        costs = self.__call__((cpu_mem_space[:, 0], cpu_mem_space[:, 1])) * (cpu_mem_space[:, 0] * 0.00002400 + cpu_mem_space[:, 1] * 0.00000250 / 1024)
         execution_times = costs / (cpu_mem_space[:, 0] + cpu_mem_space[:, 1])
+        thresholds = np.array(constraint_execution_time_thresholds, dtype=float)
+        tolerances = np.array(constraint_cost_tolerance_percents, dtype=float)
+        return cpu_mem_space[find_min_indices(costs, execution_times, thresholds, tolerances)]
 
-        for i in range(len(execution_times)):
-            if execution_times[i] <= constraint_execution_time_threshold:
-                filtered_cpu_mems = np.append(filtered_cpu_mems, cpu_mem_space[i])
-                filtered_costs = np.append(filtered_costs, costs[i])
+    def pareto_frontier(self, cpu_mem_space: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Computes the cost vs execution time Pareto frontier of the fitted function.
 
-        if len(filtered_cpu_mems) == 0:
-            raise UnfeasibleConstraintError()
+        Args:
+            cpu_mem_space (np.ndarray): The cpu-memory space specific to the cloud provider.
 
-        return filtered_cpu_mems, filtered_costs
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: The cpu-memory configurations on the frontier, their costs and
+                their execution times, by increasing cost and decreasing execution time.
+        """
+        cpu_mem_space = np.asarray(cpu_mem_space)
+        execution_times = self.__call__((cpu_mem_space[:, 0], cpu_mem_space[:, 1])) * np.ones(len(cpu_mem_space))
+        costs = execution_times * (cpu_mem_space[:, 0] * 0.00002400 + cpu_mem_space[:, 1] * 0.00000250 / 1024)
+        indices = find_pareto_indices(costs, execution_times)
+        return cpu_mem_space[indices], costs[indices], execution_times[indices]
@@ -3,28 +3,44 @@ from dataclasses import dataclass
 import numpy as np
 from scipy.optimize import curve_fit
 
-from src.exception import UnfeasibleConstraintError
+from src.instrumentation import instrumentation
 from src.logger import logger
 from src.sampling import Sample
+from .constraints import find_min_indices, find_pareto_indices
 from typing import Union
 
+
+def _jacobian(x: np.ndarray, a0: float, a1: float, a2: float) -> np.ndarray:
+    """Analytic jacobian of a0 + a1 * exp(-x / a2) with respect to its parameters."""
+    x = np.asarray(x, dtype=float)
+    if a2 == 0:
+        return np.column_stack([np.ones_like(x), np.zeros_like(x), np.zeros_like(x)])
+    exp = np.exp(-x / a2)
+    return np.column_stack([np.ones_like(x), exp, a1 * exp * x / a2**2])
+
+
 @dataclass
 class ParametricFunction:
     """Class for keeping track of the parametric function.
 
     Attributes:
         function (callable): the function we want to fit to the sample.
+        jacobian (callable): the jacobian of the function with respect to its parameters.
         params (np.array): parameters of the function.
         bounds (tuple): Lower and upper bounds on parameters.
+        max_function_evaluations (int): Maximum number of function evaluations per fitting attempt.
     """
 
     function: callable = lambda x, a0, a1, a2: (a0 + a1 * np.exp(-x / a2)) if a2 != 0 else a0
+    jacobian: callable = _jacobian
     bounds: tuple = ([-np.inf, -np.inf, -np.inf], [np.inf, np.inf, np.inf])
     params: any = None
+    max_function_evaluations: int = 1000
 
     def __call__(self, x: Union[int, np.ndarray]):
         return self.function(x, *self.params)
 
+    @instrumentation.timed("fitting")
     def fit(self, sample: Sample) -> None:
         """Use non-linear least squares to fit a function to the sample.
         Optimize the parameters values so that the sum of the squared residuals is minimized.
@@ -34,18 +50,37 @@ class ParametricFunction:
 
         Raises:
             RuntimeError: if least-squares minimization fails.
+
+        The fitting is warm-started from the previous parameters and uses the analytic jacobian. If it doesn't converge
+        within the evaluations budget, it is retried once with a robust loss that is less sensitive to outliers.
         """
         if self.params is None:
             self.params = [sample.durations[0] // 10] * 3
 
-        self.params = curve_fit(
-            f=self.function,
-            xdata=sample.memories,
-            ydata=sample.durations,
-            maxfev=int(1e8),
-            p0=self.params,
-            bounds=self.bounds,
-        )[0]
+        try:
+            self.params = curve_fit(
+                f=self.function,
+                xdata=sample.memories,
+                ydata=sample.durations,
+                maxfev=self.max_function_evaluations,
+                p0=self.params,
+                bounds=self.bounds,
+                jac=self.jacobian,
+            )[0]
+
+        except RuntimeError as e:
+            logger.debug(f"Fitting failed, retrying with a robust loss: {e.args[0]}")
+            self.params = curve_fit(
+                f=self.function,
+                xdata=sample.memories,
+                ydata=sample.durations,
+                maxfev=self.max_function_evaluations,
+                p0=self.params,
+                bounds=self.bounds,
+                jac=self.jacobian,
+                method="trf",
+                loss="soft_l1",
+            )[0]
 
     def minimize(
             self, memory_space: np.ndarray, constraint_execution_time_threshold: int = None,
@@ -61,54 +96,42 @@ class ParametricFunction:
         Returns:
             int: Memory configuration that minimizes the cost function.
         """
-        costs = self.__call__(memory_space) * memory_space
+        return self.minimize_batch(
+            memory_space, [constraint_execution_time_threshold], [constraint_cost_tolerance_percent]
+        )[0]
+
+    def minimize_batch(
+            self, memory_space: np.ndarray, constraint_execution_time_thresholds: list,
+            constraint_cost_tolerance_percents: list
+    ) -> np.ndarray:
+        """Minimizes the cost function under several pairs of constraints using a single evaluation of the function.
+
+        Args:
+            memory_space (np.ndarray): The memory space specific to the cloud provider.
+            constraint_execution_time_thresholds (list): The execution time threshold constraint of each query.
+            constraint_cost_tolerance_percents (list): The cost tolerance window constraint of each query.
 
-        # Handling execution threshold constraint
-        if constraint_execution_time_threshold:
-            try:
-                memory_space, costs = self._filter_execution_time_constraint(
-                    memory_space, costs, constraint_execution_time_threshold
-                )
-            except UnfeasibleConstraintError as e:
-                logger.warning(e)
-
-        if constraint_cost_tolerance_percent:
-            execution_times = costs / memory_space
-            min_index = self._find_min_index_within_tolerance(costs, execution_times, constraint_cost_tolerance_percent)
-        else:
-            min_index = np.argmin(costs)
-        return memory_space[min_index]
-
-    @staticmethod
-    def _find_min_index_within_tolerance(costs: np.ndarray, execution_times: np.ndarray,
-                                         constraint_cost_tolerance_percent: int) -> int:
-        min_cost = np.min(costs)
-        min_cost_tolerance_window = min_cost + constraint_cost_tolerance_percent / 100 * min_cost
-        min_index = 0
-        min_execution_time = np.inf
-        for i in range(len(execution_times)):
-            if costs[i] <= min_cost_tolerance_window:
-                if execution_times[i] < min_execution_time:
-                    min_index = i
-                    min_execution_time = execution_times[i]
-        return min_index
-
-    @staticmethod
-    def _filter_execution_time_constraint(
-            memory_space: np.ndarray,
-            costs: np.ndarray,
-            constraint_execution_time_threshold: int = None,
-    ) -> tuple:
-        filtered_memories = np.array([])
-        filtered_costs = np.array([])
+        Returns:
+            np.ndarray: The memory configuration that minimizes the cost function for each query.
+        """
+        costs = self.__call__(memory_space) * memory_space
         execution_times = costs / memory_space
+        thresholds = np.array(constraint_execution_time_thresholds, dtype=float)
+        tolerances = np.array(constraint_cost_tolerance_percents, dtype=float)
+        return memory_space[find_min_indices(costs, execution_times, thresholds, tolerances)]
 
-        for i in range(len(execution_times)):
-            if execution_times[i] <= constraint_execution_time_threshold:
-                filtered_memories = np.append(filtered_memories, memory_space[i])
-                filtered_costs = np.append(filtered_costs, costs[i])
+    def pareto_frontier(self, memory_space: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Computes the cost vs execution time Pareto frontier of the fitted function.
 
-        if len(filtered_memories) == 0:
-            raise UnfeasibleConstraintError()
+        Args:
+            memory_space (np.ndarray): The memory space specific to the cloud provider.
 
-        return filtered_memories, filtered_costs
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: The memory configurations on the frontier, their costs and their
+                execution times, by increasing cost and decreasing execution time.
+        """
+        memory_space = np.asarray(memory_space)
+        execution_times = self.__call__(memory_space) * np.ones(len(memory_space))
+        costs = execution_times * memory_space
+        indices = find_pareto_indices(costs, execution_times)
+        return memory_space[indices], costs[indices], execution_times[indices]
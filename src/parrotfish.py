@@ -1,10 +1,12 @@
 from typing import Union
 import copy
+import json
 
 import boto3
 import numpy as np
 from google.auth import default, exceptions
 
+from src.configuration.defaults import BAYESIAN_PARAMS
 from src.exploration import *
 from src.logger import logger
 from src.objective import *
@@ -22,6 +24,9 @@ class Parrotfish:
                 max_invocation_attempts=config.max_number_of_invocation_attempts,
                 memory_bounds=config.memory_bounds,
                 aws_session=boto3.Session(region_name=config.region),
+                concurrent_exploration=config.concurrent_exploration,
+                cold_start_detection=config.cold_start_detection,
+                cold_start_threshold=config.cold_start_threshold,
             )
         elif config.vendor == "GCP":
             try:
@@ -37,6 +42,8 @@ class Parrotfish:
                 max_invocation_attempts=config.max_number_of_invocation_attempts,
                 memory_bounds=config.memory_bounds,
                 credentials=credentials,
+                cold_start_detection=config.cold_start_detection,
+                cold_start_threshold=config.cold_start_threshold,
             )
         else:
             try:
@@ -53,10 +60,15 @@ class Parrotfish:
                 memory_bounds=config.memory_bounds,
                 credentials=credentials,
                 cpu_bounds=config.cpu_bounds,
+                id_token_authentication=config.id_token_authentication,
+                cold_start_detection=config.cold_start_detection,
+                cold_start_threshold=config.cold_start_threshold,
             )
 
         self.param_function = ParametricFunction()
         self.cpu_mem_duration_function = CpuMemDurationFunction()
+        # The fitted function of each payload, set by optimize.
+        self.fitted_functions = []
 
         self.objective = Objective(
             param_function=self.param_function,
@@ -68,38 +80,61 @@ class Parrotfish:
             termination_threshold=config.termination_threshold,
         )
 
+        self.sample_store = SampleStore(
+            path=config.sample_store_path,
+            max_age_hours=config.sample_store_max_age_hours,
+        ) if config.sample_store_path else None
+
         self.sampler = Sampler(
             explorer=self.explorer,
             explorations_count=config.min_sample_per_config,
             dynamic_sampling_params=config.dynamic_sampling_params,
+            sample_store=self.sample_store,
         ) if config.vendor != 'GCPv2' else Sampler2D(
             explorer=self.explorer,
             explorations_count=config.min_sample_per_config,
             dynamic_sampling_params=config.dynamic_sampling_params,
         )
 
-        self.recommender = Recommender(
-            objective=self.objective,
-            sampler=self.sampler,
-            max_total_sample_count=config.max_total_sample_count,
+        self.recommender = self._create_recommender(
+            self.objective, self.sampler
         ) if config.vendor != 'GCPv2' else Recommender2D(
             objective=self.objective,
             sampler=self.sampler,
             max_total_sample_count=config.max_total_sample_count,
         )
 
-    def optimize(self, apply: bool = None) -> int:
+    def optimize(self, apply: bool = None) -> Union[int, list]:
+        try:
+            return self._optimize(apply)
+        finally:
+            # The exploration's published configurations are deleted whether it's applied, reset or failed.
+            self.explorer.config_manager.delete_published_configs()
+            self.explorer.invoker.close()
+
+    def _optimize(self, apply: bool = None) -> Union[int, list]:
+        self.fitted_functions = []
         collective_costs = np.zeros(len(self.explorer.memory_space)) if self.config.vendor != 'GCPv2' else np.zeros(len(self.explorer.cpu_mem_space))
         min_configs = []
         i = 1
 
-        for entry in self.config.payloads:
-            if len(self.config.payloads) != 1:
-                print(f"Explorations for payload {i}:")
-                i += 1
-            # Run recommender for the specific payload
-            min_config, _ = self.optimize_one_payload(entry, collective_costs)
-            min_configs.append(min_config)
+        if self.config.concurrent_payloads and len(self.config.payloads) > 1 and self.config.vendor != 'GCPv2':
+            results = self.optimize_payloads_concurrently(self.config.payloads, collective_costs)
+            min_configs = [min_config for min_config, _ in results]
+            self.fitted_functions = [fitted_function for _, fitted_function in results]
+
+        else:
+            if self.config.concurrent_payloads and self.config.vendor == 'GCPv2':
+                logger.warning("Concurrent payloads optimization is not supported by GCPv2, optimizing sequentially.")
+
+            for entry in self.config.payloads:
+                if len(self.config.payloads) != 1:
+                    print(f"Explorations for payload {i}:")
+                    i += 1
+                # Run recommender for the specific payload
+                min_config, fitted_function = self.optimize_one_payload(entry, collective_costs)
+                min_configs.append(min_config)
+                self.fitted_functions.append(fitted_function)
 
         if len(min_configs) == 1:
             minimum_config = min_configs[0]
@@ -116,6 +151,8 @@ class Parrotfish:
         else:
             self.explorer.config_manager.reset_config()
 
+        return minimum_config
+
     def optimize_one_payload(self, entry: dict, collective_costs: np.ndarray) -> tuple[Union[int, list], Union[ParametricFunction, CpuMemDurationFunction]]:
         self.explorer.payload = entry["payload"]
         self.objective.reset()
@@ -133,8 +170,96 @@ class Parrotfish:
             [min_cpu, min_mem] = self.cpu_mem_duration_function.minimize(
                 self.explorer.cpu_mem_space, self.config.constraint_execution_time_threshold, self.config.constraint_cost_tolerance_percent
             )
+        # Copied before the reset, which clears the fitted parameters.
+        result = (minimum_memory, copy.copy(self.param_function)) if self.config.vendor != 'GCPv2' else ([min_cpu, min_mem], copy.copy(self.cpu_mem_duration_function))
         self.objective.reset()
-        return (minimum_memory, copy.copy(self.param_function)) if self.config.vendor != 'GCPv2' else ([min_cpu, min_mem], copy.copy(self.cpu_mem_duration_function))
+        return result
+
+    def pareto_frontiers(self) -> list:
+        """Returns the cost vs execution time Pareto frontier of each payload's fitted function, so that the
+        configurations of other execution time constraints can be picked without optimizing again.
+
+        Returns:
+            list: The payload, the fitted function's parameters, and the configurations on the frontier with their costs
+                and execution times in ms of each payload, by increasing cost.
+        """
+        space = self.sampler.memory_space if self.config.vendor != 'GCPv2' else self.explorer.cpu_mem_space
+        frontiers = []
+        for entry, fitted_function in zip(self.config.payloads, self.fitted_functions):
+            configurations, costs, execution_times = fitted_function.pareto_frontier(space)
+            frontiers.append({
+                "payload": entry["payload"],
+                "params": np.asarray(fitted_function.params, dtype=float).tolist(),
+                "configurations": configurations.tolist(),
+                "costs": costs.tolist(),
+                "execution_times": execution_times.tolist(),
+            })
+        return frontiers
+
+    def write_pareto_frontiers(self, path: str) -> None:
+        """Writes the payloads' Pareto frontiers to @path in JSON, see pareto_frontiers."""
+        with open(path, "w") as file:
+            json.dump(self.pareto_frontiers(), file, indent=4)
+
+    def optimize_payloads_concurrently(self, entries: list, collective_costs: np.ndarray) -> list:
+        """Runs the recommender of all the payloads in lockstep, exploring them all at each chosen memory configuration.
+
+        Args:
+            entries (list): The weighted payloads.
+            collective_costs (np.ndarray): The weighted costs over the memory space, accumulated with each payload's.
+
+        Returns:
+            list: The memory configuration that minimizes the cost of each payload, and its fitted parametric function.
+        """
+        param_functions = [ParametricFunction() for _ in entries]
+        recommenders = []
+        for param_function in param_functions:
+            objective = Objective(
+                param_function=param_function,
+                memory_space=self.explorer.memory_space,
+                termination_threshold=self.config.termination_threshold,
+            )
+            sampler = Sampler(
+                explorer=self.explorer,
+                explorations_count=self.config.min_sample_per_config,
+                dynamic_sampling_params=self.config.dynamic_sampling_params,
+                sample_store=self.sample_store,
+            )
+            recommenders.append(self._create_recommender(objective, sampler))
+
+        MultiPayloadRecommender(
+            recommenders=recommenders,
+            payloads=[entry["payload"] for entry in entries],
+            weights=[entry["weight"] for entry in entries],
+        ).run()
+
+        # The memory configurations left after the initialization, the ones enough for the function's execution.
+        self.sampler.memory_space = recommenders[0].sampler.memory_space
+
+        results = []
+        for entry, param_function, recommender in zip(entries, param_functions, recommenders):
+            collective_costs += param_function(self.explorer.memory_space) * self.explorer.memory_space * entry["weight"]
+            results.append((param_function.minimize(
+                recommender.sampler.memory_space, self.config.constraint_execution_time_threshold,
+                self.config.constraint_cost_tolerance_percent
+            ), param_function))
+        return results
+
+    def _create_recommender(self, objective: Objective, sampler: Sampler) -> Recommender:
+        if self.config.recommender == "bayesian":
+            bayesian_params = {**BAYESIAN_PARAMS, **self.config.bayesian_params}
+            return BayesianRecommender(
+                objective=objective,
+                sampler=sampler,
+                max_total_sample_count=self.config.max_total_sample_count,
+                nbr_bootstrap_samples=bayesian_params["nbr_bootstrap_samples"],
+                expected_improvement_threshold=bayesian_params["expected_improvement_threshold"],
+            )
+        return Recommender(
+            objective=objective,
+            sampler=sampler,
+            max_total_sample_count=self.config.max_total_sample_count,
+        )
 
     def _apply_configuration(self, configuration: Union[int, list]):
         if self.config.vendor != 'GCPv2':
@@ -1,4 +1,6 @@
 from .recommender import Recommender
 from .recommender_2d import Recommender2D
+from .bayesian_recommender import BayesianRecommender
+from .multi_payload_recommender import MultiPayloadRecommender
 
-__all__ = ["Recommender", "Recommender2D"]
+__all__ = ["Recommender", "Recommender2D", "BayesianRecommender", "MultiPayloadRecommender"]
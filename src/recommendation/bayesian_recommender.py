@@ -0,0 +1,113 @@
+import copy
+
+import numpy as np
+
+from src.instrumentation import instrumentation
+from src.objective import Objective
+from src.sampling import Sample, Sampler
+from ..exception import *
+from ..logger import logger
+from .recommender import Recommender
+
+
+class BayesianRecommender(Recommender):
+    """Recommender that explores the memory configuration with the highest expected improvement of the cost.
+
+    The surrogate is a bootstrap ensemble of the parametric function: it is fitted to resamples of the sample's
+    durations, drawn with replacement within each explored memory configuration. The expected improvement of a memory
+    configuration is the ensemble's average of how much cheaper than the current best configuration it is predicted to
+    be. The algorithm terminates when no remaining memory configuration is expected to improve the cost by more than
+    @expected_improvement_threshold (relative to the current best cost).
+    """
+
+    def __init__(
+            self,
+            objective: Objective,
+            sampler: Sampler,
+            max_total_sample_count: int,
+            nbr_bootstrap_samples: int = 30,
+            expected_improvement_threshold: float = 0.01,
+            random_seed: int = None,
+    ):
+        super().__init__(objective, sampler, max_total_sample_count)
+        self.nbr_bootstrap_samples = nbr_bootstrap_samples
+        self.expected_improvement_threshold = expected_improvement_threshold
+        self._rng = np.random.default_rng(random_seed)
+        self._remainder_memories = np.array([], dtype=int)
+        self._expected_improvements = np.array([], dtype=float)
+
+    @property
+    def _is_termination_reached(self) -> bool:
+        return (
+                len(self.sampler.sample) > self._max_total_sample_count
+                or len(self._remainder_memories) == 0
+                or self._expected_improvements.max() < self.expected_improvement_threshold
+        )
+
+    def _learn_sample(self):
+        super()._learn_sample()
+        self._update_surrogate()
+
+    def _update(self, memory_mb: int, reconfigure: bool = True):
+        super()._update(memory_mb, reconfigure)
+        self._update_surrogate()
+
+    @instrumentation.timed("recommendation.choose")
+    def _choose_memory_to_explore(self) -> int:
+        """Chooses the remaining memory configuration with the highest expected improvement of the cost.
+
+        Raises:
+            NoMemoryLeftError: If no memory is left to explore with.
+        """
+        if len(self._remainder_memories) == 0:
+            raise NoMemoryLeftError
+
+        return self._remainder_memories[np.argmax(self._expected_improvements)]
+
+    @instrumentation.timed("recommendation.surrogate")
+    def _update_surrogate(self) -> None:
+        """Fits the bootstrap ensemble and computes the relative expected improvement of the remaining memories."""
+        sample = self.sampler.sample
+        sample_memories = set(sample.memories)
+        self._remainder_memories = np.array(
+            [memory for memory in self.sampler.memory_space if memory not in sample_memories],
+            dtype=int,
+        )
+        if len(self._remainder_memories) == 0:
+            self._expected_improvements = np.array([], dtype=float)
+            return
+
+        explored_memories = np.unique(sample.memories)
+        ensemble_costs = self._predict_ensemble_costs(
+            np.concatenate([explored_memories, self._remainder_memories])
+        )
+        explored_costs = ensemble_costs[:, :len(explored_memories)]
+        remainder_costs = ensemble_costs[:, len(explored_memories):]
+
+        best_cost = explored_costs.mean(axis=0).min()
+        improvements = np.maximum(best_cost - remainder_costs, 0).mean(axis=0)
+        self._expected_improvements = improvements / best_cost
+
+    def _predict_ensemble_costs(self, memories: np.ndarray) -> np.ndarray:
+        """Predicts the cost of the memories @memories with each member of the bootstrap ensemble.
+
+        Returns:
+            np.ndarray: The costs predicted by each member, one row per member.
+        """
+        sample = self.sampler.sample
+        memories_sampled, durations = sample.memories, sample.durations
+        groups = [np.flatnonzero(memories_sampled == memory) for memory in np.unique(memories_sampled)]
+
+        param_function = self.objective.param_function
+        ensemble_costs = [param_function(memories) * memories]
+        for _ in range(self.nbr_bootstrap_samples):
+            indices = np.concatenate([self._rng.choice(group, size=len(group)) for group in groups])
+            member = copy.copy(param_function)
+            try:
+                member.fit(Sample.from_arrays(memories_sampled[indices], durations[indices]))
+            except (RuntimeError, ValueError) as e:
+                logger.debug(f"Skipping bootstrap sample: {e.args[0]}")
+                continue
+            ensemble_costs.append(member(memories) * memories)
+
+        return np.array(ensemble_costs, dtype=float)
@@ -0,0 +1,109 @@
+import numpy as np
+
+from ..exception import *
+
+
+class MultiPayloadRecommender:
+    """Runs the recommender algorithm of several payloads of the same function in lockstep.
+
+    All the payloads are explored at each chosen memory configuration, so a single configuration update and cold start
+    serve every payload instead of each payload reconfiguring the function on its own.
+    """
+
+    def __init__(self, recommenders: list, payloads: list, weights: list):
+        """
+        Args:
+            recommenders (list): One recommender per payload. Their samplers share the same explorer.
+            payloads (list): The payloads to explore with.
+            weights (list): The weight of each payload in the choice of the memory configuration to explore.
+        """
+        self.recommenders = recommenders
+        self.payloads = payloads
+        self.weights = weights
+
+    @property
+    def _active_indices(self) -> list:
+        """Indices of the payloads whose termination condition is not reached yet."""
+        return [
+            i for i, recommender in enumerate(self.recommenders)
+            if not recommender._is_termination_reached
+        ]
+
+    def run(self):
+        """Runs the recommender algorithm of all the payloads.
+
+        Raises:
+            OptimizationError: If an error occurred while running the recommender algorithm.
+
+        The memory configuration to explore is the one that minimizes the weighted sum of the objectives of the payloads
+        whose termination condition is not reached yet. Only these payloads are explored with it.
+        """
+        self._initialize()
+        active_indices = self._active_indices
+        while active_indices:
+            memory = self._choose_memory_to_explore(active_indices)
+            for n, i in enumerate(active_indices):
+                self._select(i)
+                self.recommenders[i]._update(memory, reconfigure=n == 0 or not self._is_configured(i, memory))
+            active_indices = self._active_indices
+
+    def _initialize(self):
+        """Initializes the samples of all the payloads at the memory configurations chosen for the first payload.
+
+        Raises:
+            OptimizationError: If an error occurred while fitting the parametric functions.
+
+        The first payload's initialization handles the memory configurations that are not enough for the function's
+        execution. The other payloads are then explored with the same memory configurations, starting from the one
+        the function is currently configured with.
+        """
+        leader = self.recommenders[0]
+        self._select(0)
+        leader._initialize()
+
+        memories = list(dict.fromkeys(leader.sampler.sample.memories))
+        followers = self.recommenders[1:]
+        for recommender in followers:
+            recommender.sampler.reset_sample()
+            recommender.sampler.memory_space = leader.sampler.memory_space
+
+        for memory in reversed(memories):
+            for i in range(1, len(self.recommenders)):
+                self._select(i)
+                self.recommenders[i].sampler.update_sample(memory, reconfigure=not self._is_configured(i, memory))
+
+        for recommender in followers:
+            recommender._learn_sample()
+
+    def _choose_memory_to_explore(self, indices: list) -> int:
+        """Chooses the memory size configuration to explore the payloads @indices with.
+
+        Returns:
+            int: Memory value, not explored yet by these payloads, that minimizes their weighted objectives.
+
+        Raises:
+            NoMemoryLeftError: If no memory is left to explore with.
+        """
+        recommenders = [self.recommenders[i] for i in indices]
+        sample_memories = set().union(*(recommender.sampler.sample.memories for recommender in recommenders))
+        memory_space = recommenders[0].sampler.memory_space
+        remainder_memories = np.array(
+            [memory for memory in memory_space if memory not in sample_memories],
+            dtype=int,
+        )
+
+        if len(remainder_memories) == 0:
+            raise NoMemoryLeftError
+
+        values = sum(
+            self.weights[i] * self.recommenders[i].objective.get_values(remainder_memories)
+            for i in indices
+        )
+        return remainder_memories[np.argmin(values)]
+
+    def _select(self, index: int) -> None:
+        """Points the shared explorer to the payload @index."""
+        self.recommenders[index].sampler.explorer.payload = self.payloads[index]
+
+    def _is_configured(self, index: int, memory_mb: int) -> bool:
+        return self.recommenders[index].sampler.explorer.memory_config_mb == memory_mb
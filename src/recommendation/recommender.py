@@ -1,5 +1,6 @@
 import numpy as np
 
+from src.instrumentation import instrumentation
 from src.objective import Objective
 from src.sampling import Sampler
 from ..exception import *
@@ -55,8 +56,14 @@ class Recommender:
         It updates the knowledge values for each sampled memory and fits the parametric function.
         """
         self.sampler.initialize_sample()
+        self._learn_sample()
 
-        # update the knowledge values for each sampled memory.
+    def _learn_sample(self):
+        """Updates the knowledge values for each sampled memory and fits the parametric function to the sample.
+
+        Raises:
+            OptimizationError: If an error occurred while fitting the parametric function.
+        """
         sample = self.sampler.sample
         for memory in set(sample.memories):
             self.objective.update_knowledge(memory)
@@ -67,11 +74,12 @@ class Recommender:
             logger.debug(e.args[0])
             raise OptimizationError(e.args[0])
 
-    def _update(self, memory_mb: int):
+    def _update(self, memory_mb: int, reconfigure: bool = True):
         """Updates the sample, knowledge values, and parametric function.
 
         Args:
             memory_mb (int): The memory value to explore with in MB.
+            reconfigure (bool, optional): If False, the function is already configured with @memory_mb and warm.
 
         Raises:
             SamplingError: If an error occurred while sampling.
@@ -80,7 +88,7 @@ class Recommender:
         datapoints, then it updates the knowledge values for the given memory, and fits the parametric function.
         """
         try:
-            self.sampler.update_sample(memory_mb)
+            self.sampler.update_sample(memory_mb, reconfigure)
         except FunctionENOMEM:
             logger.info(
                 f"ENOMEM: trying with new memories. {self.sampler.explorer.invoker.function_name}: {self.sampler.memory_space[0]}MB")
@@ -101,6 +109,7 @@ class Recommender:
             logger.debug(e.args[0])
             raise OptimizationError(e.args[0])
 
+    @instrumentation.timed("recommendation.choose")
     def _choose_memory_to_explore(self) -> int:
         """Chooses the memory size configuration to explore with from the remainder memories in the memory space.
 
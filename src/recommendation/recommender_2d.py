@@ -1,5 +1,6 @@
 import numpy as np
 
+from src.instrumentation import instrumentation
 from src.objective import Objective2D
 from src.sampling import Sampler2D
 from ..exception import *
@@ -88,6 +89,7 @@ class Recommender2D:
             logger.debug(e.args[0])
             raise OptimizationError(e.args[0])
 
+    @instrumentation.timed("recommendation.choose")
     def _choose_cpu_memory_to_explore(self) -> list[float, int]:
         """Chooses the cpu and memory size configuration to explore with from the remainder cpu memorie combinations in the cpu memory space.
 
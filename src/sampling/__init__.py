@@ -1,6 +1,7 @@
 from .sample import Sample
 from .sampler import Sampler
+from .sample_store import SampleStore
 from .sample_2d import Sample2D
 from .sampler_2d import Sampler2D
 
-__all__ = ["Sampler", "Sample", "Sample2D", "Sampler2D"]
+__all__ = ["Sampler", "Sample", "Sample2D", "Sampler2D", "SampleStore"]
@@ -0,0 +1,75 @@
+import numpy as np
+
+
+class ColumnBuffer:
+    """Growable columns of a table, preallocated and sorted lazily.
+
+    Appending rows is amortized O(1) per row, the columns' capacity doubles when they are full. The rows are sorted by
+    @sort_columns (stably, so rows with equal keys keep their insertion order) only when the columns are read after an
+    append. Columns are read through cached read-only views. The views stay valid snapshots after later appends, since
+    sorting and growing write to new arrays and appending only writes past the views' end.
+    """
+
+    def __init__(self, dtypes: dict, sort_columns: list, capacity: int = 16):
+        self._columns = {name: np.empty(capacity, dtype=dtype) for name, dtype in dtypes.items()}
+        self._sort_columns = sort_columns
+        self._size = 0
+        self._sorted = True
+        self._views = {}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, **columns) -> None:
+        """Appends rows, given as one array-like of values per column."""
+        values = {name: np.asarray(columns[name], dtype=column.dtype).ravel() for name, column in self._columns.items()}
+        nbr_rows = len(next(iter(values.values())))
+        if nbr_rows == 0:
+            return
+
+        new_size = self._size + nbr_rows
+        capacity = len(next(iter(self._columns.values())))
+        if new_size > capacity:
+            capacity = max(2 * capacity, new_size)
+            self._columns = {name: self._copy(column, capacity) for name, column in self._columns.items()}
+
+        for name, column in self._columns.items():
+            column[self._size:new_size] = values[name]
+        self._size = new_size
+        self._sorted = False
+        self._views = {}
+
+    def column(self, name: str) -> np.ndarray:
+        """Returns a read-only view of the column @name, in sorted order."""
+        if name not in self._views:
+            self._sort()
+            view = self._columns[name][:self._size]
+            view.flags.writeable = False
+            self._views[name] = view
+        return self._views[name]
+
+    def cached(self, name: str, compute: callable) -> np.ndarray:
+        """Returns the array computed by @compute(), cached as @name until the next append."""
+        if name not in self._views:
+            array = np.asarray(compute())
+            array.flags.writeable = False
+            self._views[name] = array
+        return self._views[name]
+
+    def _sort(self) -> None:
+        if self._sorted:
+            return
+        # np.lexsort sorts by its last key first, and is stable.
+        order = np.lexsort([self._columns[name][:self._size] for name in reversed(self._sort_columns)])
+        capacity = len(next(iter(self._columns.values())))
+        sorted_columns = {}
+        for name, column in self._columns.items():
+            sorted_columns[name] = np.empty(capacity, dtype=column.dtype)
+            sorted_columns[name][:self._size] = column[:self._size][order]
+        self._columns = sorted_columns
+        self._sorted = True
+
+    def _copy(self, column: np.ndarray, capacity: int) -> np.ndarray:
+        copy = np.empty(capacity, dtype=column.dtype)
+        copy[:self._size] = column[:self._size]
+        return copy
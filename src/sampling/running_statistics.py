@@ -0,0 +1,59 @@
+import math
+import sys
+
+import numpy as np
+from scipy.stats import binom, norm
+
+
+class RunningStatistics:
+    """Mean and variance of a stream of values, updated in O(1) per value with Welford's algorithm."""
+
+    def __init__(self, values: list = None):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        if values is not None:
+            self.update(values)
+
+    def update(self, values: list) -> None:
+        for value in values:
+            self.count += 1
+            delta = value - self.mean
+            self.mean += delta / self.count
+            self._m2 += delta * (value - self.mean)
+
+    @property
+    def variance(self) -> float:
+        """The sample variance (ddof=1)."""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def coefficient_of_variation(self) -> float:
+        return math.sqrt(self.variance) / self.mean if self.mean else math.inf
+
+
+def median_confidence_interval(values: list, confidence_level: float) -> tuple[float, float]:
+    """Distribution-free confidence interval of the median, bounded by order statistics of @values.
+
+    Returns:
+        tuple[float, float]: The interval's bounds, infinite if there are too few values for the confidence level.
+    """
+    values = np.sort(values)
+    # The number of values below the median follows a Binomial(n, 1/2).
+    lower_rank = int(binom.ppf((1 - confidence_level) / 2, len(values), 0.5)) - 1
+    if lower_rank < 0:
+        return -math.inf, math.inf
+    return float(values[lower_rank]), float(values[len(values) - 1 - lower_rank])
+
+
+def required_sample_count(
+    coefficient_of_variation: float, relative_half_width: float, confidence_level: float
+) -> int:
+    """Number of values needed for the median's confidence interval to narrow down to @relative_half_width of the
+    median, assuming normally distributed values with the coefficient of variation @coefficient_of_variation."""
+    if not math.isfinite(coefficient_of_variation):
+        return sys.maxsize
+
+    z = norm.ppf(1 - (1 - confidence_level) / 2)
+    # The median's standard error is sqrt(pi / 2) times the mean's.
+    return math.ceil((z * coefficient_of_variation * math.sqrt(math.pi / 2) / relative_half_width) ** 2)
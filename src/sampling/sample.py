@@ -1,41 +1,59 @@
 import numpy as np
 
+from .column_buffer import ColumnBuffer
 from .data_point import DataPoint
 
 
 class Sample:
-    """Class for keeping track of the sample."""
+    """Class for keeping track of the sample.
+
+    The datapoints are stored column-wise, sorted by memory, and read through cached read-only arrays.
+    """
 
     def __init__(self, datapoints: list = None):
-        if datapoints is None:
-            datapoints = []
-        self._datapoints = datapoints
+        # Memories are stored as floats so that invalid values are only rejected when the memories are read.
+        self._buffer = ColumnBuffer({"memory_mb": float, "duration_ms": float}, sort_columns=["memory_mb"])
+        if datapoints:
+            self.update(datapoints)
+
+    @classmethod
+    def from_arrays(cls, memories: np.ndarray, durations: np.ndarray) -> "Sample":
+        """Creates the sample of the datapoints' memories @memories and durations @durations."""
+        sample = cls()
+        sample.update_arrays(memories, durations)
+        return sample
 
     @property
     def costs(self):
-        return np.array(self.memories * self.durations)
+        return self._buffer.cached("cost", lambda: self.memories * self.durations)
 
     @property
     def durations(self):
-        return np.array(
-            [datapoint.duration_ms for datapoint in self._datapoints], dtype=float
-        )
+        return self._buffer.column("duration_ms")
 
     @property
     def memories(self):
-        return np.array(
-            [datapoint.memory_mb for datapoint in self._datapoints], dtype=int
-        )
+        return self._buffer.cached("memories", self._integer_memories)
 
     def update(self, data: DataPoint or list):
         if isinstance(data, list):
-            self._datapoints.extend(data)
+            self.update_arrays(
+                [datapoint.memory_mb for datapoint in data], [datapoint.duration_ms for datapoint in data]
+            )
         elif isinstance(data, DataPoint):
-            self._datapoints.append(data)
+            self.update_arrays([data.memory_mb], [data.duration_ms])
         else:
             raise TypeError(f"{data} must be of type DataPoint or list of DataPoints")
 
-        self._datapoints.sort(key=lambda datapoint: datapoint.memory_mb)
+    def update_arrays(self, memories: np.ndarray, durations: np.ndarray) -> None:
+        """Adds the datapoints of memories @memories and durations @durations, without creating DataPoints."""
+        self._buffer.append(memory_mb=memories, duration_ms=durations)
+
+    def _integer_memories(self) -> np.ndarray:
+        memories = self._buffer.column("memory_mb")
+        if not np.isfinite(memories).all():
+            raise ValueError("cannot convert non-finite memory values to integer")
+        return memories.astype(int)
 
     def __len__(self):
-        return len(self._datapoints)
+        return len(self._buffer)
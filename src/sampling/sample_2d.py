@@ -1,41 +1,51 @@
 import numpy as np
 
+from .column_buffer import ColumnBuffer
 from .data_point_2d import DataPoint2D
 from typing import Union
 
 class Sample2D:
-    """Class for keeping track of the sample."""
+    """Class for keeping track of the sample.
+
+    The datapoints are stored column-wise, sorted by CPU then memory, and read through cached read-only arrays.
+    """
 
     def __init__(self, datapoints: list[DataPoint2D] = None):
-        if datapoints is None:
-            datapoints = []
-        self._datapoints = datapoints
+        self._buffer = ColumnBuffer(
+            {"vcpu": float, "memory_mb": float, "duration_ms": float}, sort_columns=["vcpu", "memory_mb"]
+        )
+        if datapoints:
+            self.update(datapoints)
 
     @property
     def costs(self):
-        return np.array((self.cpu_mems[:,0] + self.cpu_mems[:,1]) * self.durations)
+        return self._buffer.cached("cost", lambda: (self.cpu_mems[:,0] + self.cpu_mems[:,1]) * self.durations)
 
     @property
     def durations(self):
-        return np.array(
-            [datapoint.duration_ms / 1000 for datapoint in self._datapoints], dtype=float
-        )
+        return self._buffer.cached("duration_s", lambda: self._buffer.column("duration_ms") / 1000)
 
     @property
     def cpu_mems(self):
-        return np.array(
-            [[datapoint.vcpu, datapoint.memory_mb] for datapoint in self._datapoints]
+        return self._buffer.cached(
+            "cpu_mem", lambda: np.column_stack([self._buffer.column("vcpu"), self._buffer.column("memory_mb")])
         )
 
     def update(self, data: Union[DataPoint2D, list]):
         if isinstance(data, list):
-            self._datapoints.extend(data)
+            self.update_arrays(
+                [datapoint.vcpu for datapoint in data],
+                [datapoint.memory_mb for datapoint in data],
+                [datapoint.duration_ms for datapoint in data],
+            )
         elif isinstance(data, DataPoint2D):
-            self._datapoints.append(data)
+            self.update_arrays([data.vcpu], [data.memory_mb], [data.duration_ms])
         else:
             raise TypeError(f"{data} must be of type DataPoint or list of DataPoints")
 
-        self._datapoints.sort(key=lambda datapoint: (datapoint.vcpu, datapoint.memory_mb))
+    def update_arrays(self, cpus: np.ndarray, memories: np.ndarray, durations: np.ndarray) -> None:
+        """Adds the datapoints of vCPUs @cpus, memories @memories and durations @durations in ms."""
+        self._buffer.append(vcpu=cpus, memory_mb=memories, duration_ms=durations)
 
     def __len__(self):
-        return len(self._datapoints)
+        return len(self._buffer)
@@ -0,0 +1,94 @@
+import hashlib
+import sqlite3
+import time
+from contextlib import contextmanager
+
+from .data_point import DataPoint
+
+
+class SampleStore:
+    """Append-only SQLite store of the exploration results, reused across runs.
+
+    Datapoints are keyed by the function's name, the hash of its deployed code, the hash of the payload and the memory
+    configuration. Datapoints older than @max_age_hours are considered stale and are not loaded.
+    """
+
+    def __init__(self, path: str, max_age_hours: float = None):
+        self.path = path
+        self.max_age_hours = max_age_hours
+
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS samples ("
+                "function_name TEXT NOT NULL, "
+                "code_hash TEXT NOT NULL, "
+                "payload_hash TEXT NOT NULL, "
+                "memory_mb INTEGER NOT NULL, "
+                "duration_ms REAL NOT NULL, "
+                "created_at REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS samples_key "
+                "ON samples (function_name, code_hash, payload_hash, memory_mb)"
+            )
+
+    def add(self, function_name: str, code_hash: str, payload: str, datapoints: list) -> None:
+        """Appends the datapoints explored with the function's code @code_hash and payload @payload."""
+        created_at = time.time()
+        payload_hash = self.hash_payload(payload)
+        with self._connect() as connection:
+            connection.executemany(
+                "INSERT INTO samples VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (function_name, code_hash, payload_hash, int(datapoint.memory_mb), float(datapoint.duration_ms),
+                     created_at)
+                    for datapoint in datapoints
+                ],
+            )
+
+    def load(
+        self, function_name: str, code_hash: str, payload: str, memory_mb: int = None, limit: int = None
+    ) -> list:
+        """Returns the valid datapoints explored with the function's code @code_hash and payload @payload.
+
+        Args:
+            function_name (str): The serverless function's name.
+            code_hash (str): Hash of the function's deployed code.
+            payload (str): Payload the function was invoked with.
+            memory_mb (int, optional): Only returns the datapoints of this memory configuration.
+            limit (int, optional): Maximum number of datapoints to return.
+
+        Returns:
+            list: The datapoints that are not stale, most recent first.
+        """
+        query = (
+            "SELECT memory_mb, duration_ms FROM samples "
+            "WHERE function_name = ? AND code_hash = ? AND payload_hash = ? AND created_at >= ?"
+        )
+        min_created_at = time.time() - self.max_age_hours * 3600 if self.max_age_hours is not None else 0
+        params = [function_name, code_hash, self.hash_payload(payload), min_created_at]
+        if memory_mb is not None:
+            query += " AND memory_mb = ?"
+            params.append(int(memory_mb))
+        query += " ORDER BY created_at DESC, rowid"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(int(limit))
+
+        with self._connect() as connection:
+            rows = connection.execute(query, params).fetchall()
+        return [DataPoint(memory, duration) for memory, duration in rows]
+
+    @staticmethod
+    def hash_payload(payload: str) -> str:
+        return hashlib.sha256(str(payload).encode("utf-8")).hexdigest()
+
+    @contextmanager
+    def _connect(self) -> sqlite3.Connection:
+        """Opens a connection that commits on success and is always closed."""
+        connection = sqlite3.connect(self.path)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
@@ -2,11 +2,15 @@ import math
 
 import numpy as np
 
+from src.configuration.defaults import DYNAMIC_SAMPLING_PARAMS
 from src.exception import *
 from src.exploration import *
+from src.instrumentation import instrumentation
 from src.logger import logger
 from .data_point import DataPoint
+from .running_statistics import RunningStatistics, median_confidence_interval, required_sample_count
 from .sample import Sample
+from .sample_store import SampleStore
 
 
 class Sampler:
@@ -15,12 +19,15 @@ class Sampler:
             explorer: Explorer,
             explorations_count: int,
             dynamic_sampling_params: dict,
+            sample_store: SampleStore = None,
     ):
         self.sample = None
         self.explorer = explorer
         self.memory_space = explorer.memory_space
+        self.sample_store = sample_store
         self._explorations_count = explorations_count
-        self._dynamic_sampling_params = dynamic_sampling_params
+        self._dynamic_sampling_params = {**DYNAMIC_SAMPLING_PARAMS, **dynamic_sampling_params}
+        self._code_hash = None
 
     def initialize_sample(self) -> None:
         """Initializes the sample by exploring with 3 memory values from the memory space.
@@ -28,7 +35,17 @@ class Sampler:
         Raises:
             SamplingError: If an error occurred while sampling.
         """
-        self.sample = Sample()
+        self.reset_sample()
+
+        if self.explorer.concurrent_exploration:
+            try:
+                self._sample_initial_memory_configs_concurrently()
+                return
+
+            except FunctionENOMEM:
+                logger.info(
+                    f"ENOMEM: falling back to sequential sampling. {self.explorer.invoker.function_name}")
+                self.reset_sample()
 
         self._sample_first_memory_config()
 
@@ -43,6 +60,26 @@ class Sampler:
                 logger.debug(e)
                 raise
 
+    def reset_sample(self) -> None:
+        """Empties the sample, without exploring."""
+        self.sample = Sample()
+        self._code_hash = None
+
+    def _sample_initial_memory_configs_concurrently(self):
+        """Samples the 3 initial memory values at the same time.
+
+        Raises:
+            FunctionENOMEM: If one of the memory configurations is not enough for the function's execution.
+            SamplingError: If an error occurred while sampling.
+        """
+        if len(self.memory_space) <= 3:
+            raise NoMemoryLeftError
+
+        index = math.ceil(len(self.memory_space) / 3)
+        self.update_sample_batch(
+            [int(memory) for memory in [self.memory_space[0], self.memory_space[index], self.memory_space[-1]]]
+        )
+
     def _sample_first_memory_config(self):
         while len(self.memory_space) >= 3:
             try:
@@ -70,22 +107,31 @@ class Sampler:
         if len(self.memory_space) <= 3:
             raise NoMemoryLeftError
 
-    def update_sample(self, memory_mb: int) -> None:
+    @instrumentation.timed("sampling")
+    def update_sample(self, memory_mb: int, reconfigure: bool = True) -> None:
         """Updates the sample by invoking the serverless function with memory size configuration @memory_mb and
         appending the results to the sample.
 
         Args:
             memory_mb (int): Memory size configuration in MB.
+            reconfigure (bool, optional): If False, the function is assumed to be already configured with @memory_mb
+                and warm, so its configuration is not updated again. Default to True.
 
         Raises:
             SamplingError: If an error occurred while sampling.
         """
+        stored_subsample = self._load_stored_subsample(memory_mb)
+        if stored_subsample:
+            self.sample.update(stored_subsample)
+            logger.info(f"Reusing stored sample {self.explorer.invoker.function_name}, {memory_mb} MB")
+            return
+
         logger.info(f"Start sampling {self.explorer.invoker.function_name}: {memory_mb} MB")
         try:
             subsample_durations = self.explorer.explore_parallel(
                 nbr_invocations=self._explorations_count,
                 nbr_threads=self._explorations_count,
-                memory_mb=memory_mb,
+                memory_mb=memory_mb if reconfigure else None,
             )
         except ExplorationError as e:
             logger.debug(e)
@@ -95,56 +141,143 @@ class Sampler:
 
         subsample = [DataPoint(memory_mb, result) for result in subsample_durations]
         self.sample.update(subsample)
+        self._store_subsample(subsample)
 
         logger.info(
             f"Finish sampling {self.explorer.invoker.function_name}, {memory_mb} MB, {subsample_durations} ms")
 
-    def _explore_dynamically(self, durations: list) -> list:
-        """Samples dynamically until the invocations results are consistent enough. Consistency is measured by the
-        coefficient of variation.
+    @instrumentation.timed("sampling")
+    def update_sample_batch(self, memories: list) -> None:
+        """Updates the sample by invoking the serverless function with all the memory size configurations @memories
+        at once and appending the results to the sample.
+
+        Args:
+            memories (list): Memory size configurations in MB.
+
+        Raises:
+            SamplingError: If an error occurred while sampling.
+        """
+        memories_to_explore = []
+        for memory_mb in memories:
+            stored_subsample = self._load_stored_subsample(memory_mb)
+            if stored_subsample:
+                self.sample.update(stored_subsample)
+                logger.info(f"Reusing stored sample {self.explorer.invoker.function_name}, {memory_mb} MB")
+            else:
+                memories_to_explore.append(memory_mb)
+
+        if not memories_to_explore:
+            return
+        memories = memories_to_explore
+
+        logger.info(f"Start sampling {self.explorer.invoker.function_name}: {memories} MB")
+        try:
+            subsamples_durations = self.explorer.explore_batch(
+                memories=memories,
+                nbr_invocations=self._explorations_count,
+                nbr_threads=self._explorations_count,
+            )
+        except ExplorationError as e:
+            logger.debug(e)
+            raise
+
+        for memory_mb in memories:
+            subsample_durations = self._explore_dynamically(
+                durations=subsamples_durations[memory_mb], memory_mb=memory_mb
+            )
+
+            subsample = [DataPoint(memory_mb, result) for result in subsample_durations]
+            self.sample.update(subsample)
+            self._store_subsample(subsample)
+
+            logger.info(
+                f"Finish sampling {self.explorer.invoker.function_name}, {memory_mb} MB, {subsample_durations} ms")
+
+    @property
+    def code_hash(self) -> str:
+        """Hash of the explored function's deployed code, fetched once per sample initialization."""
+        if self._code_hash is None:
+            self._code_hash = self.explorer.config_manager.code_hash
+        return self._code_hash
+
+    def _load_stored_subsample(self, memory_mb: int) -> list:
+        """Returns the valid stored datapoints of the memory configuration @memory_mb, or an empty list if there are
+        not enough of them to skip the exploration."""
+        if self.sample_store is None or self.code_hash is None:
+            return []
+
+        subsample = self.sample_store.load(
+            self.explorer.invoker.function_name,
+            self.code_hash,
+            self.explorer.payload,
+            memory_mb,
+            limit=self._explorations_count,
+        )
+        return subsample if len(subsample) >= self._explorations_count else []
+
+    def _store_subsample(self, subsample: list) -> None:
+        if self.sample_store is None or self.code_hash is None:
+            return
+
+        self.sample_store.add(
+            self.explorer.invoker.function_name, self.code_hash, self.explorer.payload, subsample
+        )
+
+    def _explore_dynamically(self, durations: list, memory_mb: int = None) -> list:
+        """Samples dynamically until the invocations results are consistent enough.
 
         Args:
             durations (list): List of the initial sample's durations.
+            memory_mb (int, optional): Memory size in MB to explore with. Default to the explorer's current memory.
 
         Returns:
-            list: List of sample datapoints' durations.
+            list: The @explorations_count durations closest to the median of all the explored durations.
 
         Raises:
             SamplingError: If an error occurred while invoking or exploration price calculation.
             ValueError: If the @durations length is less than the initial samples count.
-        """
 
+        The results are consistent when their coefficient of variation is below its threshold, or when the confidence
+        interval of their median is narrow enough. Until then, the function is invoked in parallel batches sized from
+        the current coefficient of variation to narrow the confidence interval down in one round trip, within the
+        budget of max_sample_per_config invocations.
+        """
         if len(durations) < self._explorations_count:
             raise ValueError(
                 f"Length of the input {durations} is less than {self._explorations_count}"
             )
 
-        dynamic_sample_count = 0
-        min_cv = np.std(durations, ddof=1) / np.mean(durations)
+        durations = list(durations)
+        statistics = RunningStatistics(durations)
+        budget = self._dynamic_sampling_params["max_sample_per_config"]
 
-        while (
-                dynamic_sample_count < self._dynamic_sampling_params["max_sample_per_config"]
-                and min_cv
-                > self._dynamic_sampling_params["coefficient_of_variation_threshold"]
-        ):
+        while budget > 0 and not self._is_consistent(durations, statistics):
+            required_count = required_sample_count(
+                statistics.coefficient_of_variation,
+                self._dynamic_sampling_params["confidence_interval_threshold"],
+                self._dynamic_sampling_params["confidence_level"],
+            )
+            batch_size = min(budget, max(required_count - statistics.count, 1))
             try:
-                result = self.explorer.explore()
+                results = self.explorer.explore_parallel(
+                    nbr_invocations=batch_size, nbr_threads=batch_size, memory_mb=memory_mb
+                )
 
             except ExplorationError as e:
                 logger.debug(e)
                 raise
 
-            dynamic_sample_count += 1
+            budget -= batch_size
+            durations.extend(results)
+            statistics.update(results)
+
+        median = np.median(durations)
+        return sorted(durations, key=lambda duration: abs(duration - median))[:self._explorations_count]
 
-            # Choose the sample from durations that minimizes coefficient of variation.
-            values = durations.copy()
-            for i in range(len(durations)):
-                value = values[i]
-                values[i] = result
-                coefficient_variation = np.std(values, ddof=1) / np.mean(values)
-                if min_cv > coefficient_variation:
-                    min_cv = coefficient_variation
-                    durations = values.copy()
-                values[i] = value
+    def _is_consistent(self, durations: list, statistics: RunningStatistics) -> bool:
+        if statistics.coefficient_of_variation <= self._dynamic_sampling_params["coefficient_of_variation_threshold"]:
+            return True
 
-        return durations
+        lower, upper = median_confidence_interval(durations, self._dynamic_sampling_params["confidence_level"])
+        relative_half_width = (upper - lower) / (2 * np.median(durations))
+        return relative_half_width <= self._dynamic_sampling_params["confidence_interval_threshold"]
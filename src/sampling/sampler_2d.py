@@ -4,6 +4,7 @@ import numpy as np
 
 from src.exception import *
 from src.exploration import *
+from src.instrumentation import instrumentation
 from src.logger import logger
 from .data_point_2d import DataPoint2D
 from .sample_2d import Sample2D
@@ -68,6 +69,7 @@ class Sampler2D:
         if len(self.cpu_mem_space) <= 5:
             raise NoMemoryLeftError
 
+    @instrumentation.timed("sampling")
     def update_sample(self, cpu: float, memory_mb: int) -> None:
         """Updates the sample by invoking the serverless function with memory size configuration @memory_mb, vcpu size configuration @cpu 
         and appending the results to the sample.
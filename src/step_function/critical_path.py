@@ -0,0 +1,156 @@
+from typing import Tuple
+
+from .states import Map, Parallel, Task, Workflow
+
+# Kinds of the nodes.
+_TASK = 0
+# A workflow, its time is the sum of its states' times.
+_SEQUENCE = 1
+# A Parallel or Map state, its time is the longest of its branches' or iterations' times.
+_BRANCHES = 2
+
+
+class CriticalPath:
+    """Critical path and cost of a workflow, updated incrementally when the memory sizes of its tasks change.
+
+    The workflow's tree is flattened once into nodes numbered in preorder, so every node's children come after it. Each
+    node caches its time and cost, and the Parallel and Map states cache their longest branch or iteration. When tasks
+    change, only the tasks and their ancestors are evaluated again, each ancestor once and after its children. A Parallel
+    or Map state only compares its changed children with its longest one, unless the longest one got shorter.
+    """
+
+    def __init__(self, workflow: Workflow):
+        self._kinds = []
+        self._tasks = []
+        self._children = []
+        self._parents = []
+        # Position of each node among its parent's children.
+        self._positions = []
+        self._times = []
+        self._costs = []
+        # Position of the longest child of each Parallel and Map state, None if none takes any time.
+        self._longest = []
+        self._task_nodes = {}
+
+        self._add_node(_SEQUENCE, None, workflow.states, parent=None)
+        for node in reversed(range(len(self._kinds))):
+            self._evaluate(node)
+
+    def get_critical_path(self) -> Tuple[list[Task], float]:
+        """Returns the tasks on the critical path and its execution time, like Workflow.get_critical_path."""
+        critical_path = []
+        nodes = [0]
+        while nodes:
+            node = nodes.pop()
+            if self._kinds[node] == _TASK:
+                critical_path.append(self._tasks[node])
+            elif self._kinds[node] == _SEQUENCE:
+                nodes.extend(reversed(self._children[node]))
+            elif self._longest[node] is not None:
+                nodes.append(self._children[node][self._longest[node]])
+        return critical_path, self._times[0]
+
+    def get_cost(self) -> float:
+        """Returns the cost of the workflow, like Workflow.get_cost."""
+        return self._costs[0]
+
+    def update(self, tasks: list[Task]) -> None:
+        """Evaluates again @tasks, whose memory sizes changed, and their ancestors.
+
+        Args:
+            tasks (list[Task]): The changed tasks, the tasks that are not part of the workflow are ignored.
+        """
+        # Changed children positions of each node to evaluate again.
+        changed = {}
+        for task in tasks:
+            node = self._task_nodes.get(task)
+            if node is None or node in changed:
+                continue
+            changed[node] = []
+            while self._parents[node] is not None:
+                parent = self._parents[node]
+                is_evaluated = parent in changed
+                changed.setdefault(parent, []).append(self._positions[node])
+                if is_evaluated:
+                    break
+                node = parent
+
+        # Cost change of each evaluated node, summed into its parent's cost.
+        cost_changes = {}
+        for node in sorted(changed, reverse=True):
+            cost = self._costs[node]
+            self._evaluate(node, changed[node], cost_changes)
+            cost_changes[node] = self._costs[node] - cost
+
+    def _add_node(self, kind: int, task: Task, states: list, parent: int) -> int:
+        node = len(self._kinds)
+        self._kinds.append(kind)
+        self._tasks.append(task)
+        self._children.append([])
+        self._parents.append(parent)
+        self._positions.append(len(self._children[parent]) if parent is not None else 0)
+        self._times.append(0.0)
+        self._costs.append(0.0)
+        self._longest.append(None)
+        if parent is not None:
+            self._children[parent].append(node)
+
+        if kind == _TASK:
+            self._task_nodes[task] = node
+        elif kind == _SEQUENCE:
+            for state in states:
+                if isinstance(state, Task):
+                    self._add_node(_TASK, state, [], node)
+                elif isinstance(state, Parallel):
+                    self._add_branches(state.branches, node)
+                elif isinstance(state, Map):
+                    self._add_branches(state.iterations, node)
+        return node
+
+    def _add_branches(self, workflows: list[Workflow], parent: int) -> None:
+        node = self._add_node(_BRANCHES, None, [], parent)
+        for workflow in workflows:
+            self._add_node(_SEQUENCE, None, workflow.states, node)
+
+    def _evaluate(self, node: int, changed_positions: list = None, cost_changes: dict = None) -> None:
+        """Evaluates the time and cost of @node from its children's.
+
+        Args:
+            node (int): The node to evaluate.
+            changed_positions (list, optional): The positions of the changed children. Default to all of them.
+            cost_changes (dict, optional): The cost change of each changed child, required with @changed_positions.
+        """
+        kind = self._kinds[node]
+        if kind == _TASK:
+            task = self._tasks[node]
+            self._times[node] = task.get_execution_time()
+            self._costs[node] = task.get_cost()
+            return
+
+        children = self._children[node]
+        if changed_positions is None:
+            self._costs[node] = sum(self._costs[child] for child in children)
+        else:
+            self._costs[node] += sum(cost_changes[children[position]] for position in changed_positions)
+        if kind == _SEQUENCE:
+            self._times[node] = sum(self._times[child] for child in children)
+            return
+
+        longest = self._longest[node]
+        if changed_positions is None or (
+            longest is not None and longest in changed_positions
+            and self._times[children[longest]] < self._times[node]
+        ):
+            # The longest child is the first one taking the most time, like Parallel.get_critical_path.
+            longest = None
+            positions = range(len(children))
+        else:
+            positions = sorted(changed_positions)
+
+        for position in positions:
+            time = self._times[children[position]]
+            longest_time = self._times[children[longest]] if longest is not None else 0.0
+            if time > longest_time or (time == longest_time and longest is not None and position < longest):
+                longest = position
+        self._longest[node] = longest
+        self._times[node] = self._times[children[longest]] if longest is not None else 0.0
@@ -1,5 +1,15 @@
+import logging
+
 from src.exception.step_function_error import StepFunctionError
 from src.logger import logger
+from .critical_path import CriticalPath
+from .memory_solver import MemorySolver
+
+# Solvers of the memory sizes meeting the execution time threshold.
+# The memory size of the function with the cheapest time reduction on the critical path is increased until it's met.
+GREEDY = "greedy"
+# The memory sizes are allocated in one shot by MemorySolver, the greedy solver only repairs the rounding.
+CONVEX = "convex"
 
 
 class ExecutionTimeOptimizer:
@@ -8,6 +18,7 @@ class ExecutionTimeOptimizer:
         self.function_tasks_dict = function_tasks_dict
         self.memory_increment = config.memory_size_increment
         self.execution_time_threshold = config.constraint_execution_time_threshold
+        self.solver = config.execution_time_solver
 
     def optimize_for_execution_time_constraint(self):
         """Optimize the step function for execution time constraints."""
@@ -15,11 +26,26 @@ class ExecutionTimeOptimizer:
             logger.warning("No execution time threshold.")
             return
 
-        critical_path_tasks, critical_path_time = self.workflow.get_critical_path()
+        # The critical path and cost are only evaluated again for the bumped function's tasks and their ancestors.
+        critical_path = CriticalPath(self.workflow)
+        critical_path_tasks, critical_path_time = critical_path.get_critical_path()
         logger.info(
-            f"Start optimizing step function for execution time, time: {critical_path_time}ms, threshold: {self.execution_time_threshold}ms, cost: {self.workflow.get_cost()}."
+            f"Start optimizing step function for execution time, time: {critical_path_time}ms, threshold: {self.execution_time_threshold}ms, cost: {critical_path.get_cost()}."
         )
 
+        if self.solver == CONVEX and critical_path_time > self.execution_time_threshold:
+            memory_solver = MemorySolver(self.workflow, self.function_tasks_dict)
+            # The curve takes a solve per point, so it's only computed when it's logged.
+            if logger.isEnabledFor(logging.DEBUG):
+                self._log_trade_off_curve(memory_solver)
+            memory_sizes = memory_solver.solve(self.execution_time_threshold)
+            for function, memory_size in memory_sizes.items():
+                for task in self.function_tasks_dict[function]:
+                    task.memory_size = memory_size
+                critical_path.update(self.function_tasks_dict[function])
+            critical_path_tasks, critical_path_time = critical_path.get_critical_path()
+            logger.debug(f"Solved memory sizes, time: {critical_path_time}ms, cost: {critical_path.get_cost()}.")
+
         cost_increases = self._initialize_cost_increases()
 
         while critical_path_time > self.execution_time_threshold:
@@ -31,16 +57,21 @@ class ExecutionTimeOptimizer:
             else:
                 raise StepFunctionError("Execution time threshold too low.")
 
-            critical_path_tasks, critical_path_time = self.workflow.get_critical_path()
+            critical_path.update(self.function_tasks_dict[best_function])
+            critical_path_tasks, critical_path_time = critical_path.get_critical_path()
             logger.debug(
-                f"Optimized function {best_function}, time: {critical_path_time}ms, cost: {self.workflow.get_cost()}.\n"
+                f"Optimized function {best_function}, time: {critical_path_time}ms, cost: {critical_path.get_cost()}.\n"
             )
 
         logger.info(
-            f"Finish optimizing step function for execution time, time: {critical_path_time}ms, threshold: {self.execution_time_threshold}ms, cost: {self.workflow.get_cost()}.\n"
+            f"Finish optimizing step function for execution time, time: {critical_path_time}ms, threshold: {self.execution_time_threshold}ms, cost: {critical_path.get_cost()}.\n"
         )
         self._print_memory_sizes()
 
+    def get_trade_off_curve(self, nbr_points: int = 20):
+        """Returns the step function's cost vs execution time trade-off curve, see MemorySolver.trade_off_curve."""
+        return MemorySolver(self.workflow, self.function_tasks_dict).trade_off_curve(nbr_points)
+
     def _initialize_cost_increases(self):
         """Initialize the cost increases for each function."""
         cost_increases = {}
@@ -92,6 +123,13 @@ class ExecutionTimeOptimizer:
             new_cost = task.get_cost(task.memory_size + self.memory_increment)
             cost_increases[best_function] += new_cost - original_cost
 
+    def _log_trade_off_curve(self, memory_solver: MemorySolver, nbr_points: int = 20):
+        """Log the cost vs execution time trade-off curve the threshold is chosen on."""
+        times, costs, allocations = memory_solver.trade_off_curve(nbr_points)
+        logger.debug("Step function's cost vs execution time trade-off curve:")
+        for time, cost, memory_sizes in zip(times, costs, allocations):
+            logger.debug(f"time: {time:.0f}ms, cost: {cost:.0f}, memory sizes: {memory_sizes}")
+
     def _print_memory_sizes(self):
         """Print memory sizes after optimization."""
         print("Finish optimizing step function for execution time, optimized memory sizes:")
@@ -0,0 +1,245 @@
+import numpy as np
+from scipy import sparse
+from scipy.optimize import minimize
+
+from src.exception.step_function_error import StepFunctionError
+from src.logger import logger
+from .states import Map, Parallel, Task, Workflow
+
+# Allocations the cost is minimized from, as fractions of the way from the initial to the maximum memory sizes.
+_STARTS = (1.0, 0.75, 0.5, 0.25, 0.0)
+
+
+class MemorySolver:
+    """Allocates the memory sizes of a step function's Lambda functions in one shot, minimizing the workflow's cost
+    subject to its critical path's execution time being under a threshold.
+
+    Each task's execution time is its fitted parametric function a0 + a1 * exp(-m / a2) of its function's memory size
+    m, and all the tasks of a function share its memory size. The critical path's time nests sums (workflows) and
+    maximums (Parallel and Map states), so every Parallel and Map state gets a variable bounding the time of each of its
+    branches or iterations, and the threshold bounds the workflow's time. With decreasing convex execution times, these
+    constraints define a convex set. The cost, which isn't convex, is minimized over it with SLSQP and analytic gradients
+    from a few allocations, and the memory sizes are rounded up to whole MBs.
+    """
+
+    def __init__(self, workflow: Workflow, function_tasks_dict: dict):
+        """
+        Args:
+            workflow (Workflow): The step function's workflow, whose tasks' parametric functions are fitted.
+            function_tasks_dict (dict): The tasks of each Lambda function, their memory sizes are allocated between
+                their initial (cost-optimal) and maximum memory sizes.
+        """
+        self.functions = list(function_tasks_dict)
+        function_indices = {function: i for i, function in enumerate(self.functions)}
+        self._lower_bounds = np.array(
+            [min(task.initial_memory_size for task in function_tasks_dict[function]) for function in self.functions],
+            dtype=float,
+        )
+        self._upper_bounds = np.array(
+            [min(task.max_memory_size for task in function_tasks_dict[function]) for function in self.functions],
+            dtype=float,
+        )
+
+        # The tasks' parametric functions' parameters and functions.
+        params = []
+        task_functions = []
+        # Incidence of the tasks and of the Parallel and Map states in the workflows that directly contain them, and
+        # of the workflows in the Parallel and Map states that contain them (the root workflow is in none).
+        task_entries, branch_entries, parent_entries = [], [], []
+        nbr_sequences = 0
+        self._nbr_branches = 0
+
+        def add_workflow(workflow: Workflow, parent: int = None) -> None:
+            nonlocal nbr_sequences
+            sequence = nbr_sequences
+            nbr_sequences += 1
+            if parent is not None:
+                parent_entries.append((sequence, parent))
+            for state in workflow.states:
+                if isinstance(state, Task):
+                    task_entries.append((sequence, len(params)))
+                    params.append(state.param_function.params)
+                    task_functions.append(function_indices[state.function_name])
+                elif isinstance(state, (Parallel, Map)):
+                    branch = self._nbr_branches
+                    self._nbr_branches += 1
+                    branch_entries.append((sequence, branch))
+                    for child in state.branches if isinstance(state, Parallel) else state.iterations:
+                        add_workflow(child, branch)
+
+        add_workflow(workflow)
+
+        params = np.array(params, dtype=float).reshape(-1, 3)
+        self._a0, self._a1, self._a2 = params.T
+        self._task_functions = np.array(task_functions, dtype=int)
+        self._functions_matrix = sparse.csr_matrix(
+            (np.ones(len(task_functions)), (np.arange(len(task_functions)), self._task_functions)),
+            shape=(len(task_functions), len(self.functions)),
+        )
+        self._tasks_matrix = self._incidence(task_entries, (nbr_sequences, len(task_functions)))
+        self._branches_matrix = self._incidence(branch_entries, (nbr_sequences, self._nbr_branches))
+        self._parents_matrix = self._incidence(parent_entries, (nbr_sequences, self._nbr_branches))
+        # Bottom-up order of the Parallel and Map states, the nested ones are numbered after their ancestors.
+        self._branch_sequences = [
+            np.array([sequence for sequence, parent in parent_entries if parent == branch], dtype=int)
+            for branch in range(self._nbr_branches)
+        ]
+
+    def solve(self, execution_time_threshold: float, initial_memories: np.ndarray = None) -> dict:
+        """Returns the memory size of each function minimizing the cost under @execution_time_threshold.
+
+        Args:
+            execution_time_threshold (float): The critical path's execution time threshold in ms.
+            initial_memories (np.ndarray, optional): Extra memory sizes of the functions to start from. Default to None.
+
+        Returns:
+            dict: The memory size in MB of each function.
+
+        Raises:
+            StepFunctionError: If the threshold can't be met even with the maximum memory sizes.
+        """
+        if self.critical_path_time(self._lower_bounds) <= execution_time_threshold:
+            return self._as_dict(self._lower_bounds)
+        if self.critical_path_time(self._upper_bounds) > execution_time_threshold:
+            raise StepFunctionError("Execution time threshold too low.")
+
+        starts = [self._lower_bounds + fraction * (self._upper_bounds - self._lower_bounds) for fraction in _STARTS]
+        if initial_memories is not None:
+            starts.insert(0, np.asarray(initial_memories, dtype=float))
+        # The cost isn't convex, so the cheapest of the local minima from a few allocations is kept.
+        best_memories, best_cost = self._upper_bounds, self.cost(self._upper_bounds)
+        for start in starts:
+            memories = self._minimize(execution_time_threshold, start)
+            cost = self.cost(memories)
+            if cost < best_cost and self.critical_path_time(memories) <= execution_time_threshold:
+                best_memories, best_cost = memories, cost
+        return self._as_dict(best_memories)
+
+    def _minimize(self, execution_time_threshold: float, memories: np.ndarray) -> np.ndarray:
+        """Returns the memory sizes, rounded up, of the local minimum of the cost under @execution_time_threshold
+        reached from @memories."""
+        # The variables are the memory sizes in units of the largest one and the states' times in units of the threshold.
+        memory_scale = self._upper_bounds.max()
+        cost_scale = self.cost(memories)
+        nbr_functions = len(self.functions)
+
+        def split(x: np.ndarray) -> tuple:
+            return x[:nbr_functions] * memory_scale, x[nbr_functions:] * execution_time_threshold
+
+        def objective(x: np.ndarray) -> float:
+            return self.cost(split(x)[0]) / cost_scale
+
+        def objective_gradient(x: np.ndarray) -> np.ndarray:
+            task_memories = split(x)[0][self._task_functions]
+            times, time_derivatives = self._task_times(task_memories)
+            gradient = self._functions_matrix.T @ (times + task_memories * time_derivatives)
+            return np.concatenate([gradient * memory_scale / cost_scale, np.zeros(self._nbr_branches)])
+
+        def constraints(x: np.ndarray) -> np.ndarray:
+            memories, branch_times = split(x)
+            times, _ = self._task_times(memories[self._task_functions])
+            slacks = self._parents_matrix @ branch_times - self._sequence_times(times, branch_times)
+            slacks[0] += execution_time_threshold
+            return slacks / execution_time_threshold
+
+        # The states' times' part of the constraints' Jacobian is constant. The Jacobian is assembled sparse and only
+        # densified once, since SLSQP takes dense Jacobians.
+        branches_jacobian = self._parents_matrix - self._branches_matrix
+
+        def constraints_jacobian(x: np.ndarray) -> np.ndarray:
+            memories, _ = split(x)
+            _, time_derivatives = self._task_times(memories[self._task_functions])
+            memories_jacobian = self._tasks_matrix @ self._functions_matrix.multiply(time_derivatives[:, None])
+            return sparse.hstack(
+                [memories_jacobian * (-memory_scale / execution_time_threshold), branches_jacobian]
+            ).toarray()
+
+        x0 = np.concatenate([memories / memory_scale, self._branch_times(memories) / execution_time_threshold])
+        bounds = [
+            (lower / memory_scale, upper / memory_scale) for lower, upper in zip(self._lower_bounds, self._upper_bounds)
+        ] + [(0, None)] * self._nbr_branches
+        result = minimize(
+            objective,
+            x0,
+            jac=objective_gradient,
+            bounds=bounds,
+            constraints=[{"type": "ineq", "fun": constraints, "jac": constraints_jacobian}],
+            method="SLSQP",
+            options={"maxiter": 200, "ftol": 1e-9},
+        )
+        if not result.success:
+            logger.debug(f"Memory allocation didn't converge: {result.message}")
+        return np.clip(np.ceil(split(result.x)[0] - 1e-6), self._lower_bounds, self._upper_bounds)
+
+    def trade_off_curve(self, nbr_points: int = 20) -> tuple[np.ndarray, np.ndarray, list]:
+        """Computes the workflow's cost vs execution time trade-off curve.
+
+        The thresholds range from the critical path's time with the initial memory sizes to its time with the maximum
+        memory sizes, and each allocation starts from the previous one.
+
+        Args:
+            nbr_points (int, optional): The number of thresholds. Default to 20.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, list]: The critical path's execution times, the non-decreasing costs, and the
+                memory size of each function of each point, by decreasing threshold.
+        """
+        thresholds = np.linspace(
+            self.critical_path_time(self._lower_bounds), self.critical_path_time(self._upper_bounds), nbr_points
+        )
+        allocations = []
+        memories = None
+        for threshold in thresholds:
+            allocation = self.solve(threshold, memories)
+            memories = np.array([allocation[function] for function in self.functions], dtype=float)
+            allocations.append(memories)
+        # An allocation meeting a threshold meets the looser ones, the cheapest one is kept for each threshold.
+        for i in reversed(range(len(allocations) - 1)):
+            if self.cost(allocations[i + 1]) < self.cost(allocations[i]):
+                allocations[i] = allocations[i + 1]
+
+        times = np.array([self.critical_path_time(memories) for memories in allocations])
+        costs = np.array([self.cost(memories) for memories in allocations])
+        return times, costs, [self._as_dict(memories) for memories in allocations]
+
+    def cost(self, memories: np.ndarray) -> float:
+        """Returns the workflow's cost with the functions' memory sizes @memories, like Workflow.get_cost."""
+        task_memories = np.asarray(memories, dtype=float)[self._task_functions]
+        return float(np.dot(task_memories, self._task_times(task_memories)[0]))
+
+    def critical_path_time(self, memories: np.ndarray) -> float:
+        """Returns the critical path's execution time with the functions' memory sizes @memories."""
+        memories = np.asarray(memories, dtype=float)
+        times, _ = self._task_times(memories[self._task_functions])
+        return float(self._sequence_times(times, self._branch_times(memories))[0])
+
+    def _task_times(self, task_memories: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the tasks' execution times and their derivatives with respect to the memory size."""
+        has_exponential = self._a2 != 0
+        a2 = np.where(has_exponential, self._a2, 1)
+        exponential = np.where(has_exponential, self._a1 * np.exp(-task_memories / a2), 0)
+        return self._a0 + exponential, -exponential / a2
+
+    def _sequence_times(self, task_times: np.ndarray, branch_times: np.ndarray) -> np.ndarray:
+        return self._tasks_matrix @ task_times + self._branches_matrix @ branch_times
+
+    def _branch_times(self, memories: np.ndarray) -> np.ndarray:
+        """Returns the execution time of each Parallel and Map state, its longest branch's or iteration's."""
+        times, _ = self._task_times(memories[self._task_functions])
+        task_times = self._tasks_matrix @ times
+        branch_times = np.zeros(self._nbr_branches)
+        for branch in reversed(range(self._nbr_branches)):
+            sequences = self._branch_sequences[branch]
+            if len(sequences):
+                branch_times[branch] = max(
+                    0.0, (task_times[sequences] + self._branches_matrix[sequences] @ branch_times).max()
+                )
+        return branch_times
+
+    def _as_dict(self, memories: np.ndarray) -> dict:
+        return {function: int(memory) for function, memory in zip(self.functions, memories)}
+
+    @staticmethod
+    def _incidence(entries: list, shape: tuple) -> sparse.csr_matrix:
+        rows, columns = zip(*entries) if entries else ((), ())
+        return sparse.csr_matrix((np.ones(len(entries)), (rows, columns)), shape=shape)
@@ -0,0 +1,85 @@
+import hashlib
+import threading
+from concurrent.futures import Future
+
+import boto3
+
+from src.exploration.aws.aws_invoker import AWSInvoker
+from src.exploration.aws.aws_rate_limiter import AdaptiveConcurrencyLimit
+from src.instrumentation import instrumentation
+from src.logger import logger
+
+
+class OutputCache:
+    """Outputs of a step function's Lambda functions, invoked once per distinct input.
+
+    The outputs are content-addressed by the function's name and the SHA-256 of the input, so identical Map items and the
+    inputs repeated across payloads are only invoked once, and concurrent requests for an output being invoked wait for
+    it. Each function has one invoker, and so one boto3 client, shared by all its tasks.
+
+    The outputs are kept in memory only: they deduplicate the invocations of one run, and a new run invokes the
+    functions again, since their code or their side effects may have changed in between.
+    """
+
+    def __init__(
+            self,
+            aws_session: boto3.Session,
+            max_invocation_attempts: int = 5,
+            concurrency_limit: AdaptiveConcurrencyLimit = None,
+    ):
+        """
+        Args:
+            aws_session (boto3.Session): The AWS session the functions are invoked with.
+            max_invocation_attempts (int, optional): The maximum number of attempts per invocation. Default to 5.
+            concurrency_limit (AdaptiveConcurrencyLimit, optional): Limit of the invocations in flight, halved when
+                they are throttled. Default to unlimited.
+        """
+        self._aws_session = aws_session
+        self._max_invocation_attempts = max_invocation_attempts
+        self._concurrency_limit = concurrency_limit
+        self._invokers = {}
+        self._outputs = {}
+        self._lock = threading.Lock()
+
+    def get_output(self, function_name: str, input: str) -> str:
+        """Returns the output of @function_name for @input, invoking the function on the first request only.
+
+        Raises:
+            Exception: If the invocation failed, the next request invokes the function again.
+        """
+        key = (function_name, hashlib.sha256(input.encode("utf-8")).hexdigest())
+        with self._lock:
+            future = self._outputs.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = self._outputs[key] = Future()
+                invoker = self._get_invoker(function_name)
+
+        if not is_owner:
+            instrumentation.increment("output_cache_hits")
+            return future.result()
+
+        try:
+            if self._concurrency_limit is None:
+                output = invoker.invoke_for_output(input)
+            else:
+                with self._concurrency_limit.slot():
+                    output = invoker.invoke_for_output(input)
+        except Exception as e:
+            with self._lock:
+                del self._outputs[key]
+            future.set_exception(e)
+            raise e
+        logger.debug(f"Cached output of {function_name}, input: {input}")
+        future.set_result(output)
+        return output
+
+    def _get_invoker(self, function_name: str) -> AWSInvoker:
+        if function_name not in self._invokers:
+            self._invokers[function_name] = AWSInvoker(
+                function_name=function_name,
+                max_invocation_attempts=self._max_invocation_attempts,
+                aws_session=self._aws_session,
+                on_throttle=self._concurrency_limit.throttled if self._concurrency_limit is not None else None,
+            )
+        return self._invokers[function_name]
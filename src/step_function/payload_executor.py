@@ -0,0 +1,85 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class _Batch:
+    """Items of one PayloadExecutor.map call, run by whichever threads pick them."""
+
+    def __init__(self, function: callable, items: list, max_concurrency: int):
+        self._function = function
+        self._items = items
+        self._max_concurrency = max_concurrency or len(items)
+        self._results = [None] * len(items)
+        self._error = None
+        self._next = 0
+        self._running = 0
+        self._finished = 0
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+
+    def run_pending(self) -> None:
+        """Runs the batch's pending items until none is left or the batch's concurrency is reached."""
+        while True:
+            with self._lock:
+                if self._next >= len(self._items) or self._running >= self._max_concurrency:
+                    return
+                index = self._next
+                self._next += 1
+                self._running += 1
+
+            try:
+                self._results[index] = self._function(self._items[index])
+            except Exception as e:
+                with self._lock:
+                    if self._error is None:
+                        self._error = e
+                    # The pending items aren't started anymore.
+                    self._finished += len(self._items) - self._next
+                    self._next = len(self._items)
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self._finished += 1
+                    if self._finished == len(self._items):
+                        self._done.set()
+
+    def results(self) -> list:
+        """Waits for the items and returns their results in order, or raises the first error."""
+        self._done.wait()
+        if self._error is not None:
+            raise self._error
+        return self._results
+
+
+class PayloadExecutor:
+    """Bounded thread pool shared by all the Parallel and Map states of a workflow, however nested.
+
+    A thread waiting for its items runs the ones no worker has picked yet instead of blocking, so nested states can't
+    exhaust the pool and deadlock, and the threads are bounded by @max_workers whatever the nesting.
+    """
+
+    def __init__(self, max_workers: int):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="parrotfish-payload")
+
+    def map(self, function: callable, items: list, max_concurrency: int = None) -> list:
+        """Returns @function applied to each of @items, in order.
+
+        Args:
+            function (callable): The function applied to each item.
+            items (list): The items.
+            max_concurrency (int, optional): The maximum number of items run at the same time, unbounded if None or 0.
+
+        Returns:
+            list: The results of the items.
+
+        Raises:
+            Exception: The first error raised by @function, after the started items finished.
+        """
+        if not items:
+            return []
+        batch = _Batch(function, items, max_concurrency)
+        # The calling thread is one of the batch's runners.
+        for _ in range(min(len(items), max_concurrency or len(items)) - 1):
+            self._pool.submit(batch.run_pending)
+        batch.run_pending()
+        return batch.results()
@@ -1,10 +1,8 @@
 from abc import ABC, abstractmethod
 from typing import Tuple
 
-import boto3
-
-from src.exploration.aws.aws_invoker import AWSInvoker
 from src.logger import logger
+from .output_cache import OutputCache
 
 
 class State(ABC):
@@ -33,16 +31,9 @@ class Task(State):
     def set_input(self, input: str):
         self.input = input
 
-    def get_output(self, aws_session: boto3.Session) -> str:
+    def get_output(self, output_cache: OutputCache) -> str:
         logger.debug(f"Invoking {self.function_name}, input: {self.input}")
-
-        invoker = AWSInvoker(
-            function_name=self.function_name,
-            max_invocation_attempts=5,
-            aws_session=aws_session,
-        )
-        output = invoker.invoke_for_output(self.input)
-
+        output = output_cache.get_output(self.function_name, self.input)
         logger.debug(f"Finish invoking {self.function_name}, output: {output}")
         return output
 
@@ -102,6 +93,8 @@ class Map(State):
         super().__init__(name)
         self.items_path = None
         self.workflow_def = None
+        # Maximum number of iterations run at the same time, 0 for no limit like Step Functions' MaxConcurrency.
+        self.max_concurrency = 0
         self.iterations: list[Workflow] = []
 
     def add_iteration(self, workflow: "Workflow"):
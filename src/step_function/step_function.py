@@ -6,11 +6,15 @@ import numpy as np
 from jsonpath_ng import parse
 
 from src.configuration import Configuration
+from src.configuration.defaults import PAYLOAD_INITIAL_CONCURRENCY
 from src.exception.step_function_error import StepFunctionError
 from src.exploration.aws.aws_config_manager import AWSConfigManager
+from src.exploration.aws.aws_rate_limiter import AdaptiveConcurrencyLimit
 from src.logger import logger
 from src.parrotfish import Parrotfish
 from .execution_time_optimizer import ExecutionTimeOptimizer
+from .output_cache import OutputCache
+from .payload_executor import PayloadExecutor
 from .states import State, Task, Parallel, Map, Workflow
 
 
@@ -20,6 +24,13 @@ class StepFunction:
             self.config = config
             self.function_tasks_dict = {}
             self.aws_session = boto3.Session(region_name=config.region)
+            # Shared by all the payloads, so that the tasks' inputs repeated across them aren't invoked again.
+            self.output_cache = OutputCache(
+                self.aws_session,
+                concurrency_limit=AdaptiveConcurrencyLimit(PAYLOAD_INITIAL_CONCURRENCY, config.payload_max_concurrency),
+            )
+            # Runs the branches and iterations of all the Parallel and Map states, however nested.
+            self.payload_executor = PayloadExecutor(max_workers=config.payload_max_concurrency)
             self.definition = self._load_definition(config.arn)
 
     def optimize(self):
@@ -110,6 +121,7 @@ class StepFunction:
                 map_state = Map(name)
                 map_state.workflow_def = state_def["Iterator"]
                 map_state.items_path = state_def["ItemsPath"]
+                map_state.max_concurrency = state_def.get("MaxConcurrency", 0)
                 return map_state
 
             else:
@@ -171,49 +183,40 @@ class StepFunction:
             if isinstance(state, Task):
                 try:
                     state.set_input(input)
-                    output = state.get_output(self.aws_session)
+                    output = state.get_output(self.output_cache)
                     return output
                 except Exception as e:
                     logger.error(f"Error setting input of {state.name}: {e.args[0]}")
                     raise e
 
             elif isinstance(state, Parallel):
-                outputs = []
-                # Parallel execution of branches in a Parallel state
-                with ThreadPoolExecutor(max_workers=10) as executor:
-                    futures = {
-                        executor.submit(self._set_workflow_payloads, branch, input): branch
-                        for branch in state.branches
-                    }
-                    for future in as_completed(futures):
-                        branch = futures[future]
-                        try:
-                            branch_output = future.result()
-                            outputs.append(json.loads(branch_output))
-                        except Exception as e:
-                            logger.error(f"Error processing branch {branch}: {e.args[0]}")
-                            raise e
+                def _set_branch_payloads(branch: Workflow) -> dict:
+                    try:
+                        return json.loads(self._set_workflow_payloads(branch, input))
+                    except Exception as e:
+                        logger.error(f"Error processing branch {branch}: {e.args[0]}")
+                        raise e
+
+                # The branches run on the shared executor, their outputs are in the branches' order.
+                outputs = self.payload_executor.map(_set_branch_payloads, state.branches)
                 return json.dumps(outputs)
 
             elif isinstance(state, Map):
                 inputs = _extract_items(input, state.items_path)
                 state.iterations = [self._create_workflow(state.workflow_def) for _ in range(len(inputs))]
 
-                outputs = []
-                # Parallel execution of iterations in a Map state
-                with ThreadPoolExecutor(max_workers=10) as executor:
-                    futures = {
-                        executor.submit(self._set_workflow_payloads, iteration, iteration_input): iteration_input
-                        for iteration, iteration_input in zip(state.iterations, inputs)
-                    }
-                    for future in as_completed(futures):
-                        iteration_input = futures[future]
-                        try:
-                            iteration_output = future.result()
-                            outputs.append(json.loads(iteration_output))
-                        except Exception as e:
-                            logger.error(f"Error processing iteration with input {iteration_input}: {e.args[0]}")
-                            raise e
+                def _set_iteration_payloads(iteration_args: tuple) -> dict:
+                    iteration, iteration_input = iteration_args
+                    try:
+                        return json.loads(self._set_workflow_payloads(iteration, iteration_input))
+                    except Exception as e:
+                        logger.error(f"Error processing iteration with input {iteration_input}: {e.args[0]}")
+                        raise e
+
+                # The iterations run on the shared executor, their outputs are in the items' order.
+                outputs = self.payload_executor.map(
+                    _set_iteration_payloads, list(zip(state.iterations, inputs)), state.max_concurrency
+                )
                 return json.dumps(outputs)
 
         logger.info("Start setting workflow inputs")
@@ -237,6 +240,7 @@ class StepFunction:
                 The memory size that optimizes the cost of the function
             """
 
+            parrotfish = None
             try:
                 config = {
                     "function_name": function_name,
@@ -252,12 +256,26 @@ class StepFunction:
                 parrotfish = Parrotfish(Configuration(config))
                 collective_costs = np.zeros(len(parrotfish.explorer.memory_space))  # combined cost of all inputs
 
-                # optimize each input of the function
+                # The tasks with the same input share its parametric function, weighted by their number.
+                input_tasks = {}
                 for task in tasks:
-                    payload = {"payload": task.input, "weight": 1.0 / len(tasks)}
-                    min_memory, param_function = parrotfish.optimize_one_payload(payload, collective_costs)
-                    task.param_function = param_function
-                    logger.info(f"Optimized memory: {min_memory}MB, {task.name}. Input: {task.input}")
+                    input_tasks.setdefault(task.input, []).append(task)
+                entries = [
+                    {"payload": input, "weight": len(same_input_tasks) / len(tasks)}
+                    for input, same_input_tasks in input_tasks.items()
+                ]
+
+                # optimize all the inputs of the function together, sampled under a single configuration update per
+                # explored memory size
+                if len(entries) == 1:
+                    results = [parrotfish.optimize_one_payload(entries[0], collective_costs)]
+                else:
+                    results = parrotfish.optimize_payloads_concurrently(entries, collective_costs)
+
+                for (input, same_input_tasks), (min_memory, param_function) in zip(input_tasks.items(), results):
+                    for task in same_input_tasks:
+                        task.param_function = param_function
+                        logger.info(f"Optimized memory: {min_memory}MB, {task.name}. Input: {input}")
 
                 # get the optimized memory size for the function
                 memory_space = parrotfish.sampler.memory_space
@@ -273,10 +291,14 @@ class StepFunction:
                 logger.debug(f"Error optimizing function {function_name}: {e.args[0]}")
                 raise e
 
+            finally:
+                if parrotfish is not None:
+                    parrotfish.explorer.config_manager.delete_published_configs()
+
         logger.info("Start optimizing all functions")
 
         # Run Parrotfish on all functions in parallel
-        with ThreadPoolExecutor(max_workers=10) as executor:
+        with ThreadPoolExecutor(max_workers=self.config.max_concurrent_functions) as executor:
             futures = [executor.submit(_optimize_one_function, function, tasks)
                        for function, tasks in function_tasks_dict.items()]
 
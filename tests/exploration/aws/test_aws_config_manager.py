@@ -80,6 +80,29 @@ class TestSetConfig:
         assert config["MemorySize"] == 128
         assert config["Timeout"] == 100
 
+    def test_invalidate_invoker_config(self, config_manager):
+        calls = mock.Mock()
+        config_manager._invoker = mock.Mock(invalidate_config=calls.invalidate_config)
+        config_manager._lambda_client.get_waiter().wait = calls.wait
+
+        config_manager.set_config(128)
+
+        config_manager._invoker.invalidate_config.assert_called_once()
+        # The configuration is invalidated once the update is propagated.
+        assert [call[0] for call in calls.mock_calls][-1] == "invalidate_config"
+
+    def test_configuration_requests_are_rate_limited(self, config_manager):
+        config_manager._rate_limiter = mock.Mock()
+        config_manager._rate_limiter.waiter_delay.return_value = 10
+
+        config_manager.set_config(128)
+
+        # The initial read, the update, and the waiter and the read after it, twice while the update is in progress.
+        assert config_manager._rate_limiter.acquire_control_plane.call_count == 6
+        config_manager._lambda_client.get_waiter().wait.assert_called_with(
+            FunctionName="example_function", WaiterConfig={"Delay": 10}
+        )
+
     def test_param_value_error(self, config_manager):
         config_manager._lambda_client.update_function_configuration = mock.Mock(
             side_effect=ParamValidationError(report="error")
@@ -106,3 +129,47 @@ class TestSetConfig:
         with pytest.raises(FunctionConfigError) as error:
             config_manager.set_config(128)
         assert error.type == FunctionConfigError
+
+
+class TestPublishConfig:
+    def test_publish_version(self, config_manager):
+        config_manager._lambda_client.publish_version = mock.Mock(return_value={"Version": "7"})
+
+        version = config_manager.publish_config(512)
+
+        assert version == "7"
+        assert config_manager.published_versions == {512: "7"}
+
+    def test_published_version_is_cached(self, config_manager):
+        config_manager._lambda_client.publish_version = mock.Mock(return_value={"Version": "7"})
+        config_manager.set_config = mock.Mock()
+
+        config_manager.publish_config(512)
+        config_manager.publish_config(512)
+
+        assert config_manager.set_config.call_count == 1
+        assert config_manager._lambda_client.publish_version.call_count == 1
+
+    def test_publish_error(self, config_manager):
+        config_manager._lambda_client.publish_version = mock.Mock(
+            side_effect=ClientError(
+                operation_name="PublishVersion",
+                error_response={"Error": {"Message": "error", "Code": "ServiceException"}},
+            )
+        )
+
+        with pytest.raises(FunctionConfigError):
+            config_manager.publish_config(512)
+        assert config_manager.published_versions == {}
+
+    def test_reset_config_deletes_versions(self, config_manager):
+        config_manager.initial_config = FunctionConfig(memory_mb=256, timeout=30)
+        config_manager.published_versions = {512: "7", 1024: "8"}
+        config_manager.set_config = mock.Mock()
+        config_manager._lambda_client.delete_function = mock.Mock()
+
+        config_manager.reset_config()
+
+        config_manager.set_config.assert_called_once_with(256, 30)
+        assert config_manager._lambda_client.delete_function.call_count == 2
+        assert config_manager.published_versions == {}
@@ -0,0 +1,121 @@
+from unittest import mock
+
+import pytest
+
+from src.exception import *
+from src.exploration import AWSExplorer
+from src.exploration.cold_start import WARMUP
+
+
+@pytest.fixture
+def explorer():
+    explorer = AWSExplorer(
+        lambda_name="example_function",
+        max_invocation_attempts=5,
+        aws_session=mock.Mock(),
+        payload="payload",
+        concurrent_exploration=True,
+    )
+    explorer.config_manager.publish_config = mock.Mock(
+        side_effect=lambda memory: {512: "1", 1024: "2"}[memory]
+    )
+    explorer.invoker.invoke = mock.Mock(side_effect=lambda payload, qualifier: qualifier)
+    explorer.log_parser.parse_log = mock.Mock(
+        side_effect=lambda log: {"1": 300, "2": 200}[log]
+    )
+    explorer.price_calculator.calculate_price = mock.Mock(return_value=10)
+    return explorer
+
+
+def cold_first_invocations(explorer: AWSExplorer, nbr_cold_invocations: int) -> None:
+    """Makes the first @nbr_cold_invocations invocations of each version report an initialization."""
+    invocations = {}
+
+    def invoke(payload, qualifier):
+        invocations[qualifier] = invocations.get(qualifier, 0) + 1
+        if invocations[qualifier] <= nbr_cold_invocations:
+            return f"{qualifier}\tInit Duration: 250.00 ms"
+        return qualifier
+
+    explorer.invoker.invoke = mock.Mock(side_effect=invoke)
+    explorer.log_parser.parse_log = mock.Mock(side_effect=lambda log: {"1": 300, "2": 200}[log[0]])
+
+
+class TestExploreBatch:
+    def test_nominal_case(self, explorer):
+        results = explorer.explore_batch([512, 1024], 3, 3)
+
+        assert results == {512: [300, 300, 300], 1024: [200, 200, 200]}
+        # No invocation reported a cold start.
+        assert explorer.invoker.invoke.call_count == 6
+        assert explorer.cost == 60
+        assert explorer._qualifier == "2"
+
+    def test_cold_invocations_are_replaced(self, explorer):
+        cold_first_invocations(explorer, nbr_cold_invocations=2)
+
+        results = explorer.explore_batch([512, 1024], 3, 3)
+
+        assert results == {512: [300, 300, 300], 1024: [200, 200, 200]}
+        # The 2 cold invocations of each version were paid for and replaced.
+        assert explorer.invoker.invoke.call_count == 10
+        assert explorer.cost == 100
+
+    def test_warmup_round(self, explorer):
+        explorer.cold_start_detection = WARMUP
+
+        results = explorer.explore_batch([512, 1024], 3, 3)
+
+        assert results == {512: [300, 300, 300], 1024: [200, 200, 200]}
+        # Cold start and measured invocations of the two versions.
+        assert explorer.invoker.invoke.call_count == 12
+        assert explorer.cost == 120
+        assert explorer._qualifier == "2"
+
+    def test_invocation_error(self, explorer):
+        explorer.log_parser.parse_log = mock.Mock(side_effect=InvocationError("error", 300))
+
+        with pytest.raises(InvocationError):
+            explorer.explore_batch([512, 1024], 3, 3)
+
+    def test_sequential_exploration(self, explorer):
+        explorer.concurrent_exploration = False
+        explorer.explore_parallel = mock.Mock(return_value=[100])
+
+        results = explorer.explore_batch([512, 1024], 3, 3)
+
+        assert results == {512: [100], 1024: [100]}
+        explorer.config_manager.publish_config.assert_not_called()
+
+
+class TestExplore:
+    def test_explore_published_version(self, explorer):
+        explorer.config_manager.published_versions = {1024: "2"}
+        explorer.config_manager.set_config = mock.Mock()
+
+        duration_ms = explorer.explore(memory_mb=1024)
+
+        assert duration_ms == 200
+        explorer.config_manager.set_config.assert_not_called()
+        explorer.invoker.invoke.assert_called_once_with("payload", "2")
+
+    def test_cold_invocation_is_replaced(self, explorer):
+        cold_first_invocations(explorer, nbr_cold_invocations=1)
+
+        duration_ms = explorer.explore(memory_mb=1024)
+
+        assert duration_ms == 200
+        assert explorer.invoker.invoke.call_count == 2
+        assert explorer.cost == 20
+
+
+class TestExploreParallel:
+    def test_explore_published_version(self, explorer):
+        explorer.config_manager.published_versions = {512: "1"}
+
+        results = explorer.explore_parallel(3, 3, memory_mb=512)
+
+        assert results == [300, 300, 300]
+        # The published version is already warm.
+        assert explorer.invoker.invoke.call_count == 3
+        explorer.config_manager.publish_config.assert_not_called()
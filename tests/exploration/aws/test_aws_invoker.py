@@ -34,6 +34,29 @@ class TestInvoke:
 
         assert response == expected
 
+    def test_qualified_invocation(self, invoker):
+        invoker.client.invoke = mock.Mock(return_value={"LogResult": "VGVzdCByZXNwb25zZQ=="})
+
+        invoker.invoke(payload="payload", qualifier="3")
+
+        invoker.client.invoke.assert_called_once_with(
+            FunctionName="example_function", LogType="Tail", Payload="payload", Qualifier="3"
+        )
+
+    def test_function_config_is_cached(self, invoker):
+        invoker.client.get_function_configuration = mock.Mock(
+            return_value={"MemorySize": 1024, "Timeout": 60}
+        )
+        invoker._rate_limiter.acquire_control_plane = mock.Mock()
+
+        invoker.invoke(payload="payload")
+        invoker.invoke(payload="payload")
+        invoker.invalidate_config()
+        invoker.invoke(payload="payload")
+
+        assert invoker.client.get_function_configuration.call_count == 2
+        assert invoker._rate_limiter.acquire_control_plane.call_count == 2
+
     def test_client_error(self, invoker):
         mock_error_response = {
             "Error": {
@@ -80,6 +103,17 @@ class TestInvoke:
 
         assert invoker.client.invoke.call_count == 3
 
+    @mock.patch("src.exploration.aws.aws_invoker.time.sleep")
+    def test_throttling_is_reported(self, sleep, invoker):
+        response = {"LogResult": "VGVzdCByZXNwb25zZQ=="}
+        throttling = ClientError({"Error": {"Code": "TooManyRequestsException", "Message": "Rate Exceeded."}}, "Invoke")
+        invoker.client.invoke = mock.Mock(side_effect=(throttling, throttling, response))
+        invoker._on_throttle = mock.Mock()
+
+        invoker.invoke(payload="payload")
+
+        assert invoker._on_throttle.call_count == 2
+
     def test_read_time_out(self, invoker):
         # Arrange
         invoker.client.invoke = mock.Mock(
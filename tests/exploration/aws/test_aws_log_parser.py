@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from src.exploration.aws.aws_log_parser import *
@@ -78,3 +79,47 @@ class TestAWSLogParser:
         with pytest.raises(LogParsingError) as e:
             log_parser.parse_log(result_log)
         assert e.type == LogParsingError
+
+    def test_parse_report(self, log_parser):
+        result_log = (
+            "REPORT RequestId: 03d92713-a4b2-4b07-a07a-653087817262\\tDuration: 170.24 ms\\t"
+            "Billed Duration: 171 ms\\tMemory Size: 128 MB\\tMax Memory Used: 40 MB\\tInit Duration: 134.70 ms\\t\\n'"
+        )
+
+        result = log_parser.parse_report(result_log)
+
+        assert result == {
+            "Duration": 170.24,
+            "Billed Duration": 171.0,
+            "Memory Size": 128.0,
+            "Max Memory Used": 40.0,
+            "Init Duration": 134.70,
+        }
+
+    def test_parse_logs(self, log_parser):
+        logs = [
+            # CloudWatch exports contain real tabs.
+            "REPORT RequestId: 1\tDuration: 170.24 ms\tBilled Duration: 171 ms\tMemory Size: 128 MB\t"
+            "Max Memory Used: 40 MB\tInit Duration: 134.70 ms\t",
+            "Task timed out after REPORT RequestId: 2\\tDuration: 18179.84 ms\\tBilled Duration: 18180 ms\\t"
+            "Memory Size: 512 MB\\tMax Memory Used: 506 MB\\t\\n'",
+        ]
+
+        records = log_parser.parse_logs(logs)
+
+        assert list(records.billed_duration_ms) == [171, 18180]
+        assert records.init_duration_ms[0] == 134.70
+        assert np.isnan(records.init_duration_ms[1])
+        assert list(records.timed_out) == [False, True]
+        assert list(records.error) == [False, False]
+
+    @pytest.mark.parametrize(
+        "result_log, expected",
+        [
+            ("REPORT RequestId: 1\\tDuration: 170.24 ms\\tBilled Duration: 306 ms\\tInit Duration: 134.70 ms\\t", True),
+            ("REPORT RequestId: 2\\tDuration: 170.24 ms\\tBilled Duration: 171 ms\\t", False),
+        ],
+        ids=["cold", "warm"],
+    )
+    def test_is_cold_start(self, log_parser, result_log, expected):
+        assert log_parser.is_cold_start(result_log) == expected
@@ -0,0 +1,118 @@
+import threading
+import time
+
+from src.exploration.aws.aws_rate_limiter import AWSRateLimiter, AdaptiveConcurrencyLimit, TokenBucket
+
+
+class TestTokenBucket:
+    def test_burst_within_capacity(self):
+        bucket = TokenBucket(rate=1, capacity=3)
+
+        start = time.monotonic()
+        for _ in range(3):
+            bucket.acquire()
+
+        assert time.monotonic() - start < 0.1
+
+    def test_waits_for_refill(self):
+        bucket = TokenBucket(rate=20, capacity=1)
+        bucket.acquire()
+
+        start = time.monotonic()
+        bucket.acquire()
+
+        assert time.monotonic() - start >= 0.04
+
+
+class TestAdaptiveConcurrencyLimit:
+    def test_additive_increase(self):
+        limit = AdaptiveConcurrencyLimit(initial_limit=2, max_limit=4)
+
+        for _ in range(20):
+            with limit.slot():
+                pass
+
+        assert limit.limit == 4
+
+    def test_halved_once_per_interval(self):
+        limit = AdaptiveConcurrencyLimit(initial_limit=8, max_limit=8, decrease_interval=60)
+
+        limit.throttled()
+        limit.throttled()
+
+        assert limit.limit == 4
+
+    def test_halved_down_to_one(self):
+        limit = AdaptiveConcurrencyLimit(initial_limit=2, max_limit=8, decrease_interval=0)
+
+        for _ in range(3):
+            limit.throttled()
+
+        assert limit.limit == 1
+
+    def test_concurrent_slots(self):
+        limit = AdaptiveConcurrencyLimit(initial_limit=2, max_limit=2)
+        lock = threading.Lock()
+        in_flight = []
+        max_in_flight = []
+
+        def invoke():
+            with limit.slot():
+                with lock:
+                    in_flight.append(1)
+                    max_in_flight.append(len(in_flight))
+                time.sleep(0.01)
+                with lock:
+                    in_flight.pop()
+
+        threads = [threading.Thread(target=invoke) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert max(max_in_flight) == 2
+
+
+class TestAWSRateLimiter:
+    def test_shared_per_region(self):
+        limiter = AWSRateLimiter.configure("test-region-1", max_concurrent_invocations=2)
+
+        assert AWSRateLimiter.for_region("test-region-1") is limiter
+        assert AWSRateLimiter.for_region("test-region-2") is not limiter
+
+    def test_max_concurrent_invocations(self):
+        limiter = AWSRateLimiter(max_concurrent_invocations=2)
+        lock = threading.Lock()
+        in_flight = []
+        max_in_flight = []
+
+        def invoke():
+            with limiter.invocation():
+                with lock:
+                    in_flight.append(1)
+                    max_in_flight.append(len(in_flight))
+                time.sleep(0.01)
+                with lock:
+                    in_flight.pop()
+
+        threads = [threading.Thread(target=invoke) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert max(max_in_flight) == 2
+
+    def test_unlimited(self):
+        limiter = AWSRateLimiter()
+
+        with limiter.invocation():
+            limiter.acquire_control_plane()
+
+    def test_waiter_delay(self):
+        limiter = AWSRateLimiter(control_plane_requests_per_second=0.1)
+
+        assert limiter.waiter_delay(5) == 10
+        assert limiter.waiter_delay(20) == 20
+        assert AWSRateLimiter().waiter_delay(5) == 5
@@ -3,6 +3,7 @@ from unittest import mock
 
 import pytest
 from google.api_core.exceptions import GoogleAPICallError
+from google.cloud import functions_v1
 
 from src.exception import FunctionConfigError
 from src.exploration.gcp.gcp_config_manager import GCPConfigManager
@@ -73,3 +74,50 @@ class TestSetConfig:
         with pytest.raises(FunctionConfigError) as e:
             config_manager.set_config(128)
         assert e.type == FunctionConfigError
+
+
+class TestCodeHash:
+    def test_code_hash_ignores_configuration_updates(self, config_manager):
+        # Arrange
+        functions = [
+            functions_v1.CloudFunction(
+                source_archive_url="gs://bucket/source.zip",
+                runtime="python311",
+                entry_point="main",
+                available_memory_mb=memory_mb,
+                version_id=version_id,
+            )
+            for memory_mb, version_id in [(128, 1), (256, 2)]
+        ]
+        config_manager._function_client.get_function = mock.Mock(side_effect=functions)
+
+        # Action
+        code_hashes = [config_manager.code_hash, config_manager.code_hash]
+
+        # Assert
+        assert code_hashes == ["gs://bucket/source.zip:python311:main"] * 2
+
+    def test_code_hash_of_repository_source(self, config_manager):
+        # Arrange
+        function = functions_v1.CloudFunction(
+            source_repository=functions_v1.SourceRepository(
+                url="https://source.developers.google.com/projects/p/repos/r/moveable-aliases/main",
+                deployed_url="https://source.developers.google.com/projects/p/repos/r/revisions/abc",
+            ),
+            runtime="python311",
+            entry_point="main",
+        )
+        config_manager._function_client.get_function = mock.Mock(return_value=function)
+
+        # Action
+        code_hash = config_manager.code_hash
+
+        # Assert
+        assert code_hash == "https://source.developers.google.com/projects/p/repos/r/revisions/abc:python311:main"
+
+    def test_code_hash_without_source(self, config_manager):
+        # Arrange
+        config_manager._function_client.get_function = mock.Mock(return_value=functions_v1.CloudFunction())
+
+        # Action & Assert
+        assert config_manager.code_hash is None
@@ -1,3 +1,4 @@
+from concurrent.futures import Future
 from unittest import mock
 
 import pytest
@@ -60,6 +61,24 @@ class TestInvoke:
             invoker.invoke(payload="payload")
         assert e.type == InvocationError
 
+    @pytest.mark.parametrize("error", [TimeoutError(), RuntimeError("error")], ids=["TimeoutError", "RuntimeError"])
+    def test_log_collection_error_is_not_invoked_again(self, invoker, error):
+        result = type("", (), {})()
+        result.execution_id = "execution_id"
+        invoker._function_client.call_function = mock.Mock(return_value=result)
+        invoker._get_invocation_log = mock.Mock(side_effect=error)
+
+        with pytest.raises(InvocationError):
+            invoker.invoke(payload="payload")
+        invoker._function_client.call_function.assert_called_once()
+
+    def test_close_stops_log_collector(self, invoker):
+        invoker._log_collector = mock.Mock()
+
+        invoker.close()
+
+        invoker._log_collector.close.assert_called_once()
+
     @mock.patch("src.exploration.aws.aws_invoker.time.sleep")
     def test_max_number_of_invocations_attempts_reached_error(self, sleep, invoker):
         invoker._function_client.call_function = mock.Mock(
@@ -79,45 +98,15 @@ class TestInvoke:
 
 
 class TestGetInvocationLog:
-    @staticmethod
-    def create_log_object(payload):
-        res = type("", (), {})()
-        res.payload = payload
-        return res
-
-    @mock.patch("src.exploration.gcp.gcp_invoker.time")
-    def test_nominal_case(self, time, invoker):
-        # Arrange
-        time.sleep = mock.Mock()
-        entry_payload = "Function execution took 50 ms, finished with status code: 200"
-        expected_log = "execid:" + entry_payload + "\n"
-        invoker._logging_client = mock.Mock()
-        logs = [self.create_log_object(entry_payload)]
-        invoker._logging_client.list_entries = mock.Mock(
-            return_value=(i for i in logs)
-        )  # Mock to return a generator.
-
-        # Action
-        log = invoker._get_invocation_log("execid")
-
-        # Assert
-        assert log == expected_log
-        assert invoker._logging_client.list_entries.call_count == 1
-
-    @mock.patch("src.exploration.gcp.gcp_invoker.time")
-    def test_execution_time_not_in_first_log(self, time, invoker):
+    def test_nominal_case(self, invoker):
         # Arrange
-        time.sleep = mock.Mock()
-        entry_payload = "Function execution took 50 ms, finished with status code: 200"
-        expected_log = "execid:log\n" + entry_payload + "\n"
-        logs = ["log", entry_payload]
-        invoker._logging_client = mock.Mock()
-        logs = [self.create_log_object(log) for log in logs]
-        invoker._logging_client.list_entries = mock.Mock(return_value=(i for i in logs))
+        future = Future()
+        future.set_result("execid:Function execution took 50 ms, finished with status code: 200\n")
+        invoker._log_collector.submit = mock.Mock(return_value=future)
 
         # Action
         log = invoker._get_invocation_log("execid")
 
         # Assert
-        assert log == expected_log
-        assert invoker._logging_client.list_entries.call_count == 1
+        assert log == future.result()
+        invoker._log_collector.submit.assert_called_once_with("execid")
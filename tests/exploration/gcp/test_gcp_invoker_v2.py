@@ -1,5 +1,6 @@
 from unittest import mock
 import pytest
+from google.auth.transport.requests import AuthorizedSession
 from requests.exceptions import HTTPError
 from google.api_core.exceptions import GoogleAPICallError
 from src.exception import InvocationError, MaxInvocationAttemptsReachedError
@@ -24,7 +25,7 @@ def invoker(functions_v2, google_logging):
 
 
 class TestInvokeV2:
-    @mock.patch("src.exploration.gcp.gcp_invoker_v2.requests.post")
+    @mock.patch("src.exploration.gcp.gcp_invoker_v2.requests.Session.post")
     def test_nominal_case(self, mock_post, invoker):
         # Arrange
         mock_response = mock.Mock()
@@ -42,7 +43,7 @@ class TestInvokeV2:
             invoker.function_url, json={"key": "value"}
         )
 
-    @mock.patch("src.exploration.gcp.gcp_invoker_v2.requests.post")
+    @mock.patch("src.exploration.gcp.gcp_invoker_v2.requests.Session.post")
     def test_calling_error(self, mock_post, invoker):
         mock_post.side_effect = GoogleAPICallError("error")
 
@@ -51,7 +52,7 @@ class TestInvokeV2:
 
         assert e.type == InvocationError
 
-    @mock.patch("src.exploration.gcp.gcp_invoker_v2.requests.post")
+    @mock.patch("src.exploration.gcp.gcp_invoker_v2.requests.Session.post")
     def test_http_error(self, mock_post, invoker):
         mock_response = mock.Mock()
         mock_response.raise_for_status.side_effect = HTTPError("HTTP Error")
@@ -63,7 +64,7 @@ class TestInvokeV2:
         assert e.type == MaxInvocationAttemptsReachedError
 
     @mock.patch("src.exploration.gcp.gcp_invoker_v2.time.sleep")
-    @mock.patch("src.exploration.gcp.gcp_invoker_v2.requests.post")
+    @mock.patch("src.exploration.gcp.gcp_invoker_v2.requests.Session.post")
     def test_max_number_of_invocations_attempts_reached_error(self, mock_post, mock_sleep, invoker):
         mock_post.side_effect = Exception("Too Many Requests")
 
@@ -72,3 +73,30 @@ class TestInvokeV2:
 
         assert error.type == MaxInvocationAttemptsReachedError
         assert mock_post.call_count == defaults.MAX_NUMBER_OF_INVOCATION_ATTEMPTS
+
+
+class TestSession:
+    def test_reserve_connections(self, invoker):
+        invoker.reserve_connections(20)
+        invoker.reserve_connections(5)
+
+        assert invoker.pool_size == 20
+        assert invoker._session.get_adapter(invoker.function_url)._pool_maxsize == 20
+
+    def test_reserve_connections_closes_replaced_pool(self, invoker):
+        previous_adapter = invoker._session.get_adapter(invoker.function_url)
+        previous_adapter.close = mock.Mock()
+
+        invoker.reserve_connections(invoker.pool_size + 10)
+
+        previous_adapter.close.assert_called_once()
+        assert invoker._session.get_adapter(invoker.function_url) is not previous_adapter
+
+    @mock.patch("src.exploration.gcp.gcp_invoker_v2.id_token.fetch_id_token_credentials")
+    def test_id_token_authentication(self, fetch_id_token_credentials, invoker):
+        invoker.id_token_authentication = True
+
+        session = invoker._create_session()
+
+        assert isinstance(session, AuthorizedSession)
+        assert fetch_id_token_credentials.call_args[0][0] == invoker.function_url
@@ -0,0 +1,162 @@
+from datetime import datetime, timezone
+from unittest import mock
+
+import pytest
+from google.api_core.exceptions import GoogleAPICallError, ResourceExhausted
+
+from src.exception import InvocationError
+from src.exploration.gcp.gcp_log_collector import GCPLogCollector
+
+
+def create_entry(execution_id, payload):
+    entry = type("", (), {})()
+    entry.labels = {"execution_id": execution_id}
+    entry.payload = payload
+    return entry
+
+
+@pytest.fixture
+def collector():
+    collector = GCPLogCollector(
+        logging_client=mock.Mock(),
+        function_name="example_function",
+        region="example_region",
+        log_keys=["Function execution took", "finished with status"],
+        polling_interval_s=0,
+    )
+    yield collector
+    collector.close()
+
+
+class TestListLogs:
+    def test_batched_query(self, collector):
+        # Arrange
+        collector.logging_client.list_entries = mock.Mock(return_value=iter([
+            create_entry("id1", "Function execution took 50 ms, finished with status code: 200"),
+            create_entry("id2", "log"),
+            create_entry("other", "log"),
+        ]))
+        batch = {
+            "id1": (None, datetime(2024, 1, 1, 0, 20, tzinfo=timezone.utc)),
+            "id2": (None, datetime(2024, 1, 1, 0, 30, tzinfo=timezone.utc)),
+        }
+
+        # Action
+        logs = collector._list_logs(batch)
+
+        # Assert
+        assert logs == {
+            "id1": "id1:Function execution took 50 ms, finished with status code: 200\n",
+            "id2": "id2:log\n",
+        }
+        collector.logging_client.list_entries.assert_called_once()
+        filter_str = collector.logging_client.list_entries.call_args.kwargs["filter_"]
+        assert '(labels.execution_id="id1" OR labels.execution_id="id2")' in filter_str
+        assert 'timestamp>="2024-01-01T00:10:00Z"' in filter_str
+
+
+class TestSubmit:
+    def test_nominal_case(self, collector):
+        # Arrange
+        complete_log = "Function execution took 50 ms, finished with status code: 200"
+        queries = [
+            [create_entry("id1", complete_log), create_entry("id2", "log")],
+            [create_entry("id2", complete_log)],
+        ]
+        collector.logging_client.list_entries = mock.Mock(side_effect=lambda **kwargs: iter(queries.pop(0)))
+
+        # Action
+        futures = [collector.submit("id1"), collector.submit("id2")]
+
+        # Assert
+        assert futures[0].result(timeout=5) == f"id1:{complete_log}\n"
+        assert futures[1].result(timeout=5) == f"id2:{complete_log}\n"
+
+    def test_throttling(self, collector):
+        complete_log = "Function execution took 50 ms, finished with status code: 200"
+        collector.logging_client.list_entries = mock.Mock(
+            side_effect=[ResourceExhausted("quota"), iter([create_entry("id1", complete_log)])]
+        )
+
+        future = collector.submit("id1")
+
+        assert future.result(timeout=5) == f"id1:{complete_log}\n"
+        assert collector.logging_client.list_entries.call_count == 2
+
+    def test_logging_error(self, collector):
+        collector.logging_client.list_entries = mock.Mock(side_effect=GoogleAPICallError("error"))
+
+        future = collector.submit("id1")
+
+        with pytest.raises(GoogleAPICallError):
+            future.result(timeout=5)
+
+    def test_unexpected_error_fails_batch_only(self, collector):
+        complete_log = "Function execution took 50 ms, finished with status code: 200"
+        collector.logging_client.list_entries = mock.Mock(
+            side_effect=[ValueError("parsing"), iter([create_entry("id2", complete_log)])]
+        )
+
+        future = collector.submit("id1")
+        with pytest.raises(ValueError):
+            future.result(timeout=5)
+        future = collector.submit("id2")
+
+        assert future.result(timeout=5) == f"id2:{complete_log}\n"
+
+    def test_missing_logs_expire(self, collector):
+        collector.max_wait_s = 0.05
+        collector.logging_client.list_entries = mock.Mock(side_effect=lambda **kwargs: iter([]))
+
+        future = collector.submit("id1")
+
+        with pytest.raises(InvocationError):
+            future.result(timeout=5)
+
+    def test_stuck_executions_do_not_starve_others(self, collector):
+        complete_log = "Function execution took 50 ms, finished with status code: 200"
+        collector.max_batch_size = 1
+        queried = []
+
+        def list_entries(filter_, **kwargs):
+            queried.append(filter_)
+            return iter([create_entry("id2", complete_log)])
+
+        collector.logging_client.list_entries = mock.Mock(side_effect=list_entries)
+
+        stuck = collector.submit("id1")
+        future = collector.submit("id2")
+
+        assert future.result(timeout=5) == f"id2:{complete_log}\n"
+        assert not stuck.done()
+
+    @mock.patch("src.exploration.gcp.gcp_log_collector.time.sleep")
+    def test_throttling_backoff_is_capped(self, sleep, collector):
+        complete_log = "Function execution took 50 ms, finished with status code: 200"
+        collector.polling_interval_s = 1
+        collector.logging_client.list_entries = mock.Mock(
+            side_effect=[ResourceExhausted("quota")] * 10 + [iter([create_entry("id1", complete_log)])]
+        )
+
+        future = collector.submit("id1")
+
+        assert future.result(timeout=5) == f"id1:{complete_log}\n"
+        assert max(call.args[0] for call in sleep.call_args_list) == GCPLogCollector.MAX_BACKOFF_S
+
+    def test_close_stops_collection_until_next_submission(self, collector):
+        # Arrange
+        complete_log = "Function execution took 50 ms, finished with status code: 200"
+        collector.logging_client.list_entries = mock.Mock(
+            side_effect=lambda **kwargs: iter([create_entry("id1", complete_log), create_entry("id2", complete_log)])
+        )
+        collector.submit("id1").result(timeout=5)
+
+        # Action
+        collector.close()
+        collector._thread.join(timeout=5)
+        stopped = not collector._thread.is_alive()
+        log = collector.submit("id2").result(timeout=5)
+
+        # Assert
+        assert stopped
+        assert log == f"id2:{complete_log}\n"
@@ -0,0 +1,116 @@
+import numpy as np
+import pytest
+
+from src.exception import *
+from src.exploration import SimulatedExplorer, SimulatedExplorer2D, SimulatedFunction
+from src.exploration.cold_start import WARMUP
+
+
+@pytest.fixture
+def function():
+    return SimulatedFunction(
+        name="function",
+        duration_function=lambda memory_mb: 100 + 128000 / memory_mb,
+        noise_cv=0,
+        cold_start_ms=500,
+        memory_used_mb=200,
+        random_seed=0,
+    )
+
+
+class TestSimulatedExplorer:
+    def test_explore_parallel_returns_warm_durations(self, function):
+        # Arrange
+        explorer = SimulatedExplorer(function)
+
+        # Action
+        results = explorer.explore_parallel(nbr_invocations=4, nbr_threads=4, memory_mb=256)
+
+        # Assert
+        assert results == [600] * 4
+        # The cold starts of the 4 instances were detected from their logs and replaced.
+        assert [duration for _, _, duration in function.invocations] == [1100] * 4 + [600] * 4
+        assert function.nbr_reconfigurations == 1
+        assert explorer.cost == pytest.approx(8 * 2 * 10 ** (-7) + 4 * 0.0000166667 * 0.25 * (1.1 + 0.6))
+
+    def test_more_threads_than_warm_instances_cold_start(self, function):
+        # Arrange
+        explorer = SimulatedExplorer(function, cold_start_detection=WARMUP)
+        explorer.explore_parallel(nbr_invocations=2, nbr_threads=2, memory_mb=256)
+
+        # Action
+        results = explorer.explore_parallel(nbr_invocations=4, nbr_threads=4)
+
+        # Assert
+        assert sorted(results) == [600, 600, 1100, 1100]
+
+    def test_only_cold_invocations_are_replaced(self, function):
+        # Arrange
+        explorer = SimulatedExplorer(function)
+        explorer.explore_parallel(nbr_invocations=2, nbr_threads=2, memory_mb=256)
+        nbr_invocations = len(function.invocations)
+
+        # Action
+        results = explorer.explore_parallel(nbr_invocations=4, nbr_threads=4)
+
+        # Assert
+        assert results == [600] * 4
+        # The 2 new instances' cold starts were replaced by 2 invocations, instead of a warm-up round of 4.
+        assert len(function.invocations) - nbr_invocations == 6
+
+    def test_explore_with_less_memory_than_used_raises_enomem(self, function):
+        # Arrange
+        explorer = SimulatedExplorer(function)
+
+        # Action & Assert
+        with pytest.raises(FunctionENOMEM):
+            explorer.explore_parallel(nbr_invocations=2, nbr_threads=2, memory_mb=128)
+
+    def test_recorded_durations_are_replayed(self):
+        # Arrange
+        function = SimulatedFunction(
+            name="recorded", recorded_durations={128: [300, 310], 256: [150, 160]}, noise_cv=0, random_seed=0
+        )
+        explorer = SimulatedExplorer(function)
+
+        # Action
+        results = explorer.explore_parallel(nbr_invocations=10, nbr_threads=2, memory_mb=256)
+
+        # Assert
+        assert sorted(explorer.memory_space) == [128, 256]
+        assert set(results) <= {150, 160}
+        np.testing.assert_array_equal(function.median_durations([128, 256]), [305, 155])
+
+    def test_noise_keeps_the_median_duration(self, function):
+        # Arrange
+        function.noise_cv = 0.1
+        explorer = SimulatedExplorer(function)
+
+        # Action
+        results = explorer.explore_parallel(nbr_invocations=400, nbr_threads=10, memory_mb=1024)
+
+        # Assert
+        assert np.median(results) == pytest.approx(225, rel=0.02)
+        assert np.std(results) / np.mean(results) == pytest.approx(0.1, rel=0.2)
+
+
+class TestSimulatedExplorer2D:
+    def test_explore_parallel(self):
+        # Arrange
+        function = SimulatedFunction(
+            name="function",
+            duration_function=lambda config: 100 + 100 / config[0],
+            noise_cv=0,
+            memory_used_mb=200,
+            cpu_configurable=True,
+        )
+        explorer = SimulatedExplorer2D(function)
+
+        # Action
+        results = explorer.explore_parallel(nbr_invocations=2, nbr_threads=2, cpu=0.5, memory_mb=512)
+
+        # Assert
+        assert results == [300, 300]
+        assert (0.08, 128) in map(tuple, explorer.cpu_mem_space)
+        with pytest.raises(FunctionENOMEM):
+            explorer.explore_parallel(nbr_invocations=2, nbr_threads=2, cpu=0.5, memory_mb=128)
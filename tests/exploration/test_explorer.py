@@ -4,6 +4,7 @@ from unittest import mock
 import pytest
 
 from src.exception import *
+from src.exploration.cold_start import HEURISTIC, LOG, MAX_REPLACEMENT_ROUNDS, WARMUP
 from tests.mocks import MockExplorer
 
 
@@ -13,8 +14,8 @@ class TestExploreParallel:
         return MockExplorer()
 
     @mock.patch("src.exploration.explorer.as_completed")
-    @mock.patch("src.exploration.explorer.ThreadPoolExecutor")
-    def test_parallel_execution(self, executor, as_completed, explorer):
+    @mock.patch("src.exploration.explorer.InvocationPool")
+    def test_parallel_execution(self, invocation_pool, as_completed, explorer):
         # Arrange
         class MockFuture(concurrent.futures.Future):
             def __init__(self, result):
@@ -24,7 +25,6 @@ class TestExploreParallel:
             def result(self, timeout=None):
                 return self._result
 
-        executor.return_value.submit = lambda _, payload: None
         as_completed.return_value = [MockFuture(300), MockFuture(400), MockFuture(200)]
         explorer.check_and_set_memory_config = mock.Mock()
         explorer.price_calculator.calculate_price = mock.Mock(return_value=10)
@@ -44,8 +44,8 @@ class TestExploreParallel:
         ids=["InvocationError", "FunctionENOMEM"],
     )
     @mock.patch("src.exploration.explorer.as_completed")
-    @mock.patch("src.exploration.explorer.ThreadPoolExecutor")
-    def test_invocation_error(self, executor, as_completed, error, explorer):
+    @mock.patch("src.exploration.explorer.InvocationPool")
+    def test_invocation_error(self, invocation_pool, as_completed, error, explorer):
         # Arrange
         class MockFuture(concurrent.futures.Future):
             def __init__(self, result):
@@ -55,7 +55,6 @@ class TestExploreParallel:
             def result(self, timeout=None):
                 raise error
 
-        executor.return_value.submit = lambda _, payload: None
         as_completed.return_value = [MockFuture(300)]
         explorer.price_calculator.calculate_price = mock.Mock(return_value=10)
 
@@ -66,6 +65,23 @@ class TestExploreParallel:
         assert explorer.cost == 10
 
 
+    def test_slow_invocations_are_replaced(self, explorer):
+        # Arrange
+        explorer.cold_start_detection = HEURISTIC
+        explorer.log_parser.parse_log = mock.Mock(side_effect=[1000, 300, 310, 290, 305])
+        explorer.price_calculator.calculate_price = mock.Mock(return_value=10)
+
+        # Action
+        results = explorer.explore_parallel(4, 1, memory_mb=512)
+
+        # Assert
+        explorer.config_manager.set_config.assert_called_once_with(512)
+        # The cold invocation was paid for and replaced, without a warm-up round.
+        assert sorted(results) == [290, 300, 305, 310]
+        assert explorer.log_parser.parse_log.call_count == 5
+        assert explorer.cost == 20
+
+
 class TestExplore:
     @pytest.fixture
     def explorer(self):
@@ -89,6 +105,27 @@ class TestExplore:
 
         assert explorer.config_manager.set_config.called
 
+    @pytest.mark.parametrize(
+        "cold_start_detection, nbr_invocations", [(WARMUP, 2), (LOG, 1), (HEURISTIC, 1)]
+    )
+    def test_only_warmup_invokes_after_config_update(self, explorer, cold_start_detection, nbr_invocations):
+        explorer.cold_start_detection = cold_start_detection
+        explorer.log_parser.is_cold_start = mock.Mock(return_value=False)
+
+        explorer.explore(memory_mb=128)
+
+        assert explorer.log_parser.parse_log.call_count == nbr_invocations
+
+    def test_still_cold_invocations_are_reported(self, explorer, caplog):
+        explorer.cold_start_detection = LOG
+        explorer.log_parser.is_cold_start = mock.Mock(return_value=True)
+
+        duration_ms = explorer.explore()
+
+        assert duration_ms == 18180
+        assert explorer.log_parser.parse_log.call_count == 1 + MAX_REPLACEMENT_ROUNDS
+        assert "still cold" in caplog.text
+
     def test_function_config_error(self, explorer):
         explorer.config_manager.set_config = mock.Mock(
             side_effect=FunctionConfigError("error")
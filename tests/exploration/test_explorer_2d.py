@@ -2,6 +2,7 @@ import concurrent.futures
 from unittest import mock
 import pytest
 from src.exception import *
+from src.exploration.cold_start import HEURISTIC
 from tests.mocks import MockExplorer2D
 
 class TestExploreParallel2D:
@@ -10,8 +11,8 @@ class TestExploreParallel2D:
         return MockExplorer2D()
 
     @mock.patch("src.exploration.explorer_2d.as_completed")
-    @mock.patch("src.exploration.explorer_2d.ThreadPoolExecutor")
-    def test_parallel_execution(self, executor, as_completed, explorer):
+    @mock.patch("src.exploration.explorer_2d.InvocationPool")
+    def test_parallel_execution(self, invocation_pool, as_completed, explorer):
         # Arrange
         class MockFuture(concurrent.futures.Future):
             def __init__(self, result):
@@ -21,7 +22,6 @@ class TestExploreParallel2D:
             def result(self, timeout=None):
                 return self._result
 
-        executor.return_value.submit = lambda _, payload: None
         as_completed.return_value = [MockFuture(300), MockFuture(400), MockFuture(200)]
         explorer.check_and_set_memory_config = mock.Mock()
         explorer.price_calculator.calculate_price = mock.Mock(return_value=10)
@@ -41,8 +41,8 @@ class TestExploreParallel2D:
         ids=["InvocationError", "FunctionENOMEM"],
     )
     @mock.patch("src.exploration.explorer_2d.as_completed")
-    @mock.patch("src.exploration.explorer_2d.ThreadPoolExecutor")
-    def test_invocation_error(self, executor, as_completed, error, explorer):
+    @mock.patch("src.exploration.explorer_2d.InvocationPool")
+    def test_invocation_error(self, invocation_pool, as_completed, error, explorer):
         # Arrange
         class MockFuture(concurrent.futures.Future):
             def __init__(self, result):
@@ -52,7 +52,6 @@ class TestExploreParallel2D:
             def result(self, timeout=None):
                 raise error
 
-        executor.return_value.submit = lambda _, payload: None
         as_completed.return_value = [MockFuture(300)]
         explorer.price_calculator.calculate_price = mock.Mock(return_value=10)
 
@@ -63,6 +62,20 @@ class TestExploreParallel2D:
         assert explorer.cost == 0  # Cost calculation commented out in the code
 
 
+    def test_slow_invocations_are_replaced(self, explorer):
+        # Arrange
+        explorer.cold_start_detection = HEURISTIC
+        explorer.invoker.invoke = mock.Mock(side_effect=[1000, 300, 310, 290, 305])
+
+        # Action
+        results = explorer.explore_parallel(4, 1, cpu=0.5, memory_mb=512)
+
+        # Assert
+        explorer.config_manager.set_config.assert_called_once_with(memory_mb=512, cpu=0.5)
+        assert sorted(results) == [290, 300, 305, 310]
+        assert explorer.invoker.invoke.call_count == 5
+
+
 class TestExplore2D:
     @pytest.fixture
     def explorer(self):
@@ -0,0 +1,75 @@
+import threading
+import time
+
+import pytest
+
+from src.exploration.invocation_pool import InvocationPool
+
+
+class TestInvocationPool:
+    def test_results_in_order(self):
+        # Arrange
+        pool = InvocationPool(max_workers=4)
+        calls = [lambda i=i: i * 10 for i in range(6)]
+
+        # Action
+        futures = pool.submit_all(calls, max_concurrency=3)
+
+        # Assert
+        assert [future.result() for future in futures] == [0, 10, 20, 30, 40, 50]
+
+    def test_max_concurrency(self):
+        # Arrange
+        pool = InvocationPool(max_workers=8)
+        lock = threading.Lock()
+        in_flight = []
+        max_in_flight = []
+
+        def call():
+            with lock:
+                in_flight.append(1)
+                max_in_flight.append(len(in_flight))
+            time.sleep(0.01)
+            with lock:
+                in_flight.pop()
+
+        # Action
+        for future in pool.submit_all([call] * 8, max_concurrency=2):
+            future.result()
+
+        # Assert
+        assert max(max_in_flight) == 2
+
+    def test_errors_are_set_on_their_futures(self):
+        # Arrange
+        pool = InvocationPool(max_workers=2)
+
+        def fail():
+            raise RuntimeError("error")
+
+        # Action
+        futures = pool.submit_all([fail, lambda: 1], max_concurrency=2)
+
+        # Assert
+        with pytest.raises(RuntimeError):
+            futures[0].result()
+        assert futures[1].result() == 1
+
+    def test_shared_by_the_explorers(self):
+        assert InvocationPool.shared() is InvocationPool.shared()
+
+    def test_rounds_share_the_workers(self):
+        # Arrange
+        pool = InvocationPool(max_workers=2)
+        thread_names = set()
+
+        def call():
+            thread_names.add(threading.current_thread().name)
+
+        # Action
+        for _ in range(5):
+            for future in pool.submit_all([call] * 4, max_concurrency=2):
+                future.result()
+
+        # Assert
+        assert len(thread_names) <= 2
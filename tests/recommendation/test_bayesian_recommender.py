@@ -0,0 +1,77 @@
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from src.exception import *
+from src.objective import ParametricFunction
+from src.recommendation import BayesianRecommender
+from src.sampling import Sample
+from src.sampling.data_point import DataPoint
+
+
+def create_sample(memories, function, noise=0.0, seed=0):
+    rng = np.random.default_rng(seed)
+    return Sample([
+        DataPoint(memory, function(memory) * (1 + noise * rng.standard_normal()))
+        for memory in memories
+        for _ in range(4)
+    ])
+
+
+@pytest.fixture
+def recommender():
+    objective = mock.Mock()
+    objective.param_function = ParametricFunction()
+    sampler = mock.Mock()
+    sampler.memory_space = np.arange(128, 3009, 64)
+    return BayesianRecommender(objective, sampler, 20, nbr_bootstrap_samples=10, random_seed=0)
+
+
+class TestChooseMemoryToExplore:
+    def test_uncertain_minimum(self, recommender):
+        # Arrange
+        true_function = ParametricFunction(params=[100, 20000, 300])
+        recommender.sampler.sample = create_sample([128, 1088, 3008], true_function, noise=0.1)
+        recommender.objective.param_function.fit(recommender.sampler.sample)
+
+        # Action
+        recommender._update_surrogate()
+        memory = recommender._choose_memory_to_explore()
+
+        # Assert
+        assert memory in recommender.sampler.memory_space
+        assert memory not in {128, 1088, 3008}
+        assert not recommender._is_termination_reached
+
+    def test_no_memory_left(self, recommender):
+        recommender.sampler.memory_space = np.array([128, 1024, 3008])
+        recommender.sampler.sample = create_sample([128, 1024, 3008], lambda memory: 1000)
+
+        recommender._update_surrogate()
+
+        assert recommender._is_termination_reached
+        with pytest.raises(NoMemoryLeftError):
+            recommender._choose_memory_to_explore()
+
+
+class TestTermination:
+    def test_confident_minimum(self, recommender):
+        # Arrange
+        true_function = ParametricFunction(params=[100, 1000, 300])
+        recommender.sampler.sample = create_sample([128, 1088, 3008], true_function)
+        recommender.objective.param_function.params = true_function.params
+
+        # Action
+        recommender._update_surrogate()
+
+        # Assert
+        # Without noise, the cheapest configuration is known to be the smallest one.
+        assert recommender._is_termination_reached
+
+    def test_max_total_sample_count(self, recommender):
+        recommender._remainder_memories = np.array([256])
+        recommender._expected_improvements = np.array([1.0])
+        recommender.sampler.sample = create_sample(range(128, 1024, 128), lambda memory: 1000)
+
+        assert recommender._is_termination_reached
@@ -44,4 +44,31 @@ class TestFittingFunction:
         with pytest.raises(ValueError) as e:
             cpu_mem_duration_function.fit(sample)
 
-        assert e.type == ValueError
\ No newline at end of file
+        assert e.type == ValueError
+
+class TestMinimize:
+    def test_minimize_batch(self, cpu_mem_duration_function):
+        cpu_mem_duration_function.params = [0.01, -0.001, 1, 0.1, 0.1]
+        cpu_mem_space = np.array([[cpu, mem] for cpu in [0.08, 0.5, 1.0] for mem in range(128, 1025, 128)])
+        thresholds = [None, 0.2, None]
+        tolerances = [None, None, 20]
+
+        results = cpu_mem_duration_function.minimize_batch(cpu_mem_space, thresholds, tolerances)
+
+        assert results.shape == (3, 2)
+        assert all(
+            list(result) == list(cpu_mem_duration_function.minimize(cpu_mem_space, threshold, tolerance))
+            for result, threshold, tolerance in zip(results, thresholds, tolerances)
+        )
+
+
+class TestParetoFrontier:
+    def test_nominal_case(self, cpu_mem_duration_function):
+        cpu_mem_duration_function.params = [0.01, -0.001, 1, 0.1, 0.1]
+        cpu_mem_space = np.array([[cpu, mem] for cpu in [0.08, 0.5, 1.0] for mem in range(128, 1025, 128)])
+
+        cpu_mems, costs, execution_times = cpu_mem_duration_function.pareto_frontier(cpu_mem_space)
+
+        assert cpu_mems.shape == (len(costs), 2)
+        assert np.all(np.diff(costs) > 0)
+        assert np.all(np.diff(execution_times) < 0)
@@ -0,0 +1,103 @@
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from src.exception import *
+from src.recommendation import MultiPayloadRecommender
+from src.sampling import Sample
+from src.sampling.data_point import DataPoint
+
+
+@pytest.fixture
+def multi_payload_recommender():
+    explorer = mock.Mock()
+    explorer.memory_config_mb = 0
+    recommenders = []
+    for _ in range(3):
+        recommender = mock.Mock()
+        recommender.sampler.explorer = explorer
+        recommender.sampler.memory_space = np.array([128, 256, 512, 1024])
+        recommender.sampler.sample = Sample([DataPoint(128, 200), DataPoint(1024, 100)])
+        recommender._is_termination_reached = False
+        recommenders.append(recommender)
+    return MultiPayloadRecommender(recommenders, ["p0", "p1", "p2"], [0.5, 0.3, 0.2])
+
+
+class TestInitialize:
+    def test_nominal_case(self, multi_payload_recommender):
+        # Arrange
+        explorer = multi_payload_recommender.recommenders[0].sampler.explorer
+        explored = []
+
+        def mock_update_sample(memory_mb, reconfigure):
+            explored.append((explorer.payload, memory_mb, reconfigure))
+            explorer.memory_config_mb = memory_mb
+
+        for recommender in multi_payload_recommender.recommenders[1:]:
+            recommender.sampler.update_sample = mock_update_sample
+        explorer.memory_config_mb = 1024
+
+        # Action
+        multi_payload_recommender._initialize()
+
+        # Assert
+        multi_payload_recommender.recommenders[0]._initialize.assert_called_once()
+        # Starting from the current configuration, the function is reconfigured once per memory.
+        assert explored == [
+            ("p1", 1024, False), ("p2", 1024, False), ("p1", 128, True), ("p2", 128, False)
+        ]
+        for recommender in multi_payload_recommender.recommenders[1:]:
+            recommender.sampler.reset_sample.assert_called_once()
+            recommender._learn_sample.assert_called_once()
+
+
+class TestRun:
+    def test_nominal_case(self, multi_payload_recommender):
+        # Arrange
+        recommenders = multi_payload_recommender.recommenders
+        multi_payload_recommender._initialize = mock.Mock()
+        multi_payload_recommender._choose_memory_to_explore = mock.Mock(return_value=512)
+        recommenders[1]._is_termination_reached = True
+
+        def mock_update(memory_mb, reconfigure):
+            recommenders[0]._is_termination_reached = True
+            recommenders[2]._is_termination_reached = True
+
+        recommenders[0]._update = mock.Mock(side_effect=mock_update)
+
+        # Action
+        multi_payload_recommender.run()
+
+        # Assert
+        multi_payload_recommender._choose_memory_to_explore.assert_called_once_with([0, 2])
+        recommenders[0]._update.assert_called_once_with(512, reconfigure=True)
+        recommenders[1]._update.assert_not_called()
+        recommenders[2]._update.assert_called_once_with(512, reconfigure=True)
+        assert recommenders[2].sampler.explorer.payload == "p2"
+
+
+class TestChooseMemoryToExplore:
+    def test_nominal_case(self, multi_payload_recommender):
+        # Arrange
+        recommenders = multi_payload_recommender.recommenders
+        recommenders[0].objective.get_values = mock.Mock(return_value=np.array([10, 1]))
+        recommenders[1].objective.get_values = mock.Mock(return_value=np.array([0, 100]))
+        recommenders[2].objective.get_values = mock.Mock(return_value=np.array([1, 10]))
+
+        # Action
+        memory = multi_payload_recommender._choose_memory_to_explore([0, 2])
+
+        # Assert
+        assert memory == 512
+        np.testing.assert_array_equal(
+            recommenders[0].objective.get_values.call_args[0][0], np.array([256, 512])
+        )
+        recommenders[1].objective.get_values.assert_not_called()
+
+    def test_no_memory_left(self, multi_payload_recommender):
+        for recommender in multi_payload_recommender.recommenders:
+            recommender.sampler.memory_space = np.array([128, 1024])
+
+        with pytest.raises(NoMemoryLeftError):
+            multi_payload_recommender._choose_memory_to_explore([0, 1, 2])
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+import scipy.stats as stats
+
+from src.objective import Objective, ParametricFunction
+
+
+@pytest.fixture
+def objective():
+    param_function = ParametricFunction(params=[10, 1000, 500])
+    memory_space = np.array(list(set(range(128, 3009))), dtype=int)
+    return Objective(param_function, memory_space, 3)
+
+
+class TestKnowledge:
+    def test_update_knowledge(self, objective):
+        # Action
+        objective.update_knowledge(1024)
+        objective.update_knowledge(2048)
+
+        # Assert
+        memories = np.array([128, 1024, 1500, 2048, 3008])
+        expected = 1.0 + np.array(
+            [
+                sum(
+                    stats.norm.pdf(memory, m, 200) / stats.norm.pdf(m, m, 200)
+                    for m in [1024, 2048]
+                )
+                for memory in memories
+            ]
+        )
+        assert np.allclose(objective.get_knowledge(memories), expected)
+
+    def test_get_knowledge_unsorted_memory_space(self):
+        memory_space = np.array([512, 128, 1024, 256])
+        objective = Objective(ParametricFunction(), memory_space, 3)
+
+        objective.update_knowledge(128)
+
+        assert np.allclose(
+            objective.get_knowledge(np.array([1024, 128])),
+            [1.0 + np.exp(-0.5 * (896 / 200) ** 2), 2.0],
+        )
+
+    def test_reset(self, objective):
+        objective.update_knowledge(1024)
+
+        objective.reset()
+
+        assert objective.param_function.params is None
+        assert np.all(objective.get_knowledge(objective.memory_space) == 1.0)
+
+
+class TestTerminationValue:
+    def test_termination_value(self, objective):
+        # The cost (10 + exp(-x / 500)) * x is minimized at the smallest memory.
+        objective.param_function.params = [10, 1, 500]
+        objective.update_knowledge(128)
+
+        assert objective.termination_value == pytest.approx(2.0)
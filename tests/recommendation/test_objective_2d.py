@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+import scipy.stats as stats
+
+from src.objective import Objective2D, CpuMemDurationFunction
+
+
+@pytest.fixture
+def objective_2d():
+    cpu_mem_space = np.array(
+        [[0.08, m] for m in range(128, 513, 128)] + [[1.0, m] for m in range(128, 2049, 128)]
+    )
+    return Objective2D(CpuMemDurationFunction(), cpu_mem_space, 3)
+
+
+class TestKnowledge:
+    def test_update_knowledge(self, objective_2d):
+        # Action
+        objective_2d.update_knowledge(0.08, 256)
+        objective_2d.update_knowledge(1.0, 1024)
+
+        # Assert
+        cpu_mems = objective_2d.cpu_memory_space
+        covariance = [[0.2**2, 0], [0, 400**2]]
+        expected = 1.0 + np.array(
+            [
+                sum(
+                    stats.multivariate_normal.pdf([c, m], center, covariance)
+                    / stats.multivariate_normal.pdf(center, center, covariance)
+                    for center in [[0.08, 256], [1.0, 1024]]
+                )
+                for [c, m] in cpu_mems
+            ]
+        )
+        assert np.allclose(objective_2d.get_knowledge(cpu_mems), expected)
+
+    def test_reset(self, objective_2d):
+        objective_2d.update_knowledge(0.08, 256)
+
+        objective_2d.reset()
+
+        assert objective_2d.cpu_mem_duration_function.params is None
+        assert np.all(objective_2d.get_knowledge(objective_2d.cpu_memory_space) == 1.0)
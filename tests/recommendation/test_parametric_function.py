@@ -1,3 +1,5 @@
+from unittest import mock
+
 import numpy as np
 import pytest
 
@@ -45,3 +47,105 @@ class TestFittingFunction:
             param_function.fit(sample)
 
         assert e.type == ValueError
+
+    def test_fit_function_falls_back_to_robust_loss(self, param_function):
+        memories = np.array([128, 256, 512, 1024])
+        billed_time = np.array([30, 20, 10, 6])
+        sample = Sample(
+            [
+                DataPoint(memory_mb=mem, duration_ms=time)
+                for mem, time in zip(memories, billed_time)
+            ]
+        )
+        # A budget too small for the first attempt to converge.
+        param_function.max_function_evaluations = 1
+
+        with mock.patch(
+            "src.objective.parametric_function.curve_fit",
+            side_effect=[RuntimeError("max evaluations"), (np.array([1, 2, 3]), None)],
+        ) as curve_fit:
+            param_function.fit(sample)
+
+        assert curve_fit.call_args.kwargs["loss"] == "soft_l1"
+        assert list(param_function.params) == [1, 2, 3]
+
+
+class TestJacobian:
+    def test_analytic_jacobian(self, param_function):
+        x = np.array([128.0, 512.0, 3008.0])
+        params = np.array([10.0, 1000.0, 400.0])
+        eps = 1e-6
+
+        jacobian = param_function.jacobian(x, *params)
+
+        for i in range(len(params)):
+            delta = np.zeros(len(params))
+            delta[i] = eps * max(1.0, abs(params[i]))
+            numerical = (
+                param_function.function(x, *(params + delta))
+                - param_function.function(x, *(params - delta))
+            ) / (2 * delta[i])
+            assert np.allclose(jacobian[:, i], numerical, rtol=1e-5)
+
+
+class TestMinimize:
+    @pytest.fixture
+    def param_function(self):
+        # Execution time decreases with memory, cost is minimized at the smallest memory.
+        return ParametricFunction(params=[10, 100, 1000])
+
+    def test_minimize(self, param_function):
+        memory_space = np.arange(128, 3009)
+
+        assert param_function.minimize(memory_space) == 128
+
+    def test_execution_time_threshold(self, param_function):
+        memory_space = np.arange(128, 3009)
+
+        feasible_memories = memory_space[param_function(memory_space) <= 50]
+
+        min_memory = param_function.minimize(memory_space, constraint_execution_time_threshold=50)
+
+        assert min_memory == feasible_memories[np.argmin(param_function(feasible_memories) * feasible_memories)]
+
+    def test_unfeasible_execution_time_threshold(self, param_function):
+        memory_space = np.arange(128, 3009)
+
+        assert param_function.minimize(memory_space, constraint_execution_time_threshold=1) == 128
+
+    def test_minimize_batch(self, param_function):
+        memory_space = np.arange(128, 3009)
+        thresholds = [None, 50, 1, None]
+        tolerances = [None, None, None, 10]
+
+        results = param_function.minimize_batch(memory_space, thresholds, tolerances)
+
+        assert list(results) == [
+            param_function.minimize(memory_space, threshold, tolerance)
+            for threshold, tolerance in zip(thresholds, tolerances)
+        ]
+
+
+class TestParetoFrontier:
+    def test_nominal_case(self):
+        param_function = ParametricFunction(params=[10, 100, 1000])
+        memory_space = np.arange(128, 3009)
+
+        memories, costs, execution_times = param_function.pareto_frontier(memory_space)
+
+        assert memories[0] == param_function.minimize(memory_space)
+        assert np.all(np.diff(costs) > 0)
+        assert np.all(np.diff(execution_times) < 0)
+        # No configuration beats a frontier configuration on both cost and execution time.
+        all_execution_times = param_function(memory_space)
+        all_costs = all_execution_times * memory_space
+        for cost, execution_time in zip(costs, execution_times):
+            assert not np.any((all_costs < cost) & (all_execution_times < execution_time))
+
+    def test_constant_function(self):
+        param_function = ParametricFunction(params=[10, 100, 0])
+
+        memories, costs, execution_times = param_function.pareto_frontier(np.array([256, 128, 512]))
+
+        assert list(memories) == [128]
+        assert list(execution_times) == [10]
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from src.sampling import Sample, Sample2D
+from src.sampling.data_point import DataPoint
+from src.sampling.data_point_2d import DataPoint2D
+
+
+class TestSample:
+    def test_datapoints_are_sorted_by_memory_in_insertion_order(self):
+        # Arrange
+        sample = Sample([DataPoint(1024, 100), DataPoint(128, 400)])
+
+        # Action
+        sample.update([DataPoint(1024, 110), DataPoint(512, 200)])
+        sample.update(DataPoint(128, 410))
+
+        # Assert
+        np.testing.assert_array_equal(sample.memories, [128, 128, 512, 1024, 1024])
+        np.testing.assert_array_equal(sample.durations, [400, 410, 200, 100, 110])
+        np.testing.assert_array_equal(sample.costs, sample.memories * sample.durations)
+        assert len(sample) == 5
+
+    def test_reads_are_cached_read_only_views(self):
+        # Arrange
+        sample = Sample([DataPoint(256, 100), DataPoint(128, 200)])
+
+        # Action
+        memories = sample.memories
+
+        # Assert
+        assert sample.memories is memories
+        assert sample.costs is sample.costs
+        with pytest.raises(ValueError):
+            memories[0] = 0
+
+    def test_views_are_snapshots_of_the_sample(self):
+        # Arrange
+        sample = Sample([DataPoint(512, 100), DataPoint(1024, 50)])
+        durations = sample.durations
+
+        # Action
+        sample.update([DataPoint(128, 400)] * 100)
+
+        # Assert
+        np.testing.assert_array_equal(durations, [100, 50])
+        assert len(sample.durations) == 102
+        assert sample.durations[0] == 400
+
+    def test_from_arrays(self):
+        # Action
+        sample = Sample.from_arrays(np.array([512, 128]), np.array([100.0, 300.0]))
+
+        # Assert
+        np.testing.assert_array_equal(sample.memories, [128, 512])
+        assert sample.memories.dtype == int
+
+    def test_update_with_wrong_type_raises_type_error(self):
+        with pytest.raises(TypeError):
+            Sample().update((128, 100))
+
+
+class TestSample2D:
+    def test_datapoints_are_sorted_by_cpu_and_memory(self):
+        # Arrange
+        sample = Sample2D([DataPoint2D(0.21, 896, 300), DataPoint2D(0.08, 512, 500)])
+
+        # Action
+        sample.update([DataPoint2D(0.08, 128, 900), DataPoint2D(0.21, 896, 310)])
+
+        # Assert
+        np.testing.assert_array_equal(sample.cpu_mems, [[0.08, 128], [0.08, 512], [0.21, 896], [0.21, 896]])
+        np.testing.assert_array_equal(sample.durations, [0.9, 0.5, 0.3, 0.31])
+        assert sample.cpu_mems is sample.cpu_mems
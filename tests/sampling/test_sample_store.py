@@ -0,0 +1,40 @@
+from unittest import mock
+
+import pytest
+
+from src.sampling import SampleStore
+from src.sampling.data_point import DataPoint
+
+
+@pytest.fixture
+def sample_store(tmp_path) -> SampleStore:
+    return SampleStore(str(tmp_path / "samples.db"), max_age_hours=1)
+
+
+class TestSampleStore:
+    def test_add_and_load(self, sample_store):
+        sample_store.add("function", "code", "payload", [DataPoint(128, 300), DataPoint(256, 200)])
+
+        assert sample_store.load("function", "code", "payload") == [DataPoint(128, 300), DataPoint(256, 200)]
+        assert sample_store.load("function", "code", "payload", 256) == [DataPoint(256, 200)]
+
+    def test_key_mismatch(self, sample_store):
+        sample_store.add("function", "code", "payload", [DataPoint(128, 300)])
+
+        assert sample_store.load("other_function", "code", "payload") == []
+        assert sample_store.load("function", "new_code", "payload") == []
+        assert sample_store.load("function", "code", "other_payload") == []
+
+    def test_stale_datapoints(self, sample_store):
+        with mock.patch("src.sampling.sample_store.time.time", return_value=0):
+            sample_store.add("function", "code", "payload", [DataPoint(128, 300)])
+
+        assert sample_store.load("function", "code", "payload") == []
+
+    def test_limit_returns_most_recent(self, sample_store):
+        with mock.patch("src.sampling.sample_store.time.time", return_value=0):
+            sample_store.add("function", "code", "payload", [DataPoint(128, 300)])
+        sample_store.max_age_hours = None
+        sample_store.add("function", "code", "payload", [DataPoint(128, 100)])
+
+        assert sample_store.load("function", "code", "payload", 128, limit=1) == [DataPoint(128, 100)]
@@ -7,6 +7,7 @@ from src.configuration import defaults
 from src.exception import *
 from src.sampling import *
 from src.sampling.data_point import DataPoint
+from src.sampling.running_statistics import RunningStatistics, median_confidence_interval
 from tests.mocks import MockExplorer
 
 
@@ -58,6 +59,54 @@ class TestInitializeSample:
         assert e.type == NoMemoryLeftError
 
 
+class TestInitializeSampleConcurrently:
+    def test_nominal_case(self, sampler):
+        # Arrange
+        sampler.explorer.concurrent_exploration = True
+        sampler.explorer.explore_batch = mock.Mock(
+            side_effect=lambda memories, **kwargs: {memory: [300, 300, 300] for memory in memories}
+        )
+        sampler.update_sample = mock.Mock()
+
+        # Action
+        sampler.initialize_sample()
+
+        # Assert
+        sampler.explorer.explore_batch.assert_called_once()
+        sampler.update_sample.assert_not_called()
+        assert list(np.unique(sampler.sample.memories)) == [128, 1089, 3008]
+
+    def test_function_enomem_fallback(self, sampler):
+        # Arrange
+        def mock_update_sample(memory: int):
+            sampler.sample.update(DataPoint(memory, 300))
+
+        sampler.explorer.concurrent_exploration = True
+        sampler.explorer.explore_batch = mock.Mock(side_effect=FunctionENOMEM)
+        sampler.update_sample = mock_update_sample
+
+        # Action
+        sampler.initialize_sample()
+
+        # Assert
+        assert all(a == b for a, b in zip(sampler.sample.memories, [128, 1089, 3008]))
+
+    def test_dynamic_sampling_targets_memory(self, sampler):
+        sampler.sample = Sample()
+        sampler.explorer.explore_batch = mock.Mock(
+            return_value={512: [10, 230, 1570], 1024: [100, 100, 100]}
+        )
+        sampler.explorer.explore_parallel = mock.Mock(side_effect=lambda nbr_invocations, **kwargs: [110] * nbr_invocations)
+
+        sampler.update_sample_batch([512, 1024])
+
+        assert sampler.explorer.explore_parallel.called
+        assert all(
+            call.kwargs["memory_mb"] == 512
+            for call in sampler.explorer.explore_parallel.call_args_list
+        )
+
+
 class TestUpdateSample:
     def test_nominal_case(self, sampler):
         # Arrange
@@ -81,26 +130,107 @@ class TestUpdateSample:
         assert e.type == ExplorationError
 
 
+class TestSampleStore:
+    @pytest.fixture
+    def sampler(self):
+        sampler = Sampler(MockExplorer(), 3, defaults.DYNAMIC_SAMPLING_PARAMS, mock.Mock())
+        sampler.explorer.config_manager.code_hash = "code"
+        sampler.explorer.invoker.function_name = "function"
+        sampler.sample = Sample()
+        return sampler
+
+    def test_reuse_stored_sample(self, sampler):
+        sampler.sample_store.load.return_value = [DataPoint(128, 300)] * 3
+        sampler.explorer.explore_parallel = mock.Mock()
+
+        sampler.update_sample(128)
+
+        sampler.explorer.explore_parallel.assert_not_called()
+        assert len(sampler.sample) == 3
+
+    def test_store_explored_sample(self, sampler):
+        sampler.sample_store.load.return_value = [DataPoint(128, 300)]
+        sampler.explorer.explore_parallel = mock.Mock(return_value=[300, 200, 400])
+        sampler._explore_dynamically = mock.Mock(return_value=[300, 200, 400])
+
+        sampler.update_sample(128)
+
+        sampler.explorer.explore_parallel.assert_called_once()
+        sampler.sample_store.add.assert_called_once_with(
+            "function", "code", "payload",
+            [DataPoint(128, 300), DataPoint(128, 200), DataPoint(128, 400)],
+        )
+
+
 class TestExploreDynamically:
     def test_nominal_case(self, sampler):
         # Arrange
         sampler.sample = Sample()
-        sampler.explorer.explore = mock.Mock(side_effect=(110, 115, 120))
+        sampler.explorer.explore_parallel = mock.Mock(return_value=[110, 115, 120, 112, 118, 111, 116, 114])
 
         # Action
         durations = sampler._explore_dynamically([10, 230, 1570])
         min_cv = np.std(durations, ddof=1) / np.mean(durations)
 
         # Assert
-        assert sampler.explorer.explore.called
+        # The coefficient of variation is too high to reach the confidence interval within the budget in one batch.
+        sampler.explorer.explore_parallel.assert_called_once_with(nbr_invocations=8, nbr_threads=8, memory_mb=None)
+        assert len(durations) == 3
         assert (
             min_cv
             < sampler._dynamic_sampling_params["coefficient_of_variation_threshold"]
         )
 
+    def test_consistent_durations(self, sampler):
+        sampler.explorer.explore_parallel = mock.Mock()
+
+        durations = sampler._explore_dynamically([100, 101, 102])
+
+        sampler.explorer.explore_parallel.assert_not_called()
+        assert durations == [101, 100, 102]
+
+    def test_batch_size(self, sampler):
+        sampler._dynamic_sampling_params = {**sampler._dynamic_sampling_params, "max_sample_per_config": 100}
+        sampler.explorer.explore_parallel = mock.Mock(side_effect=lambda nbr_invocations, **kwargs: [100] * nbr_invocations)
+
+        sampler._explore_dynamically([100, 108, 92], memory_mb=512)
+
+        # A coefficient of variation of 0.08 needs 16 values to narrow the median's confidence interval down to 5%.
+        sampler.explorer.explore_parallel.assert_called_once_with(nbr_invocations=13, nbr_threads=13, memory_mb=512)
+
     def test_sampling_error(self, sampler):
-        sampler.explorer.explore = mock.Mock(side_effect=ExplorationError("error"))
+        sampler.explorer.explore_parallel = mock.Mock(side_effect=ExplorationError("error"))
 
         with pytest.raises(SamplingError) as e:
             sampler._explore_dynamically([10, 230, 1570])
         assert e.type == ExplorationError
+
+
+class TestUpdateSampleWithoutReconfiguration:
+    def test_configured_memory(self, sampler):
+        sampler.sample = Sample()
+        sampler.explorer.explore_parallel = mock.Mock(return_value=[300, 300, 300])
+
+        sampler.update_sample(512, reconfigure=False)
+
+        sampler.explorer.explore_parallel.assert_called_once_with(
+            nbr_invocations=3, nbr_threads=3, memory_mb=None
+        )
+        assert sampler.sample.memories[0] == 512
+
+
+class TestRunningStatistics:
+    def test_welford(self):
+        values = [10, 230, 1570, 110, 115]
+        statistics = RunningStatistics(values[:2])
+
+        statistics.update(values[2:])
+
+        assert statistics.count == 5
+        assert statistics.mean == pytest.approx(np.mean(values))
+        assert statistics.variance == pytest.approx(np.var(values, ddof=1))
+
+    def test_median_confidence_interval(self):
+        assert median_confidence_interval([3, 1, 2, 5, 4], 0.95) == (-np.inf, np.inf)
+        assert median_confidence_interval(list(range(1, 9)), 0.95) == (1, 8)
+        assert median_confidence_interval(list(range(1, 21)), 0.95) == (6, 15)
@@ -0,0 +1,138 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from src.step_function.critical_path import CriticalPath
+from src.step_function.execution_time_optimizer import ExecutionTimeOptimizer
+from src.step_function.states import Map, Parallel, Task, Workflow
+
+
+def create_task(name: str, function_name: str, memory_size: int = 128) -> Task:
+    task = Task(name=name, function_name=function_name)
+    task.param_function = lambda memory_size: 100 + 100000 / memory_size
+    task.memory_size = memory_size
+    task.initial_memory_size = memory_size
+    task.max_memory_size = 3008
+    return task
+
+
+def create_workflow(function_tasks_dict: dict, nbr_iterations: int) -> Workflow:
+    """Creates a workflow of a task, a Parallel state of two branches and a Map state of @nbr_iterations iterations."""
+
+    def task(name: str, function_name: str) -> Task:
+        task = create_task(name, function_name)
+        function_tasks_dict.setdefault(function_name, []).append(task)
+        return task
+
+    parallel = Parallel(name="Parallel")
+    for i in range(2):
+        branch = Workflow()
+        branch.add_state(task(f"Branch{i}", f"branch_{i}"))
+        parallel.add_branch(branch)
+
+    map_state = Map(name="Map")
+    for i in range(nbr_iterations):
+        iteration = Workflow()
+        iteration.add_state(task(f"Iteration{i}", "iteration"))
+        iteration.add_state(task(f"Store{i}", "store"))
+        map_state.add_iteration(iteration)
+
+    workflow = Workflow()
+    workflow.add_state(task("Start", "start"))
+    workflow.add_state(parallel)
+    workflow.add_state(map_state)
+    return workflow
+
+
+class TestCriticalPath:
+    def test_same_critical_path_and_cost_as_workflow(self):
+        # Arrange
+        workflow = create_workflow({}, nbr_iterations=3)
+
+        # Action
+        critical_path = CriticalPath(workflow)
+
+        # Assert
+        assert critical_path.get_critical_path() == workflow.get_critical_path()
+        assert critical_path.get_cost() == workflow.get_cost()
+
+    def test_updates_match_workflow(self):
+        # Arrange
+        function_tasks_dict = {}
+        workflow = create_workflow(function_tasks_dict, nbr_iterations=5)
+        critical_path = CriticalPath(workflow)
+        rng = np.random.default_rng(0)
+        tasks = [task for function_tasks in function_tasks_dict.values() for task in function_tasks]
+
+        for _ in range(50):
+            # Action
+            changed_tasks = list(rng.choice(tasks, size=rng.integers(1, 4), replace=False))
+            for task in changed_tasks:
+                task.memory_size = int(rng.integers(128, 3009))
+            critical_path.update(changed_tasks)
+
+            # Assert
+            tasks_on_path, time = critical_path.get_critical_path()
+            expected_tasks_on_path, expected_time = workflow.get_critical_path()
+            assert tasks_on_path == expected_tasks_on_path
+            assert time == expected_time
+            assert critical_path.get_cost() == pytest.approx(workflow.get_cost())
+
+    def test_update_only_evaluates_the_changed_tasks(self):
+        # Arrange
+        function_tasks_dict = {}
+        workflow = create_workflow(function_tasks_dict, nbr_iterations=100)
+        critical_path = CriticalPath(workflow)
+        for function_tasks in function_tasks_dict.values():
+            for task in function_tasks:
+                task.param_function = MagicMock(side_effect=task.param_function)
+        changed_task = function_tasks_dict["store"][42]
+        changed_task.memory_size = 2048
+
+        # Action
+        critical_path.update([changed_task])
+
+        # Assert
+        # Its execution time and cost.
+        assert changed_task.param_function.call_count == 2
+        assert sum(
+            task.param_function.call_count
+            for function_tasks in function_tasks_dict.values()
+            for task in function_tasks
+        ) == 2
+        assert critical_path.get_critical_path() == workflow.get_critical_path()
+
+    def test_map_state_keeps_the_first_longest_iteration(self):
+        # Arrange
+        function_tasks_dict = {}
+        workflow = create_workflow(function_tasks_dict, nbr_iterations=3)
+        critical_path = CriticalPath(workflow)
+        first_iteration = function_tasks_dict["iteration"][0]
+        first_iteration.memory_size = 256
+
+        # Action
+        critical_path.update([first_iteration])
+        first_iteration.memory_size = 128
+        critical_path.update([first_iteration])
+
+        # Assert
+        tasks_on_path, _ = critical_path.get_critical_path()
+        assert tasks_on_path[-2:] == function_tasks_dict["iteration"][:1] + function_tasks_dict["store"][:1]
+
+
+class TestExecutionTimeOptimizer:
+    def test_optimize_for_execution_time_constraint(self):
+        # Arrange
+        function_tasks_dict = {}
+        workflow = create_workflow(function_tasks_dict, nbr_iterations=20)
+        _, initial_time = workflow.get_critical_path()
+        config = MagicMock(memory_size_increment=10, constraint_execution_time_threshold=0.8 * initial_time)
+        optimizer = ExecutionTimeOptimizer(workflow, function_tasks_dict, config)
+
+        # Action
+        optimizer.optimize_for_execution_time_constraint()
+
+        # Assert
+        _, time = workflow.get_critical_path()
+        assert time <= 0.8 * initial_time
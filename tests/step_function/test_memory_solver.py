@@ -0,0 +1,186 @@
+import logging
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from src.exception.step_function_error import StepFunctionError
+from src.objective.parametric_function import ParametricFunction
+from src.step_function.execution_time_optimizer import CONVEX, GREEDY, ExecutionTimeOptimizer
+from src.step_function.memory_solver import MemorySolver
+from src.step_function.states import Map, Parallel, Task, Workflow
+
+# Parameters a0, a1 and a2 of each function's execution time a0 + a1 * exp(-m / a2), and its cost-optimal memory size.
+FUNCTION_PARAMS = {
+    "start": ([200, 1700, 220], 128),
+    "branch_0": ([50, 4500, 750], 3008),
+    "branch_1": ([200, 3600, 530], 128),
+    "iteration": ([280, 3800, 200], 751),
+    "store": ([240, 670, 640], 128),
+}
+
+
+def create_workflow(function_tasks_dict: dict, nbr_iterations: int) -> Workflow:
+    """Creates a workflow of a task, a Parallel state of two branches and a Map state of @nbr_iterations iterations,
+    the tasks are at their functions' cost-optimal memory sizes."""
+
+    def task(name: str, function_name: str) -> Task:
+        params, memory_size = FUNCTION_PARAMS[function_name]
+        task = Task(name=name, function_name=function_name)
+        task.param_function = ParametricFunction(params=params)
+        task.memory_size = memory_size
+        task.initial_memory_size = memory_size
+        task.max_memory_size = 3008
+        function_tasks_dict.setdefault(function_name, []).append(task)
+        return task
+
+    parallel = Parallel(name="Parallel")
+    for i in range(2):
+        branch = Workflow()
+        branch.add_state(task(f"Branch{i}", f"branch_{i}"))
+        parallel.add_branch(branch)
+
+    map_state = Map(name="Map")
+    for i in range(nbr_iterations):
+        iteration = Workflow()
+        iteration.add_state(task(f"Iteration{i}", "iteration"))
+        iteration.add_state(task(f"Store{i}", "store"))
+        map_state.add_iteration(iteration)
+
+    workflow = Workflow()
+    workflow.add_state(task("Start", "start"))
+    workflow.add_state(parallel)
+    workflow.add_state(map_state)
+    return workflow
+
+
+def set_memory_sizes(function_tasks_dict: dict, memory_sizes: dict) -> None:
+    for function, memory_size in memory_sizes.items():
+        for task in function_tasks_dict[function]:
+            task.memory_size = memory_size
+
+
+class TestMemorySolver:
+    @pytest.fixture
+    def function_tasks_dict(self) -> dict:
+        return {}
+
+    @pytest.fixture
+    def workflow(self, function_tasks_dict) -> Workflow:
+        return create_workflow(function_tasks_dict, nbr_iterations=5)
+
+    def test_cost_and_critical_path_time_match_workflow(self, workflow, function_tasks_dict):
+        # Arrange
+        solver = MemorySolver(workflow, function_tasks_dict)
+        memory_sizes = {function: 1024 + 100 * i for i, function in enumerate(solver.functions)}
+        set_memory_sizes(function_tasks_dict, memory_sizes)
+        memories = np.array([memory_sizes[function] for function in solver.functions])
+
+        # Action
+        cost = solver.cost(memories)
+        time = solver.critical_path_time(memories)
+
+        # Assert
+        assert cost == pytest.approx(workflow.get_cost())
+        assert time == pytest.approx(workflow.get_critical_path()[1])
+
+    @pytest.mark.parametrize("fraction", [0.2, 0.5, 0.8])
+    def test_solve_meets_threshold_cheaper_than_greedy(self, workflow, function_tasks_dict, fraction):
+        # Arrange
+        _, initial_time = workflow.get_critical_path()
+        solver = MemorySolver(workflow, function_tasks_dict)
+        fastest_time = solver.critical_path_time(np.full(len(solver.functions), 3008))
+        threshold = fastest_time + fraction * (initial_time - fastest_time)
+        config = MagicMock(
+            memory_size_increment=10, constraint_execution_time_threshold=threshold, execution_time_solver=GREEDY
+        )
+        ExecutionTimeOptimizer(workflow, function_tasks_dict, config).optimize_for_execution_time_constraint()
+        greedy_cost = workflow.get_cost()
+
+        # Action
+        memory_sizes = solver.solve(threshold)
+
+        # Assert
+        set_memory_sizes(function_tasks_dict, memory_sizes)
+        assert workflow.get_critical_path()[1] <= threshold
+        assert workflow.get_cost() <= greedy_cost
+        for function, memory_size in memory_sizes.items():
+            assert FUNCTION_PARAMS[function][1] <= memory_size <= 3008
+
+    def test_solve_keeps_initial_memory_sizes_under_threshold(self, workflow, function_tasks_dict):
+        # Arrange
+        _, initial_time = workflow.get_critical_path()
+        solver = MemorySolver(workflow, function_tasks_dict)
+
+        # Action
+        memory_sizes = solver.solve(initial_time)
+
+        # Assert
+        assert memory_sizes == {function: params[1] for function, params in FUNCTION_PARAMS.items()}
+
+    def test_solve_threshold_too_low(self, workflow, function_tasks_dict):
+        # Arrange
+        solver = MemorySolver(workflow, function_tasks_dict)
+
+        # Action & Assert
+        with pytest.raises(StepFunctionError):
+            solver.solve(1)
+
+    def test_trade_off_curve(self, workflow, function_tasks_dict):
+        # Arrange
+        solver = MemorySolver(workflow, function_tasks_dict)
+
+        # Action
+        times, costs, allocations = solver.trade_off_curve(nbr_points=10)
+
+        # Assert
+        assert len(times) == len(costs) == len(allocations) == 10
+        assert np.all(times <= np.linspace(times[0], times[-1], 10) + 1e-6)
+        assert np.all(np.diff(costs) >= 0)
+
+
+class TestExecutionTimeOptimizerConvexSolver:
+    def test_optimize_for_execution_time_constraint(self):
+        # Arrange
+        function_tasks_dict = {}
+        workflow = create_workflow(function_tasks_dict, nbr_iterations=20)
+        _, initial_time = workflow.get_critical_path()
+        config = MagicMock(
+            memory_size_increment=10, constraint_execution_time_threshold=0.5 * initial_time, execution_time_solver=CONVEX
+        )
+        optimizer = ExecutionTimeOptimizer(workflow, function_tasks_dict, config)
+
+        # Action
+        optimizer.optimize_for_execution_time_constraint()
+
+        # Assert
+        _, time = workflow.get_critical_path()
+        assert time <= 0.5 * initial_time
+        for tasks in function_tasks_dict.values():
+            assert len({task.memory_size for task in tasks}) == 1
+
+    def test_trade_off_curve_is_only_computed_at_debug_level(self, caplog):
+        # Arrange
+        def optimize():
+            function_tasks_dict = {}
+            workflow = create_workflow(function_tasks_dict, nbr_iterations=5)
+            _, initial_time = workflow.get_critical_path()
+            config = MagicMock(
+                memory_size_increment=10,
+                constraint_execution_time_threshold=0.8 * initial_time,
+                execution_time_solver=CONVEX,
+            )
+            ExecutionTimeOptimizer(workflow, function_tasks_dict, config).optimize_for_execution_time_constraint()
+
+        # Action
+        with patch.object(MemorySolver, "trade_off_curve", return_value=([1000.0], [5.0], [{}])) as curve:
+            caplog.set_level(logging.INFO, logger="main")
+            optimize()
+            calls_at_info_level = curve.call_count
+            caplog.set_level(logging.DEBUG, logger="main")
+            optimize()
+
+        # Assert
+        assert calls_at_info_level == 0
+        assert curve.call_count == 1
+        assert "trade-off curve" in caplog.text
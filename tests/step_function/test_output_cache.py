@@ -0,0 +1,108 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.step_function.output_cache import OutputCache
+from src.step_function.states import Task
+
+
+@pytest.fixture
+def invoker_class():
+    with patch("src.step_function.output_cache.AWSInvoker") as invoker_class:
+        invoker_class.side_effect = lambda function_name, **kwargs: MagicMock(
+            invoke_for_output=MagicMock(side_effect=lambda input: f"{function_name}({input})")
+        )
+        yield invoker_class
+
+
+class TestOutputCache:
+    def test_get_output_invokes_each_input_once(self, invoker_class):
+        # Arrange
+        output_cache = OutputCache(MagicMock())
+
+        # Action
+        outputs = [output_cache.get_output("function", '{"item": 1}') for _ in range(3)]
+
+        # Assert
+        assert outputs == ['function({"item": 1})'] * 3
+        invoker_class.assert_called_once()
+        assert output_cache._invokers["function"].invoke_for_output.call_count == 1
+
+    def test_get_output_keys_by_function_and_input(self, invoker_class):
+        # Arrange
+        output_cache = OutputCache(MagicMock())
+
+        # Action
+        outputs = [
+            output_cache.get_output("function1", "a"),
+            output_cache.get_output("function1", "b"),
+            output_cache.get_output("function2", "a"),
+            output_cache.get_output("function1", "b"),
+        ]
+
+        # Assert
+        assert outputs == ["function1(a)", "function1(b)", "function2(a)", "function1(b)"]
+        assert invoker_class.call_count == 2
+        assert output_cache._invokers["function1"].invoke_for_output.call_count == 2
+        assert output_cache._invokers["function2"].invoke_for_output.call_count == 1
+
+    def test_get_output_does_not_cache_errors(self, invoker_class):
+        # Arrange
+        output_cache = OutputCache(MagicMock())
+        invoker = MagicMock()
+        invoker.invoke_for_output.side_effect = [RuntimeError("error"), "output"]
+        invoker_class.side_effect = None
+        invoker_class.return_value = invoker
+
+        # Action
+        with pytest.raises(RuntimeError):
+            output_cache.get_output("function", "input")
+        output = output_cache.get_output("function", "input")
+
+        # Assert
+        assert output == "output"
+        assert invoker.invoke_for_output.call_count == 2
+
+    def test_concurrent_requests_wait_for_the_same_invocation(self, invoker_class):
+        # Arrange
+        output_cache = OutputCache(MagicMock())
+        invoking = threading.Event()
+        release = threading.Event()
+        invoker = MagicMock()
+
+        def invoke_for_output(input: str) -> str:
+            invoking.set()
+            release.wait()
+            return "output"
+
+        invoker.invoke_for_output.side_effect = invoke_for_output
+        invoker_class.side_effect = None
+        invoker_class.return_value = invoker
+
+        # Action
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            first = executor.submit(output_cache.get_output, "function", "input")
+            invoking.wait()
+            others = [executor.submit(output_cache.get_output, "function", "input") for _ in range(3)]
+            release.set()
+            outputs = [first.result()] + [future.result() for future in others]
+
+        # Assert
+        assert outputs == ["output"] * 4
+        assert invoker.invoke_for_output.call_count == 1
+
+    def test_tasks_of_a_function_share_its_invoker(self, invoker_class):
+        # Arrange
+        output_cache = OutputCache(MagicMock())
+        tasks = [Task(name=f"Task{i}", function_name="function") for i in range(3)]
+        for i, task in enumerate(tasks):
+            task.set_input(f"input{i}")
+
+        # Action
+        outputs = [task.get_output(output_cache) for task in tasks]
+
+        # Assert
+        assert outputs == ["function(input0)", "function(input1)", "function(input2)"]
+        invoker_class.assert_called_once()
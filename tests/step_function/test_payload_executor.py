@@ -0,0 +1,91 @@
+import threading
+import time
+
+import pytest
+
+from src.step_function.payload_executor import PayloadExecutor
+
+
+class TestPayloadExecutor:
+    def test_map_returns_results_in_order(self):
+        # Arrange
+        executor = PayloadExecutor(max_workers=4)
+
+        def function(item: int) -> int:
+            time.sleep(0.01 * (5 - item))
+            return item * 2
+
+        # Action
+        results = executor.map(function, list(range(5)))
+
+        # Assert
+        assert results == [0, 2, 4, 6, 8]
+
+    def test_map_honors_max_concurrency(self):
+        # Arrange
+        executor = PayloadExecutor(max_workers=8)
+        lock = threading.Lock()
+        in_flight = []
+        max_in_flight = []
+
+        def function(item: int) -> int:
+            with lock:
+                in_flight.append(item)
+                max_in_flight.append(len(in_flight))
+            time.sleep(0.01)
+            with lock:
+                in_flight.remove(item)
+            return item
+
+        # Action
+        results = executor.map(function, list(range(10)), max_concurrency=2)
+
+        # Assert
+        assert results == list(range(10))
+        assert max(max_in_flight) == 2
+
+    def test_nested_maps_share_bounded_threads(self):
+        # Arrange
+        executor = PayloadExecutor(max_workers=2)
+        threads = set()
+        lock = threading.Lock()
+
+        def iteration(item: int) -> int:
+            with lock:
+                threads.add(threading.current_thread())
+            time.sleep(0.001)
+            return item
+
+        def branch(items: list) -> int:
+            return sum(executor.map(iteration, items))
+
+        # Action
+        results = executor.map(branch, [list(range(10)) for _ in range(10)])
+
+        # Assert
+        assert results == [45] * 10
+        # The pool's workers and the calling thread.
+        assert len(threads) <= 3
+
+    def test_map_raises_first_error(self):
+        # Arrange
+        executor = PayloadExecutor(max_workers=2)
+        started = []
+
+        def function(item: int) -> int:
+            started.append(item)
+            if item == 1:
+                raise ValueError("error")
+            return item
+
+        # Action & Assert
+        with pytest.raises(ValueError):
+            executor.map(function, list(range(10)), max_concurrency=1)
+        assert started == [0, 1]
+
+    def test_map_no_items(self):
+        # Arrange
+        executor = PayloadExecutor(max_workers=2)
+
+        # Action & Assert
+        assert executor.map(lambda item: item, []) == []
@@ -1,9 +1,13 @@
 from unittest.mock import MagicMock, Mock, patch
 
+import numpy as np
 import pytest
 
+from src.configuration import Configuration
 from src.exception.step_function_error import StepFunctionError
 from src.exploration.aws.aws_config_manager import AWSConfigManager
+from src.parrotfish import Parrotfish
+from src.step_function.payload_executor import PayloadExecutor
 from src.step_function.states import Task, Parallel, Map, Workflow
 from src.step_function.step_function import StepFunction
 
@@ -66,6 +70,7 @@ class TestStepFunction:
                         }
                     },
                     "ItemsPath": "$.body.data.filenames",
+                    "MaxConcurrency": 5,
                     "Next": "Parallel"
                 },
                 "Parallel": {
@@ -105,7 +110,97 @@ class TestStepFunction:
         assert isinstance(workflow.states[0], Task)
         assert workflow.states[0].function_name == "TaskFunction"
         assert isinstance(workflow.states[1], Map)
+        assert workflow.states[1].max_concurrency == 5
         assert isinstance(workflow.states[2], Parallel)
         assert len(workflow.states[2].branches) == 2
 
 
+
+    @patch.object(AWSConfigManager, '__init__', return_value=None)
+    @patch.object(AWSConfigManager, 'set_config', return_value=None)
+    def test_set_workflow_payloads_map_outputs_in_items_order(self, mock_set_config, mock_init, step_function):
+        # Arrange
+        step_function._create_workflow = StepFunction._create_workflow.__get__(step_function, StepFunction)
+        step_function._set_workflow_payloads = StepFunction._set_workflow_payloads.__get__(step_function, StepFunction)
+        step_function.payload_executor = PayloadExecutor(max_workers=4)
+        step_function.output_cache = Mock()
+        step_function.output_cache.get_output.side_effect = lambda function_name, input: input
+        workflow_def = {
+            "StartAt": "Map",
+            "States": {
+                "Map": {
+                    "Type": "Map",
+                    "Iterator": {
+                        "StartAt": "Double",
+                        "States": {"Double": {"Type": "Task", "Parameters": {"FunctionName": "MapFunction"}, "End": True}},
+                    },
+                    "ItemsPath": "$.items",
+                    "MaxConcurrency": 2,
+                    "End": True,
+                }
+            },
+        }
+        workflow = step_function._create_workflow(workflow_def)
+
+        # Act
+        output = step_function._set_workflow_payloads(workflow, '{"items": [1, 2, 3, 4, 5]}')
+
+        # Assert
+        assert output == "[1, 2, 3, 4, 5]"
+        assert len(workflow.states[0].iterations) == 5
+        assert step_function.output_cache.get_output.call_count == 5
+
+    @patch("src.step_function.step_function.Configuration")
+    @patch("src.step_function.step_function.Parrotfish")
+    def test_optimize_functions_shares_samples_between_tasks(self, parrotfish_class, configuration, step_function):
+        # Arrange
+        step_function._optimize_functions_in_parallel = StepFunction._optimize_functions_in_parallel.__get__(
+            step_function, StepFunction
+        )
+        step_function.config.max_concurrent_functions = 2
+        parrotfish = parrotfish_class.return_value
+        parrotfish.explorer.memory_space = np.array([128, 256, 512])
+        parrotfish.sampler.memory_space = np.array([128, 256, 512])
+        param_functions = [Mock(), Mock()]
+        parrotfish.optimize_payloads_concurrently.return_value = [(256, param_functions[0]), (512, param_functions[1])]
+        tasks = [Task(f"Task{i}", "MapFunction") for i in range(3)]
+        for task, input in zip(tasks, ["a", "b", "a"]):
+            task.set_input(input)
+
+        # Act
+        step_function._optimize_functions_in_parallel({"MapFunction": tasks})
+
+        # Assert
+        parrotfish.optimize_one_payload.assert_not_called()
+        entries, _ = parrotfish.optimize_payloads_concurrently.call_args.args
+        assert entries == [{"payload": "a", "weight": 2 / 3}, {"payload": "b", "weight": 1 / 3}]
+        assert [task.param_function for task in tasks] == [param_functions[0], param_functions[1], param_functions[0]]
+        assert all(task.max_memory_size == 512 for task in tasks)
+
+    @patch("src.step_function.step_function.Configuration")
+    @patch("src.step_function.step_function.Parrotfish")
+    def test_optimize_functions_fits_single_input_tasks(self, parrotfish_class, configuration, step_function):
+        # Arrange
+        step_function._optimize_functions_in_parallel = StepFunction._optimize_functions_in_parallel.__get__(
+            step_function, StepFunction
+        )
+        step_function.config.max_concurrent_functions = 2
+        with patch("src.parrotfish.AWSExplorer") as explorer_class:
+            explorer_class.return_value.memory_space = np.arange(128, 3009)
+            parrotfish = Parrotfish(Configuration(
+                {"function_name": "Function", "vendor": "AWS", "region": "us-east-1", "payload": {}}
+            ))
+        params = np.array([200.0, 1700.0, 220.0])
+        parrotfish.recommender.run = lambda: setattr(parrotfish.param_function, "params", params)
+        parrotfish_class.return_value = parrotfish
+        tasks = [Task(f"Task{i}", "Function") for i in range(2)]
+        for task in tasks:
+            task.set_input("input")
+
+        # Act
+        step_function._optimize_functions_in_parallel({"Function": tasks})
+
+        # Assert
+        for task in tasks:
+            np.testing.assert_array_equal(task.param_function.params, params)
+            assert task.get_execution_time() > 0
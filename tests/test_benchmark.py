@@ -0,0 +1,61 @@
+import json
+
+import numpy as np
+import pytest
+
+from src.benchmark import load_recorded_function, run_benchmark, summarize, synthetic_functions
+
+
+@pytest.mark.parametrize("recommender", ["knowledge", "bayesian"])
+def test_run_benchmark_reports_the_tuning_outcome(recommender):
+    # Arrange
+    functions = synthetic_functions(2, random_seed=0)
+
+    # Action
+    results = run_benchmark(functions, recommender)
+    summary = summarize(results)
+
+    # Assert
+    for result in results:
+        assert result.error is None
+        assert result.sample_count >= 12
+        assert result.exploration_cost > 0
+        assert result.wall_time_ms > 0
+        assert result.regret >= 0
+    assert summary[recommender]["runs"] == 2
+    assert summary[recommender]["failures"] == 0
+
+
+def test_run_benchmark_2d():
+    # Arrange
+    functions = synthetic_functions(1, random_seed=0, cpu_configurable=True)
+
+    # Action
+    results = run_benchmark(functions)
+
+    # Assert
+    assert results[0].recommender == "2d"
+    assert results[0].error is None
+    assert results[0].regret >= 0
+
+
+def test_load_recorded_function(tmp_path):
+    # Arrange
+    path = tmp_path / "durations.json"
+    path.write_text(json.dumps({
+        "function_name": "pyaes",
+        "vendor": "AWS",
+        "memory_used_mb": 129,
+        "durations": [
+            {"cpu": None, "memory_mb": 128, "durations_ms": [20]},
+            {"cpu": None, "memory_mb": 256, "durations_ms": [1000, 1100, 1200]},
+        ],
+    }))
+
+    # Action
+    function = load_recorded_function(str(path))
+
+    # Assert
+    assert function.name == "pyaes"
+    assert not function.cpu_configurable
+    np.testing.assert_array_equal(function.median_durations([128, 256]), [np.inf, 1100])
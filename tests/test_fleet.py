@@ -0,0 +1,80 @@
+from unittest import mock
+
+import pytest
+
+from src.configuration.fleet_configuration import FleetConfiguration
+from src.fleet import Fleet
+
+
+@pytest.fixture
+def manifest():
+    return {
+        "defaults": {"vendor": "AWS", "region": "test-fleet-region", "payload": {"key": "value"}},
+        "max_concurrent_functions": 2,
+        "rate_limits": {"test-fleet-region": {"max_concurrent_invocations": 5}},
+        "functions": [
+            {"function_name": "function_1"},
+            {"function_name": "function_2", "payload": {}},
+            {"function_name": "function_1", "memory_bounds": [128, 1024]},
+        ],
+    }
+
+
+class TestFleetConfiguration:
+    def test_defaults(self, manifest):
+        config = FleetConfiguration(manifest)
+
+        assert len(config.functions) == 3
+        assert config.functions[0].payloads == [{"payload": '{"key": "value"}', "weight": 1}]
+        assert config.functions[1].payloads == [{"payload": "{}", "weight": 1}]
+        assert config.functions[2].memory_bounds == [128, 1024]
+        assert config.max_concurrent_functions == 2
+
+    def test_invalid_function(self, manifest):
+        manifest["functions"].append({"function_name": "function_3", "vendor": "Azure"})
+
+        with pytest.raises(ValueError):
+            FleetConfiguration(manifest)
+
+
+class TestOptimize:
+    def test_nominal_case(self, manifest):
+        # Arrange
+        fleet = Fleet(FleetConfiguration(manifest))
+        optimized = []
+
+        def mock_parrotfish(config):
+            parrotfish = mock.Mock()
+            if config.function_name == "function_2":
+                parrotfish.optimize.side_effect = Exception("error")
+            else:
+                parrotfish.optimize.side_effect = lambda apply: optimized.append(config) or len(optimized)
+            return parrotfish
+
+        # Action
+        with mock.patch("src.fleet.Parrotfish", side_effect=mock_parrotfish):
+            results = fleet.optimize()
+
+        # Assert
+        assert results[1] is None
+        assert str(fleet.errors[1]) == "error"
+        # The entries of the same function are optimized one after the other.
+        assert optimized == [fleet.config.functions[0], fleet.config.functions[2]]
+        assert results[0] == 1 and results[2] == 2
+
+    def test_function_exiting(self, manifest):
+        # Arrange
+        fleet = Fleet(FleetConfiguration(manifest))
+
+        def mock_parrotfish(config):
+            if config.function_name == "function_2":
+                # E.g. the Google Cloud credentials are missing.
+                raise SystemExit(1)
+            return mock.Mock(optimize=mock.Mock(return_value=1))
+
+        # Action
+        with mock.patch("src.fleet.Parrotfish", side_effect=mock_parrotfish):
+            results = fleet.optimize()
+
+        # Assert
+        assert results == [1, None, 1]
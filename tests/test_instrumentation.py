@@ -0,0 +1,143 @@
+import json
+import threading
+
+import numpy as np
+import pytest
+
+from src.instrumentation import Instrumentation
+from src.objective import ParametricFunction
+from src.sampling import Sample
+from src.sampling.data_point import DataPoint
+
+
+@pytest.fixture
+def instrumentation():
+    return Instrumentation()
+
+
+def test_spans_are_aggregated_by_name(instrumentation):
+    # Arrange
+    instrumentation.record_span("invocation", 0, 2_000_000_000)
+    instrumentation.record_span("invocation", 0, 1_000_000_000)
+
+    # Action
+    report = instrumentation.report()
+
+    # Assert
+    assert report["spans"]["invocation"] == {"count": 2, "total_s": 3.0, "mean_s": 1.5, "max_s": 2.0}
+
+
+def test_concurrent_spans_and_counters_are_all_recorded(instrumentation):
+    # Arrange
+    def record():
+        for _ in range(1000):
+            with instrumentation.span("invocation"):
+                pass
+            instrumentation.increment("invocation_retries")
+
+    threads = [threading.Thread(target=record) for _ in range(8)]
+
+    # Action
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Assert
+    report = instrumentation.report()
+    assert report["spans"]["invocation"]["count"] == 8000
+    assert report["counters"]["invocation_retries"] == 8000
+
+
+def test_timed_decorator_records_failing_calls(instrumentation):
+    # Arrange
+    @instrumentation.timed("fitting")
+    def fit():
+        raise RuntimeError("fitting failed")
+
+    # Action
+    with pytest.raises(RuntimeError):
+        fit()
+
+    # Assert
+    assert instrumentation.report()["spans"]["fitting"]["count"] == 1
+
+
+def test_disabled_instrumentation_records_nothing(instrumentation):
+    # Arrange
+    instrumentation.enabled = False
+
+    # Action
+    with instrumentation.span("invocation"):
+        instrumentation.increment("invocation_retries")
+
+    # Assert
+    assert instrumentation.report()["spans"] == {}
+    assert instrumentation.report()["counters"] == {}
+
+
+def test_to_prometheus(instrumentation):
+    # Arrange
+    instrumentation.record_span("config_update.wait", 0, 500_000_000)
+    instrumentation.increment("invocation_retries", 3)
+
+    # Action
+    text = instrumentation.to_prometheus()
+
+    # Assert
+    assert 'parrotfish_span_seconds_total{span="config_update.wait"} 0.5' in text
+    assert 'parrotfish_span_count_total{span="config_update.wait"} 1' in text
+    assert 'parrotfish_events_total{event="invocation_retries"} 3' in text
+    assert "# TYPE parrotfish_span_seconds_total counter" in text
+
+
+@pytest.mark.parametrize("file_name", ["metrics.json", "metrics.prom", "metrics.txt"])
+def test_write_report(instrumentation, tmp_path, file_name):
+    # Arrange
+    instrumentation.record_span("invocation", 0, 1_000_000)
+    path = tmp_path / file_name
+
+    # Action
+    instrumentation.write_report(str(path))
+
+    # Assert
+    content = path.read_text()
+    if file_name.endswith(".json"):
+        assert json.loads(content)["spans"]["invocation"]["count"] == 1
+    else:
+        assert content.startswith("# HELP parrotfish_wall_time_seconds")
+
+
+def test_write_trace(instrumentation, tmp_path):
+    # Arrange
+    path = tmp_path / "trace.json"
+    with instrumentation.span("untraced"):
+        pass
+    instrumentation.start_tracing()
+
+    # Action
+    with instrumentation.span("invocation", memory_mb=128):
+        pass
+    instrumentation.write_trace(str(path))
+
+    # Assert
+    events = json.loads(path.read_text())["traceEvents"]
+    assert len(events) == 1
+    assert events[0]["name"] == "invocation"
+    assert events[0]["ph"] == "X"
+    assert events[0]["args"] == {"memory_mb": "128"}
+
+
+def test_fitting_is_instrumented():
+    # Arrange
+    from src.instrumentation import instrumentation
+
+    instrumentation.reset()
+    memories = np.array([128, 256, 512, 1024, 2048])
+    sample = Sample([DataPoint(memory, 100 + 50000 / memory) for memory in memories])
+
+    # Action
+    ParametricFunction().fit(sample)
+
+    # Assert
+    assert instrumentation.report()["spans"]["fitting"]["count"] == 1
@@ -0,0 +1,66 @@
+import json
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from src.configuration import Configuration
+from src.exception import SamplingError
+from src.parrotfish import Parrotfish
+
+
+@pytest.fixture
+def parrotfish():
+    with mock.patch("src.parrotfish.AWSExplorer") as explorer_class:
+        explorer_class.return_value.memory_space = np.arange(128, 3009)
+        yield Parrotfish(Configuration(
+            {"function_name": "example_function", "vendor": "AWS", "region": "us-east-1", "payload": {}}
+        ))
+
+
+class TestOptimize:
+    @pytest.mark.parametrize("apply", [True, False])
+    def test_published_configs_are_deleted(self, parrotfish, apply):
+        # Arrange
+        parrotfish.optimize_one_payload = mock.Mock(return_value=(256, None))
+
+        # Action
+        minimum_config = parrotfish.optimize(apply)
+
+        # Assert
+        assert minimum_config == 256
+        parrotfish.explorer.config_manager.delete_published_configs.assert_called_once()
+
+    def test_published_configs_are_deleted_on_error(self, parrotfish):
+        # Arrange
+        parrotfish.recommender.run = mock.Mock(side_effect=SamplingError("error"))
+
+        # Action
+        with pytest.raises(SamplingError):
+            parrotfish.optimize(apply=True)
+
+        # Assert
+        parrotfish.explorer.config_manager.delete_published_configs.assert_called_once()
+        parrotfish.explorer.config_manager.set_config.assert_not_called()
+        parrotfish.explorer.invoker.close.assert_called_once()
+
+
+class TestParetoFrontiers:
+    def test_write_pareto_frontiers(self, parrotfish, tmp_path):
+        # Arrange
+        params = [200.0, 1700.0, 220.0]
+        parrotfish.recommender.run = lambda: setattr(parrotfish.param_function, "params", np.array(params))
+        parrotfish.optimize()
+        path = tmp_path / "pareto.json"
+
+        # Action
+        parrotfish.write_pareto_frontiers(str(path))
+
+        # Assert
+        with open(path) as file:
+            frontiers = json.load(file)
+        assert len(frontiers) == 1
+        assert frontiers[0]["params"] == params
+        assert len(frontiers[0]["configurations"]) == len(frontiers[0]["costs"]) > 1
+        assert frontiers[0]["costs"] == sorted(frontiers[0]["costs"])
+        assert frontiers[0]["execution_times"] == sorted(frontiers[0]["execution_times"], reverse=True)